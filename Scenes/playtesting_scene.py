@@ -4,6 +4,8 @@ import game_engine
 import file_operations as file_op
 from constants import *
 import utility_functions as utils
+import observables
+import scheduler
 from Scenes import main_menu_scene, scenes
 import random
 import pygame
@@ -82,12 +84,9 @@ class PlaytestingScene(game_engine.Scene):
                               width=hand_box_width,
                               height=card_height + offset, color=DARK_GREY, name="hand_box")
 
-        hand_border = assets.Border(x=hand_box.x, y=hand_box.y, width=hand_box.width,
-                                    height=hand_box.height,
-                                    parent=hand_box)
+        hand_box.add_border()
 
         self.add_multiple_objects([field_box, hand_box, left_side_box, right_side_box])
-        self.add_object(hand_border)
         board = generate_board(self, self.deck)
 
         draw_button = assets.Button(x=environment.get_width() - button_width - offset,
@@ -97,8 +96,8 @@ class PlaytestingScene(game_engine.Scene):
                                     name="draw_button", left_click_function=board.draw)
 
         deck_text_box = assets.Box(width=100, height=30, text=cards_in_deck_string(self), resize_to_fit_text=True,
-                                   font_size=25, color=LIGHT_GREY,
-                                   update_text_func=cards_in_deck_string)
+                                   font_size=25, color=LIGHT_GREY)
+        deck_text_box.bind_text(board.get_counter(CardLocations.MAIN_DECK), number_of_cards_string)
 
         deck_text_box.set_pos(x=right_side_box.x + (right_side_box.width - deck_text_box.width) / 2,
                               y=draw_button.y - deck_text_box.height - offset)
@@ -216,6 +215,12 @@ class PlaytestingScene(game_engine.Scene):
 
         return self
 
+    def clear(self):
+        """Clears the playtesting scene, extending the base class method. The background preparation of overlay card
+        images is cancelled, since it refers to the board of the scene."""
+        game_engine.cancel_task("prepare_overlay_card_images")
+        super().clear()
+
 
 class Board(assets.GameObject):
     """A class representing a game board.
@@ -241,7 +246,10 @@ class Board(assets.GameObject):
         relative_y (int): The y-coordinate of the board in relation to its parent, if applicable.
         name (str): The name of the board.
         scene: The scene to which the board belongs.
+        counters (dict): Observable values holding the number of cards in each location, keyed by the location name.
     """
+    __slots__ = ("deck", "extra_deck", "hand", "graveyard", "banished", "field", "card_processing_order", "scene",
+                 "display_hand_number", "display_hand_start_index", "counters")
 
     def __init__(self, deck, scene=None):
         """Initializes a Board instance.
@@ -275,10 +283,58 @@ class Board(assets.GameObject):
         self.card_processing_order = []
         self.scene = scene
         card_space = standard_space
-        scene_objects = self.scene.get_objects()
-        hand_box_width = utils.find_object_from_name(scene_objects, "hand_box").width
+        hand_box_width = self.scene.get_object_by_name("hand_box").width
         self.display_hand_number = hand_box_width // (standard_card_width + card_space)
         self.display_hand_start_index = 0
+        self.counters = {location_name: observables.ObservableValue(len(location))
+                         for location_name, location in self.get_locations().items()}
+
+    def get_locations(self):
+        """Gets the card locations of the board.
+
+        Returns:
+            dict: The lists of cards in each location, keyed by the location name.
+        """
+        return {CardLocations.FIELD: self.field, CardLocations.HAND: self.hand,
+                CardLocations.GRAVEYARD: self.graveyard, CardLocations.BANISHED: self.banished,
+                CardLocations.MAIN_DECK: self.deck, CardLocations.EXTRA_DECK: self.extra_deck}
+
+    def get_counter(self, location_name):
+        """Gets the observable number of cards in a location, which notifies its observers when the number changes.
+
+        Args:
+            location_name (str): The name of the location, e.g. CardLocations.MAIN_DECK.
+
+        Returns:
+            observables.ObservableValue: The number of cards in the location.
+        """
+        return self.counters[location_name]
+
+    def update_counters(self):
+        """Updates the number of cards in each location."""
+        for location_name, location in self.get_locations().items():
+            self.counters[location_name].set_value(len(location))
+
+    def update_locations(self):
+        """Updates the counters, the card lists of the board, the layout of the hand and the open card overlays after
+        cards have been moved between locations. Should be called whenever cards are moved between locations."""
+        self.update_counters()
+        self.invalidate_card_lists()
+        self.arrange_hand()
+        self.update_card_overlays()
+
+    def update_card_overlays(self):
+        """Updates the cards of the open card overlays, which display the cards of a location of the board."""
+        for overlay in self.scene.get_objects_by_type(CardOverlay):
+            if not overlay.destroyed:
+                overlay.update_cards()
+
+    def invalidate_card_lists(self):
+        """Marks the processing order and the display list of the board as outdated, so that the cards to be processed
+        and displayed are collected again. Should be called whenever the cards in the hand or on the field, the visible
+        part of the hand, or the order in which the cards are processed changes."""
+        self.invalidate_processing_order()
+        self.invalidate_display_list()
 
     def set_display_hand_start_index(self, new_index):
         """Sets the starting index for displaying the hand.
@@ -287,7 +343,10 @@ class Board(assets.GameObject):
            new_index (int): The new starting index.
        """
         max_display_index = utils.clamp(len(self.hand) - self.display_hand_number, 0, len(self.hand))
-        self.display_hand_start_index = utils.clamp(new_index, 0, max_display_index)
+        new_index = utils.clamp(new_index, 0, max_display_index)
+        if new_index != self.display_hand_start_index:
+            self.display_hand_start_index = new_index
+            self.invalidate_card_lists()
 
     def set_display_hand_start_index_relative(self, index_change):
         """Sets the starting index for displaying the hand relative to the current index.
@@ -328,7 +387,7 @@ class Board(assets.GameObject):
             card_index = self.hand.index(card)
 
         card_width = self.hand[0].width
-        hand_box = utils.find_object_from_name(self.scene.get_objects(), "hand_box")
+        hand_box = self.scene.get_object_by_name("hand_box")
         y_offset = (hand_box.get_rect().height - card.get_rect().height) / 2
         card_space = 10
 
@@ -349,6 +408,7 @@ class Board(assets.GameObject):
     def shuffle_the_deck(self):
         """Shuffles the main deck."""
         random.shuffle(self.deck)
+        self.update_card_overlays()
 
     def draw(self):
         """Draws a card from the main deck and adds it to the hand."""
@@ -371,6 +431,7 @@ class Board(assets.GameObject):
         self.graveyard.insert(0, card)
         previous_location.remove(card)
         card.new_location(location=CardLocations.GRAVEYARD, face_up=True)
+        self.update_locations()
 
     def banish(self, card, previous_location, face_up=True):
         """Banishes a card and removes it from the previous location.
@@ -387,6 +448,7 @@ class Board(assets.GameObject):
         self.banished.insert(0, card)
         previous_location.remove(card)
         card.new_location(location=CardLocations.BANISHED, face_up=face_up)
+        self.update_locations()
 
     def banish_face_down(self, card, previous_location):
         self.banish(card, previous_location, face_up=False)
@@ -403,9 +465,10 @@ class Board(assets.GameObject):
 
         self.stop_processing(card)
         self.deck.insert(0, card)
-        card.moving = False
+        card.set_moving(False)
         previous_location.remove(card)
         card.new_location(location=CardLocations.MAIN_DECK, face_up=False)
+        self.update_locations()
 
     def add_to_the_extra_deck(self, card, previous_location, face_up=False):
         """Adds a card to the extra deck and removes it from the previous location.
@@ -421,9 +484,10 @@ class Board(assets.GameObject):
         self.stop_processing(card)
         self.extra_deck.insert(0, card)
 
-        card.moving = False
+        card.set_moving(False)
         previous_location.remove(card)
         card.new_location(location=CardLocations.EXTRA_DECK, face_up=face_up)
+        self.update_locations()
 
     def add_to_the_extra_deck_face_up(self, card, previous_location):
         self.add_to_the_extra_deck(card, previous_location, face_up=True)
@@ -448,6 +512,7 @@ class Board(assets.GameObject):
 
         previous_location.remove(card)
         card.new_location(location=CardLocations.HAND, visible_after=self.is_card_visible(card), face_up=True)
+        self.update_locations()
 
     def move_to_field(self, card, previous_location):
         """Moves a card to the field and removes it from the previous location.
@@ -471,6 +536,7 @@ class Board(assets.GameObject):
             card.set_pos(x, y)
 
         card.new_location(location=CardLocations.FIELD, visible_after=True, face_up=True)
+        self.update_locations()
 
     def find_index_by_x_value(self, card):
         """Calculates the index a card should have in the hand, based on its x-coordinate.
@@ -500,10 +566,11 @@ class Board(assets.GameObject):
 
         Args:
             card: The card to move."""
-        if card not in self.card_processing_order:
+        if card not in self.card_processing_order or self.card_processing_order[-1] is card:
             return
         self.card_processing_order.remove(card)
         self.card_processing_order.append(card)
+        self.invalidate_card_lists()
 
     def remove_card(self, card):
         """Removes a card from its location and removes it from the list of cards to be processed.
@@ -516,9 +583,11 @@ class Board(assets.GameObject):
             return
         card_location.remove(card)
         self.stop_processing(card)
+        self.update_locations()
 
     def begin_processing(self, card):
-        """Adds the card to a list representing the cards that will be processed this tick.
+        """Adds the card to a list representing the cards that will be processed this tick. The caller is responsible
+        for invalidating the card lists of the board.
 
         Args:
             card (Card): The card to be added to the list.
@@ -527,7 +596,8 @@ class Board(assets.GameObject):
             self.card_processing_order.append(card)
 
     def stop_processing(self, card):
-        """Removes the card from a list representing the cards that will be processed this tick.
+        """Removes the card from a list representing the cards that will be processed this tick. The caller is
+        responsible for invalidating the card lists of the board.
 
         Args:
             card (Card): The card to be removed from the list.
@@ -536,18 +606,27 @@ class Board(assets.GameObject):
             self.card_processing_order.remove(card)
 
     def schedule_processing(self):
-        """Schedules processing for all cards on the field, and the visible cards in the hand."""
-        items_to_be_processed = []
-        for i, card in enumerate(self.hand):
+        """Schedules processing for all cards on the field, and the visible cards in the hand. The scheduled cards are
+        kept between ticks, and are only collected again after the card lists of the board have been invalidated.
+
+        Returns:
+            list: The cards to be processed, followed by the board itself.
+        """
+        if not self.processing_order_outdated:
+            for card in self.card_processing_order:
+                card.schedule_processing()
+            return self.scheduled_processing_order
+
+        visible_hand = self.get_visible_hand()
+        for card in self.hand:
             if card.moving:
                 continue
-            x, y = self.get_card_in_hand_pos(card, i)
-            card.set_pos(x, y)
-            if card in self.get_visible_hand():
+            if card in visible_hand:
                 self.begin_processing(card)
             else:
                 self.stop_processing(card)
 
+        items_to_be_processed = []
         moving_card = None
         for card in self.card_processing_order:
             if card.moving:
@@ -558,24 +637,28 @@ class Board(assets.GameObject):
             items_to_be_processed.extend(moving_card.schedule_processing())
         items_to_be_processed.append(self)
 
+        self.scheduled_processing_order = items_to_be_processed
+        self.processing_order_outdated = False
         return items_to_be_processed
 
     def process(self):
-        """Processes the board, sorting the hand based on the card's x-coordinate."""
+        """Processes the board, sorting the hand based on the card's x-coordinate and laying out the hand."""
         self.sort_visible_hand()
+        self.arrange_hand()
 
     def sort_visible_hand(self):
         """Sorts the visible cards in the hand based on their x-position."""
         start, stop = self.display_hand_start_index, self.display_hand_start_index + self.display_hand_number
-        self.hand[start:stop] = sorted(self.hand[start:stop], key=lambda card: card.x)
-
-    def get_displayable_objects(self):
-        """Gets all displayable objects on the board, namely the cards on the field and
-        the visible cards in the hand."""
-
+        sorted_visible_hand = sorted(self.hand[start:stop], key=lambda card: card.x)
+        if sorted_visible_hand != self.hand[start:stop]:
+            self.hand[start:stop] = sorted_visible_hand
+            self.invalidate_card_lists()
+
+    def arrange_hand(self):
+        """Keeps the visible part of the hand within the hand, and moves the cards in the hand that are not being moved
+        to their positions in the hand."""
         if len(self.get_visible_hand()) < self.display_hand_number:
             self.set_display_hand_start_index_relative(self.display_hand_number - len(self.get_visible_hand()))
-        displayable_objects = []
 
         for i, card in enumerate(self.hand):
             if card.moving:
@@ -583,6 +666,10 @@ class Board(assets.GameObject):
             x, y = self.get_card_in_hand_pos(card, i)
             card.set_pos(x, y)
 
+    def collect_displayable_objects(self):
+        """Collects all displayable objects on the board, namely the cards on the field and the visible cards in the
+        hand. Overrides the base class method."""
+        displayable_objects = []
         visible_hand = self.get_visible_hand()
         moving_card = None
         for card in reversed(visible_hand):
@@ -613,7 +700,7 @@ def generate_board(scene, deck):
     Returns:
         Board: The newly generated game board.
     """
-    existing_board = utils.find_object_from_name(scene.get_objects(), "board")
+    existing_board = scene.get_object_by_name("board")
     if existing_board is not None:
         scene.remove_object(existing_board)
 
@@ -629,7 +716,10 @@ class Card(assets.MobileButton):
         card_type (str): A string representing the type of card (e.g Fusion, Xyz, etc.).
         location (str): A string representing the current location of the card.
         is_face_up (bool): Indicates if the card is face-up or face-down.
+        board (Board): The board the card belongs to.
+        face_down_marker_source_id (int): The id of the source image marking the card as face-down.
     """
+    __slots__ = ("card_type", "board", "location", "is_face_up", "face_down_marker_source_id")
 
     def __init__(self, x=0, y=0, card_id="423585", parent=None, board=None):
         """Initializes a Card instance.
@@ -656,9 +746,6 @@ class Card(assets.MobileButton):
         self.is_face_up = False
 
         self.face_down_marker_source_id = file_op.load_image(image_location + "face_down_marker.png")
-        self.face_down_marker_id = game_engine.get_surface_manager().transform_image(self.face_down_marker_source_id,
-                                                                                     (self.width, self.height),
-                                                                                     self.rotation_angle)
 
     def get_card_type(self):
         """Determine the type of the card based on the color of its card frame.
@@ -737,8 +824,8 @@ class Card(assets.MobileButton):
             self.set_rotation(0)
 
         scene = game_engine.get_scene_manager().get_current_scene()
-        hand_box = utils.find_object_from_name(scene.get_objects(), "hand_box")
-        field_box = utils.find_object_from_name(scene.get_objects(), "field_box")
+        hand_box = scene.get_object_by_name("hand_box")
+        field_box = scene.get_object_by_name("field_box")
         if not self.moving and field_box is not None:
             self.clamp_pos(field_box)
         if self.get_rect().colliderect(hand_box.get_rect()):
@@ -754,7 +841,18 @@ class Card(assets.MobileButton):
         if self.location == CardLocations.EXTRA_DECK and not_extra_deck_pendulum_monster:
             return
 
-        self.is_face_up = not self.is_face_up
+        self.set_face_up(not self.is_face_up)
+
+    def set_face_up(self, face_up):
+        """Sets whether the card is face-up or face-down.
+
+        Args:
+            face_up (bool): True if the card should be face-up, False if it should be face-down.
+        """
+        if face_up == self.is_face_up:
+            return
+        self.is_face_up = face_up
+        self.invalidate_surface()
 
     def card_starting_location(self):
         """Returns the starting location of the card based on its type.
@@ -774,10 +872,10 @@ class Card(assets.MobileButton):
     def update_in_hand(self):
         """Updates the card's state when in the hand."""
         scene = game_engine.get_scene_manager().get_current_scene()
-        board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+        board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
         if board is None or self not in board.get_visible_hand():
             return
-        hand_box = utils.find_object_from_name(scene.get_objects(), "hand_box")
+        hand_box = scene.get_object_by_name("hand_box")
         if hand_box is None:
             return
 
@@ -792,12 +890,12 @@ class Card(assets.MobileButton):
     def update_on_field(self):
         """Updates the card's state when on the field."""
         scene = game_engine.get_scene_manager().get_current_scene()
-        board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+        board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
         if board is None or self not in board.field:
             return
 
-        hand_box = utils.find_object_from_name(scene.get_objects(), "hand_box")
-        field_box = utils.find_object_from_name(scene.get_objects(), "field_box")
+        hand_box = scene.get_object_by_name("hand_box")
+        field_box = scene.get_object_by_name("field_box")
         if hand_box is None or field_box is None:
             return
 
@@ -826,8 +924,8 @@ class Card(assets.MobileButton):
             bool: True if there is a collision, False otherwise.
         """
         scene = game_engine.get_scene_manager().get_current_scene()
-        draw_button = utils.find_object_from_name(scene.get_objects(), "draw_button")
-        extra_deck_button = utils.find_object_from_name(scene.get_objects(), "show_extra_deck_button")
+        draw_button = scene.get_object_by_name("draw_button")
+        extra_deck_button = scene.get_object_by_name("show_extra_deck_button")
         on_the_deck = draw_button.get_rect().colliderect(self.get_rect())
         on_the_extra_deck = extra_deck_button.get_rect().colliderect(self.get_rect())
 
@@ -842,24 +940,28 @@ class Card(assets.MobileButton):
             return True
         return False
 
-    def get_display_surface(self):
-        """Return a tuple containing the surface to be displayed and the object's rect.
+    def update_image(self):
+        """Overrides the base class method. The card art is not transformed into an image of its own, but is fetched
+        from the texture atlas when the card is composed, so that copies of the same card share their image."""
+        self.image_id = None
+
+    def get_image(self):
+        """Gets the card art from the texture atlas, rotated and scaled to the current size of the card.
 
         Returns:
-            tuple (pygame.Surface, pygame.Rect): The surface to be displayed and the object's rect.
+            tuple (pygame.Surface, pygame.Rect or None): The atlas page containing the card art and its area.
         """
-        face_down_marker_image = game_engine.get_surface_manager().fetch_image(self.face_down_marker_id)
-        mismatching_size = face_down_marker_image.get_size() != (round(self.width), round(self.height))
-        if not self.is_face_up and (self.changed_recently or mismatching_size):
-            self.face_down_marker_id = game_engine.get_surface_manager().transform_image(
-                self.face_down_marker_source_id, (self.width, self.height), self.rotation_angle,
-                self.face_down_marker_id)
-        surf, rect = super().get_display_surface()
+        return game_engine.get_surface_manager().fetch_atlas_image(self.source_image_id, (self.width, self.height),
+                                                                   self.rotation_angle)
+
+    def compose_surface(self):
+        """Composes the surface of the card, adding the face-down marker on top of it if the card is face-down."""
+        super().compose_surface()
 
         if not self.is_face_up:
-            face_down_marker_image = game_engine.get_surface_manager().fetch_image(self.face_down_marker_id)
-            surf.blit(face_down_marker_image, (0, 0))
-        return surf, rect
+            face_down_marker, area = game_engine.get_surface_manager().fetch_atlas_image(
+                self.face_down_marker_source_id, (self.width, self.height), self.rotation_angle)
+            game_engine.get_surface_manager().fetch_surface(self.surface_id).blit(face_down_marker, (0, 0), area)
 
     def process(self):
         """Processes the card, updating its state."""
@@ -872,7 +974,7 @@ class Card(assets.MobileButton):
         the top of the board processing order.
         """
         self.remove_card_location_overlay()
-        board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+        board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
         if board is not None:
             board.bump(self)
 
@@ -896,10 +998,7 @@ class Card(assets.MobileButton):
         if not visible_after:
             self.remove_large_card_button()
 
-        if face_up:
-            self.is_face_up = True
-        else:
-            self.is_face_up = False
+        self.set_face_up(face_up)
 
         visible_locations = [CardLocations.HAND, CardLocations.FIELD]
         if self.location in visible_locations and previous_location not in visible_locations:
@@ -915,7 +1014,7 @@ class Card(assets.MobileButton):
     def create_card_location_overlay(self):
         """Creates an overlay for the card. Includes buttons for sending the card to the graveyard, field, deck, hand,
         etc."""
-        card_location_overlay = utils.find_object_from_name(self.children, "card_location_overlay")
+        card_location_overlay = self.get_child_by_name("card_location_overlay")
 
         if card_location_overlay is not None:
             return
@@ -937,15 +1036,15 @@ class Card(assets.MobileButton):
                                  name="card_location_overlay", parent=self, static=False,
                                  external_process_function=utils.destroy_on_external_clicks)
         overlay.external_process_arguments = [overlay, [overlay.get_rect(), self.get_rect()]]
-        overlay_close_button = utils.find_object_from_name(overlay.children, "close_button")
+        overlay_close_button = overlay.get_child_by_name("close_button")
         overlay_close_button.destroy()
         self.add_child(overlay)
-        board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+        board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
         board.bump(self)
         starting_location = self.card_starting_location()
         card_location = board.get_location(self)
 
-        large_card_button = utils.find_object_from_name(self.children, "large_card_button")
+        large_card_button = self.get_child_by_name("large_card_button")
         if large_card_button is None:
             large_card_button = self.create_large_card_button()
 
@@ -1068,18 +1167,18 @@ class Card(assets.MobileButton):
 
     def update_card_location_overlay_anchor(self):
         """Updates the card overlay anchor."""
-        card_location_overlay = utils.find_object_from_name(self.children, "card_location_overlay")
+        card_location_overlay = self.get_child_by_name("card_location_overlay")
         if card_location_overlay is not None:
             card_location_overlay.set_pos_relative_to_parent(self.width, 0)
 
     def create_large_card_button(self):
         """Creates a large card button."""
-        large_card_button = utils.find_object_from_name(self.children, "large_card_button")
+        large_card_button = self.get_child_by_name("large_card_button")
         if large_card_button is not None:
             return
 
         scene = game_engine.get_scene_manager().get_current_scene()
-        left_side_box = utils.find_object_from_name(scene.get_objects(), "left_side_box")
+        left_side_box = scene.get_object_by_name("left_side_box")
         if left_side_box is None:
             return
         large_card_offset = (left_side_box.width - large_card_width) / 2
@@ -1097,7 +1196,7 @@ class Card(assets.MobileButton):
         large_card_button.set_external_process_function(utils.destroy_on_external_clicks)
         large_card_button.static = True
         allowed_rect_list = [self.get_rect(), large_card_button.get_rect()]
-        card_overlay = utils.find_object_from_name(self.children, "card_location_overlay")
+        card_overlay = self.get_child_by_name("card_location_overlay")
         if card_overlay is not None:
             allowed_rect_list.append(card_overlay.get_rect())
         large_card_button.set_external_process_arguments([large_card_button, allowed_rect_list])
@@ -1107,14 +1206,14 @@ class Card(assets.MobileButton):
 
     def remove_card_location_overlay(self):
         """Removes the card location overlay."""
-        card_location_overlay = utils.find_object_from_name(self.children, "card_location_overlay")
+        card_location_overlay = self.get_child_by_name("card_location_overlay")
         if card_location_overlay is None:
             return
         card_location_overlay.destroy()
 
     def remove_large_card_button(self):
         """Removes the large card button."""
-        large_card_button = utils.find_object_from_name(self.children, "large_card_button")
+        large_card_button = self.get_child_by_name("large_card_button")
         if large_card_button is None:
             return
         large_card_button.destroy()
@@ -1132,11 +1231,11 @@ def create_large_card_overlay(card):
         card (Card): The card for which the overlay is created.
     """
     scene = game_engine.get_scene_manager().get_current_scene()
-    large_card_overlay = utils.find_object_from_name(scene.get_objects(), "large_card_overlay")
-    large_card_button = utils.find_object_from_name(card.children, "large_card_button")
+    large_card_overlay = scene.get_object_by_name("large_card_overlay")
+    large_card_button = card.get_child_by_name("large_card_button")
     if large_card_overlay is not None or large_card_button is None:
         return
-    field_box = utils.find_object_from_name(scene.get_objects(), "field_box")
+    field_box = scene.get_object_by_name("field_box")
 
     offset = 15
     overlay_height = field_box.height
@@ -1177,6 +1276,7 @@ class LargeCardOverlay(assets.Overlay):
     Attributes:
         card (assets.Card): The card the button Overlay should display.
     """
+    __slots__ = ("card",)
 
     def __init__(self, x=0, y=0, z=0, width=1540, height=760, alpha=255, name=None, background_color=WHITE,
                  close_button_size=30, close_button_offset=5, parent=None, card=None,
@@ -1212,7 +1312,7 @@ class LargeCardOverlay(assets.Overlay):
         """
         if self.destroyed:
             return
-        large_card_button = utils.find_object_from_name(self.card.children, "large_card_button")
+        large_card_button = self.card.get_child_by_name("large_card_button")
         if large_card_button is not None:
             allowed_rects = large_card_button.get_external_process_arguments()
             allowed_rects[1].remove(self.get_rect())
@@ -1232,6 +1332,8 @@ class CardOverlay(assets.Overlay):
         card_list (list): The list containing the cards to be displayed on the overlay.
         cards (list): The list currently in the overlay.
         """
+    __slots__ = ("card_list_function", "card_box_rect", "cards_per_row", "number_of_rows", "start_index",
+                 "stop_index", "card_list", "cards")
 
     def __init__(self, x=0, y=0, z=2, width=1540, height=760, alpha=255, static=True, name=None, background_color=WHITE,
                  close_button_size=30, close_button_offset=5, parent=None, external_process_function=None,
@@ -1359,13 +1461,34 @@ class CardOverlay(assets.Overlay):
             raise IndexError("Cannot set self.cards[i] to card, to few cards in the list")
 
     def update_card_list(self):
-        """Updates the list of overlay cards."""
+        """Updates the list of overlay cards, invalidating the card lists of the overlay if the cards changed."""
+        if self.cards == self.card_list:
+            return
         del self.cards[len(self.card_list):]
         for i, card in enumerate(self.card_list):
             if card not in self.cards:
                 self.set_overlay_card(self.create_overlay_card(card, i), i)
             else:
                 self.set_overlay_card(card, i)
+        self.invalidate_card_lists()
+
+    def update_cards(self):
+        """Updates the overlay cards after the card list has changed, keeping the displayed cards within the card list
+        and moving the visible cards to their positions."""
+        self.update_card_list()
+
+        if self.stop_index + 1 > len(self.cards) - 1 + self.cards_per_row:
+            desired_stop_index = len(self.cards) - 1
+            self.change_overlay_limits(desired_stop_index - self.stop_index)
+
+        self.update_card_positions()
+
+    def invalidate_card_lists(self):
+        """Marks the processing order and the display list of the overlay as outdated, so that the cards to be
+        processed and displayed are collected again. Should be called whenever the cards of the overlay or the visible
+        part of them changes."""
+        self.invalidate_processing_order()
+        self.invalidate_display_list()
 
     def update_card_positions(self):
         """Updates the positions of overlay cards."""
@@ -1427,53 +1550,48 @@ class CardOverlay(assets.Overlay):
         """
         return self.cards[self.start_index:self.stop_index + 1]
 
+    def get_processed_objects(self):
+        """Gets the objects processed together with the overlay: the box, the buttons and the visible cards.
+
+        Returns:
+            list: The processed objects, in the order they are scheduled.
+        """
+        return [self.get_box()] + self.get_buttons() + self.get_visible_cards()[::-1]
+
     def schedule_processing(self):
-        """Schedules processing of the overlay and its cards.
+        """Schedules processing of the overlay and its cards. The scheduled objects are kept between ticks, and are
+        only collected again after the processing order of the overlay has been invalidated, e.g. when its cards change
+        or it is scrolled.
 
         Returns:
             List: A list of items to be processed.
         """
-        items_to_be_processed = []
-
-        items_to_be_processed.extend(self.get_box().schedule_processing())
-        for button in self.get_buttons():
-            items_to_be_processed.extend(button.schedule_processing())
+        if not self.processing_order_outdated:
+            for obj in self.get_processed_objects():
+                obj.schedule_processing()
+            return self.scheduled_processing_order
 
-        for j, card in enumerate(reversed(self.cards.copy())):
-            i = len(self.cards) - 1 - j
-            if not self.is_card_visible(i=i):
-                continue
-            items_to_be_processed.extend(card.schedule_processing())
+        items_to_be_processed = []
+        for obj in self.get_processed_objects():
+            items_to_be_processed.extend(obj.schedule_processing())
         items_to_be_processed.append(self)
+        self.scheduled_processing_order = items_to_be_processed
+        self.processing_order_outdated = False
         return items_to_be_processed
 
-    def get_displayable_objects(self):
-        """Gets the displayable objects within the overlay and updates the card list and their positions.
+    def collect_displayable_objects(self):
+        """Collects the displayable objects within the overlay, namely its children and the visible cards. Extends the
+        base class method.
 
         Returns:
             List: A list of displayable objects.
         """
-        displayable_objects = []
-
+        displayable_objects = super().collect_displayable_objects()
         if self.destroyed:
             return displayable_objects
 
-        displayable_objects.extend(super().get_displayable_objects())
-
-        self.update_card_list()
-
-        if self.stop_index + 1 > len(self.cards) - 1 + self.cards_per_row:
-            desired_stop_index = len(self.cards) - 1
-            self.change_overlay_limits(desired_stop_index - self.stop_index)
-
-        self.update_card_positions()
-        for j, card in enumerate(reversed(self.cards)):
-            i = len(self.cards) - 1 - j
-            if not self.is_card_visible(i=i):
-                continue
-
+        for card in reversed(self.get_visible_cards()):
             displayable_objects.extend(card.get_displayable_objects())
-
         return displayable_objects
 
     def change_overlay_limits(self, change_in_limits):
@@ -1496,12 +1614,14 @@ class CardOverlay(assets.Overlay):
         else:
             self.start_index += change_in_limits
             self.stop_index += change_in_limits
+        self.update_card_positions()
+        self.invalidate_card_lists()
 
     def destroy(self):
         """Destroys the CardOverlay, and removes the card_location_overlay and large_card_buttons for its cards."""
         super().destroy()
         scene = game_engine.get_scene_manager().get_current_scene()
-        large_card_overlay = utils.find_object_from_name(scene.get_objects(), "large_card_overlay")
+        large_card_overlay = scene.get_object_by_name("large_card_overlay")
 
         for card in self.cards:
             card.remove_card_location_overlay()
@@ -1521,8 +1641,20 @@ def cards_in_deck_string(scene=None):
     """
     if scene is None:
         scene = game_engine.get_scene_manager().get_current_scene()
-    board = utils.find_object_from_name(scene.get_objects(), "board")
-    return f"Cards: {len(board.deck)}"
+    board = scene.get_object_by_name("board")
+    return number_of_cards_string(len(board.deck))
+
+
+def number_of_cards_string(number_of_cards):
+    """Generates a string indicating a number of cards.
+
+    Args:
+        number_of_cards (int): The number of cards.
+
+    Returns:
+        str: A string in the format "Cards: {number_of_cards}".
+    """
+    return f"Cards: {number_of_cards}"
 
 
 def create_deck_overlay():
@@ -1559,7 +1691,7 @@ def cards_in_deck():
     Returns:
         list: A list of the cards in the deck.
     """
-    board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+    board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
     return board.deck
 
 
@@ -1569,7 +1701,7 @@ def cards_in_extra_deck():
     Returns:
         list: A list of the cards in the extra deck.
     """
-    board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+    board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
     return board.extra_deck
 
 
@@ -1579,7 +1711,7 @@ def cards_in_graveyard():
     Returns:
         list: A list of the cards in the graveyard.
     """
-    board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+    board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
     return board.graveyard
 
 
@@ -1589,7 +1721,7 @@ def cards_in_banished():
     Returns:
         list: A list of the cards that are banished.
     """
-    board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+    board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
     return board.banished
 
 
@@ -1599,24 +1731,25 @@ def cards_in_hand():
     Returns:
         list: A list of the cards in the hand .
     """
-    board = utils.find_object_from_name(game_engine.get_scene_manager().get_current_scene().get_objects(), "board")
+    board = game_engine.get_scene_manager().get_current_scene().get_object_by_name("board")
     return board.hand
 
 
 def generate_token():
     """Generates a token card and adds it to the game board."""
     scene = game_engine.get_scene_manager().get_current_scene()
-    board = utils.find_object_from_name(scene.get_objects(), "board")
+    board = scene.get_object_by_name("board")
 
     token = Card(card_id="token", board=board)
     token.static = True
-    token.is_face_up = True
+    token.set_face_up(True)
     x, y = scene.get_default_position()  # TODO: Change this to something else? Perhaps use the board instead. Perhaps
     # use a counter so that all cards don't end up in the same location.
     token.set_pos(x, y)
     token.location = CardLocations.FIELD
     board.field.append(token)
-    board.card_processing_order.append(token)  # TODO: Perhaps add a method in the Board class for the adding of cards.
+    board.begin_processing(token)
+    board.update_locations()
 
 
 def destroy_overlays(overlay_name):
@@ -1629,8 +1762,8 @@ def destroy_overlays(overlay_name):
         bool: Whether an overlay with the query name was found.
     """
     scene = game_engine.get_scene_manager().get_current_scene()
-    same_location_overlay = utils.find_object_from_name(scene.get_objects(), overlay_name)
-    overlays = [obj for obj in scene.get_objects() if isinstance(obj, assets.Overlay) and not obj.destroyed]
+    same_location_overlay = scene.get_object_by_name(overlay_name)
+    overlays = [obj for obj in scene.get_objects_by_type(assets.Overlay) if not obj.destroyed]
     number_of_overlays = len(overlays)
     if number_of_overlays == 0:
         return False
@@ -1655,7 +1788,7 @@ def create_location_overlay(location_name, card_list_function):
     if destroy_overlays(location_name):
         return
 
-    field_box = utils.find_object_from_name(scene.get_objects(), "field_box")
+    field_box = scene.get_object_by_name("field_box")
     x_offset = standard_space
     y_offset = standard_space
     overlay_x = field_box.x + x_offset
@@ -1722,6 +1855,36 @@ def create_location_overlay(location_name, card_list_function):
     overlay.add_multiple_children([scroll_up_button, scroll_down_button])
     scene.add_object(overlay)
 
+    _, _, card_width, card_height = overlay.get_card_info(0)
+    game_engine.schedule_task(prepare_overlay_card_images, [scene.get_object_by_name("board"),
+                                                            (round(card_width), round(card_height))],
+                              phase=scheduler.TaskPhases.BACKGROUND, priority=scheduler.TaskPriorities.LOW,
+                              key="prepare_overlay_card_images")
+
+
+def prepare_overlay_card_images(board, card_size):
+    """Transforms the images of the cards in every location to the size of overlay cards, one image per step, so that
+    opening another overlay or scrolling through one does not transform all newly visible images in a single tick.
+
+    Args:
+        board (Board): The game board.
+        card_size (tuple): The size of the overlay cards, as a tuple (width, height).
+
+    Yields:
+        None: After each transformed image.
+    """
+    if board is None:
+        return
+    prepared_images = set()
+    for card_list in [board.deck, board.extra_deck, board.graveyard, board.banished, board.hand]:
+        for card in list(card_list):
+            for image_id in (card.source_image_id, card.face_down_marker_source_id):
+                if (image_id, card.rotation_angle) in prepared_images:
+                    continue
+                prepared_images.add((image_id, card.rotation_angle))
+                game_engine.get_surface_manager().fetch_atlas_image(image_id, card_size, card.rotation_angle)
+                yield
+
 
 def create_extra_options_overlay():
     """Creates an overlay containing extra buttons for additional functionality."""
@@ -1729,7 +1892,7 @@ def create_extra_options_overlay():
     if destroy_overlays("extra_options_overlay"):
         return
 
-    field_box = utils.find_object_from_name(scene.get_objects(), "field_box")
+    field_box = scene.get_object_by_name("field_box")
     overlay_width = field_box.width
     overlay_height = field_box.height
 
@@ -8,6 +8,9 @@ import game_engine
 import utility_functions as utils
 import time
 import file_operations as file_op
+import primitives
+import object_registry
+import input_events
 
 
 # TODO: Change external_process_function functionality into a GameScript object instead.
@@ -16,10 +19,14 @@ import file_operations as file_op
 
 
 class GameScript:
-    """Represents a game script."""
+    """Represents a game script.
+
+    Attributes:
+        destroyed (bool): Indicates whether the script has been destroyed.
+    """
 
     def __init__(self):
-        pass
+        self.destroyed = False
 
     def process(self):
         pass
@@ -33,6 +40,88 @@ class CenteringOptions:
     BOTTOM = "bottom"
 
 
+class SideAttribute:
+    """An attribute that is stored in a side structure of its object instead of on the object itself. The side structure
+    is only allocated once one of its attributes is changed, so that objects leaving the attributes at their defaults
+    do not pay for them.
+
+    Reading an attribute with an immutable default does not allocate the side structure. Attributes with a mutable
+    default, such as lists, allocate it when they are read, so that the returned value can be modified in place.
+
+    Attributes:
+        side_structure_name (str): The name of the attribute holding the side structure, which is None until the side
+            structure is allocated.
+        side_structure_class (type): The class of the side structure, which sets the defaults of its attributes.
+        default: The default value of the attribute, if it is immutable.
+        mutable_default (bool): Indicates whether the default value of the attribute is mutable.
+        name (str): The name of the attribute, on both the object and the side structure.
+    """
+
+    def __init__(self, side_structure_name, side_structure_class, default=None, mutable_default=False):
+        """Initializes a SideAttribute.
+
+        Args:
+            side_structure_name (str): The name of the attribute holding the side structure.
+            side_structure_class (type): The class of the side structure.
+            default: The default value of the attribute, if it is immutable.
+            mutable_default (bool): Indicates whether the default value of the attribute is mutable.
+        """
+        self.side_structure_name = side_structure_name
+        self.side_structure_class = side_structure_class
+        self.default = default
+        self.mutable_default = mutable_default
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        side_structure = getattr(obj, self.side_structure_name, None)
+        if side_structure is None:
+            if not self.mutable_default:
+                return self.default
+            side_structure = self.allocate(obj)
+        return getattr(side_structure, self.name)
+
+    def __set__(self, obj, value):
+        side_structure = getattr(obj, self.side_structure_name, None)
+        if side_structure is None:
+            if not self.mutable_default and value == self.default:
+                return
+            side_structure = self.allocate(obj)
+        setattr(side_structure, self.name, value)
+
+    def allocate(self, obj):
+        """Allocates the side structure of an object.
+
+        Args:
+            obj: The object.
+
+        Returns:
+            The new side structure.
+        """
+        side_structure = self.side_structure_class()
+        setattr(obj, self.side_structure_name, side_structure)
+        return side_structure
+
+
+class CenteringSettings:
+    """The centering options of a game object, kept apart from the object since most objects use the defaults.
+
+    Attributes:
+        x_centering (str): Indicates how the x-coordinate of the object should be centered when it is resized etc.
+        y_centering (str): Indicates how the y-coordinate of the object should be centered when it is resized etc.
+    """
+    __slots__ = ("x_centering", "y_centering")
+
+    def __init__(self):
+        """Initializes a CenteringSettings with the default centering options."""
+        self.x_centering = CenteringOptions.LEFT
+        self.y_centering = CenteringOptions.TOP
+
+
 class GameObject:
     """A Class for representing a GameObject.
 
@@ -64,7 +153,31 @@ class GameObject:
         relative_y (int): The y-coordinate of the object in relation to its parent, if applicable.
         x_centering (str): Indicates how the x-coordinate of the object should be centered when it is resized etc.
         y_centering (str): Indicates how the y-coordinate of the object should be centered when it is resized etc.
+        centering (CenteringSettings): The side structure holding x_centering and y_centering, or None if the object
+            uses the default centering.
+        dirty (bool): Indicates whether the appearance of the object has changed since it was last displayed.
+        draw_list (list): Drawing primitives drawn on top of the object when it is displayed, e.g. its border.
+        processing_order_outdated (bool): Indicates whether the object or one of its descendants has been added,
+            removed or moved in z since the processing order of the object and its descendants was last computed.
+        scheduled_processing_order (list): The object and its descendants, sorted by z, as last computed.
+        display_list_outdated (bool): Indicates whether the object or one of its descendants has been added, removed,
+            destroyed or changed displayability since the displayable objects of the object were last computed.
+        cached_displayable_objects (list): The displayable objects of the object and its descendants, as last computed.
+        spatial_index (spatial_index.SpatialGrid): The spatial index of the scene the object is displayed in, which is
+            kept up to date whenever the rect of the object changes, or None if the object is not displayed.
+        depth (int): The number of ancestors of the object.
+        root: The topmost ancestor of the object, or the object itself if it has no parent.
+        child_registry (object_registry.ObjectRegistry): An index of the children of the object by name and type, or
+            None if the object has never had any children.
    """
+    __slots__ = ("x", "y", "z", "width", "height", "alpha", "name", "destroyed", "parent", "static", "displayable",
+                 "opaque", "opaque_to_relative", "opaque_to_ancestor", "opaque_to_descendant", "opaque_to_sibling",
+                 "children", "rect", "rotation_angle", "relative_x", "relative_y", "centering", "dirty", "draw_list",
+                 "processing_order_outdated", "scheduled_processing_order", "display_list_outdated",
+                 "cached_displayable_objects", "spatial_index", "depth", "root", "child_registry")
+
+    x_centering = SideAttribute("centering", CenteringSettings, default=CenteringOptions.LEFT)
+    y_centering = SideAttribute("centering", CenteringSettings, default=CenteringOptions.TOP)
 
     def __init__(self, x=0, y=0, z=0, width=0, height=0, alpha=255, parent=None, static=True, opaque=True,
                  opaque_to_ancestor=True, opaque_to_descendant=False, opaque_to_sibling=False,
@@ -121,8 +234,42 @@ class GameObject:
         else:
             self.relative_x, self.relative_y = self.x - self.parent.x, self.y - self.parent.y
 
+        self.centering = None
         self.x_centering = x_centering
         self.y_centering = y_centering
+        self.dirty = True
+        self.draw_list = []
+        self.processing_order_outdated = True
+        self.scheduled_processing_order = []
+        self.display_list_outdated = True
+        self.cached_displayable_objects = []
+        self.spatial_index = None
+        self.depth = 0
+        self.root = self
+        self.child_registry = None
+        self.update_hierarchy()
+
+    def __getstate__(self):
+        """Gets the attributes of the game object to be pickled. Unset attributes are left out.
+
+        Returns:
+            dict: The attributes of the game object.
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """Restores a pickled game object.
+
+        Args:
+            state (dict): The pickled attributes of the game object.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def get_rect(self):
         """Get rect of the object
@@ -132,6 +279,13 @@ class GameObject:
         """
         return self.rect
 
+    def update_rect(self):
+        """Updates the rect of the object to match its position and size, and moves the object in the spatial index
+        it is part of, if any."""
+        self.get_rect().update(self.x, self.y, self.width, self.height)
+        if self.spatial_index is not None:
+            self.spatial_index.update(self)
+
     def set_x(self, x):
         """Sets the x-coordinate of the object and updates its position relative to its parent (if applicable), as well
         as updates the position of its children.
@@ -155,7 +309,7 @@ class GameObject:
     def propagate_new_position(self):
         """Updates the position of the game objects related attributes, as well as its children's positions,
         after either the objects x or y coordinate has changed."""
-        self.get_rect().update(self.x, self.y, self.width, self.height)
+        self.update_rect()
         self.update_relative_position()
         for child in self.children:
             if hasattr(child, "update_position_relative_to_parent"):
@@ -170,9 +324,14 @@ class GameObject:
         """
         delta_z = self.z - z
         self.z = z
+        self.mark_dirty()
         for child in self.children:
             child.shift_z(delta_z)
 
+        if self.parent is not None and hasattr(self.parent, "invalidate_processing_order"):
+            self.parent.invalidate_processing_order()
+        game_engine.invalidate_z_order()
+
     def set_pos(self, x, y):
         """Sets the x and y coordinates of the game object.
 
@@ -272,7 +431,8 @@ class GameObject:
         if width < 0:
             return
         self.width = round(width)
-        self.get_rect().update(self.x, self.y, self.width, self.height)
+        self.update_rect()
+        self.mark_dirty()
 
     def set_height(self, height):
         """Sets the height of the game object.
@@ -283,7 +443,8 @@ class GameObject:
         if height < 0:
             return
         self.height = round(height)
-        self.get_rect().update(self.x, self.y, self.width, self.height)
+        self.update_rect()
+        self.mark_dirty()
 
     def set_size(self, width, height):
         """Sets the width and height of the game object.
@@ -341,6 +502,7 @@ class GameObject:
             self.shift_y(self.width - self.height)
 
         self.rotation_angle = angle
+        self.mark_dirty()
 
     def rotate(self, angle):
         """Rotate the game object by a given angle.
@@ -357,15 +519,69 @@ class GameObject:
              alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
          """
         self.alpha = alpha
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Marks the object as dirty, so that the area it occupies is redrawn the next time the scene is displayed."""
+        self.dirty = True
+
+    def is_dirty(self):
+        """Checks whether the appearance of the object has changed since it was last displayed.
+
+        Returns:
+            bool: True if the object needs to be redrawn, False otherwise.
+        """
+        return self.dirty
+
+    def clear_dirty(self):
+        """Marks the object as up-to-date, after it has been displayed."""
+        self.dirty = False
+
+    def is_active(self):
+        """Checks whether the object is changing on its own, e.g. by moving or being animated, in which case the
+        game loop should keep running at full rate. Implemented by child classes.
+
+        Returns:
+            bool: True if the object is active, False otherwise.
+        """
+        return False
+
+    def get_draw_list(self):
+        """Gets the drawing primitives to be drawn on top of the object when it is displayed.
+
+        Returns:
+            list: List of primitives.Primitive objects.
+        """
+        return self.draw_list
+
+    def add_primitive(self, primitive):
+        """Adds a drawing primitive to the draw list of the object.
+
+        Args:
+            primitive (primitives.Primitive): The primitive to add.
+        """
+        self.draw_list.append(primitive)
+        self.mark_dirty()
 
     def destroy(self):
-        """Destroy the game object, hiding it in the current scene and notifying its parent if applicable."""
+        """Destroy the game object, hiding it in the current scene and notifying its parent if applicable. The object
+        is left as a tombstone in the current scene, which removes it and releases its resources at the end of the
+        tick."""
         if self.destroyed:
             return
         self.destroyed = True
+        self.invalidate_display_list()
+        game_engine.add_tombstone(self)
         if self.parent is not None and hasattr(self.parent, "destroy_child"):
             self.parent.destroy_child(self)
 
+    def release_resources(self):
+        """Releases the resources held by the game object and its descendants, once the object has been destroyed and
+        removed from the scene. Additional functionality to be implemented in child classes."""
+        for child in self.children:
+            if hasattr(child, "release_resources"):
+                child.release_resources()
+
     def add_child(self, child):
         """Adds a child game object to this game object's children, and notifies the child object of its new parent.
 
@@ -373,7 +589,12 @@ class GameObject:
             child (GameObject): The new child game object.
         """
         self.children.append(child)
+        if self.child_registry is None:
+            self.child_registry = object_registry.ObjectRegistry()
+        self.child_registry.add(child)
         child.set_parent(self)
+        self.invalidate_processing_order()
+        self.invalidate_display_list()
 
     def set_parent(self, parent):
         """Sets the parent of the game object and updates relative position attributes if applicable.
@@ -382,10 +603,24 @@ class GameObject:
             parent: The game object's new parent
         """
         self.parent = parent
+        self.update_hierarchy()
         if not self.static and self.parent is not None:
             self.set_relative_x(self.x - self.parent.x)
             self.set_relative_y(self.y - self.parent.y)
 
+    def update_hierarchy(self):
+        """Updates the depth and root of the game object and its descendants after the object has changed parent."""
+        if self.parent is None:
+            self.depth = 0
+            self.root = self
+        else:
+            self.depth = getattr(self.parent, "depth", 0) + 1
+            self.root = getattr(self.parent, "root", self.parent)
+
+        for child in self.children:
+            if hasattr(child, "update_hierarchy"):
+                child.update_hierarchy()
+
     def add_multiple_children(self, children):
         """Adds multiple child game objects to this game object's children.
 
@@ -403,26 +638,101 @@ class GameObject:
         """
         if child in self.children:
             self.children.remove(child)
+            self.child_registry.remove(child)
+            self.invalidate_processing_order()
+            self.invalidate_display_list()
 
     def clear_children(self):
         """Removes all child game objects."""
         self.children = []
+        self.child_registry = None
+        self.invalidate_processing_order()
+        self.invalidate_display_list()
+
+    def get_child_by_name(self, name):
+        """Gets the child with a specific name.
+
+        Args:
+            name (str): The name of the child.
+
+        Returns:
+            GameObject or None: The first child with the name, or None if there is no such child.
+        """
+        if self.child_registry is None:
+            return None
+        children = self.child_registry.get_by_name(name)
+        if not children:
+            return None
+        return children[0]
+
+    def get_children_by_type(self, match_type):
+        """Gets the children of a specific type, including children of its subclasses.
+
+        Args:
+            match_type (type): The type of the children.
+
+        Returns:
+            list: The children of the type, in the order of the children.
+        """
+        if self.child_registry is None:
+            return []
+        return self.child_registry.get_by_type(match_type)
+
+    def set_displayable(self, displayable):
+        """Sets whether the game object is visible.
+
+        Args:
+            displayable (bool): Indicates whether the object is visible.
+        """
+        if displayable == self.displayable:
+            return
+        self.displayable = displayable
+        self.invalidate_display_list()
+
+    def invalidate_display_list(self):
+        """Marks the displayable objects of the game object and its ancestors as outdated, so that they are collected
+        again the next time they are requested. Should be called whenever a descendant is added, removed, destroyed or
+        changes displayability. The display order of the current scene is invalidated as well, if the object has no
+        parent."""
+        self.display_list_outdated = True
+        if self.parent is None:
+            game_engine.invalidate_display_order()
+        elif hasattr(self.parent, "invalidate_display_list"):
+            self.parent.invalidate_display_list()
+
+    def invalidate_processing_order(self):
+        """Marks the processing order of the game object and its ancestors as outdated, so that it is sorted again
+        the next time it is scheduled. Should be called whenever a descendant is added, removed or moved in z. The
+        processing order of the current scene is invalidated as well, if the object has no parent."""
+        self.processing_order_outdated = True
+        if self.parent is None:
+            game_engine.invalidate_processing_order()
+        elif hasattr(self.parent, "invalidate_processing_order"):
+            self.parent.invalidate_processing_order()
 
     def schedule_processing(self):
         """Schedules the game object and its children for processing in the game loop.
-        The children are processed before the parent.
+        The children are processed before the parent. The sorted processing order is kept between ticks, and is only
+        sorted again after the object or one of its descendants has been added, removed or moved in z.
 
         Returns:
             list: List of game objects to be processed in the game loop.
         """
+        if not self.processing_order_outdated:
+            for child in self.children:
+                child.update_position()
+                child.schedule_processing()
+            return self.scheduled_processing_order
+
         items_to_be_processed = []
         for child in self.children:
-            if hasattr(child, "update_position"):
-                child.update_position()
+            child.update_position()
             items_to_be_processed.extend(child.schedule_processing())
 
         items_to_be_processed.append(self)
         items_to_be_processed.sort(key=lambda x: x.z)
+        self.scheduled_processing_order = items_to_be_processed
+        self.processing_order_outdated = False
         return items_to_be_processed
 
     def process(self):
@@ -436,6 +746,23 @@ class GameObject:
 
     def get_displayable_objects(self):
         """Gets a list of displayable game objects corresponding to the game object itself or its children.
+        The list is kept between ticks, and is only collected again after the object or one of its descendants has been
+        added, removed, destroyed or changed displayability. The returned list should not be modified.
+
+        Returns:
+            list: List of displayable game objects.
+        """
+        if not self.display_list_outdated:
+            return self.cached_displayable_objects
+
+        self.cached_displayable_objects = self.collect_displayable_objects()
+        self.display_list_outdated = False
+        return self.cached_displayable_objects
+
+    def collect_displayable_objects(self):
+        """Collects the displayable game objects corresponding to the game object itself or its children. Child classes
+        that display other objects than their children should override this method, and invalidate their display list
+        whenever those objects change.
 
         Returns:
             list: List of displayable game objects.
@@ -448,9 +775,7 @@ class GameObject:
             displayable_objects.append(self)
 
         for child in self.children:
-            if hasattr(child, "get_displayable_objects"):
-                displayable_objects.extend(child.get_displayable_objects())
-
+            displayable_objects.extend(child.get_displayable_objects())
         return displayable_objects
 
 
@@ -466,8 +791,16 @@ class Box(GameObject):
         font_size (int): The font size of the text.
         text_surface_id (int): The id corresponding to the font surface of the box.
         update_text_func (callable): The function responsible for updating the box text.
+        text_binding (observables.ObservableValue or None): The observable value the box text is bound to, if any.
+        text_binding_func (callable or None): The function converting the bound value into the box text.
         surface_id (int): The id corresponding to the surface of the box.
+        surface_outdated (bool): Indicates if the composed surface of the box (image or color, and text) has to be
+            rebuilt before the box is displayed again.
+        border (primitives.RectOutline): The border of the box, if it has one.
     """
+    __slots__ = ("color", "image_id", "source_image_id", "text", "text_offset", "text_color", "font_size",
+                 "text_centering", "text_surface_id", "border", "update_text_func", "text_binding", "text_binding_func",
+                 "surface_id", "surface_outdated", "changed_recently")
 
     def __init__(self, x=0, y=0, z=0, width=100, height=100, color=WHITE, alpha=255, source_image_id=None, text="",
                  text_offset=standard_text_offset, text_color=BLACK, font_size=40, resize_to_fit_text=False,
@@ -505,6 +838,7 @@ class Box(GameObject):
                          opaque=opaque, x_centering=x_centering, y_centering=y_centering,
                          displayable=True, name=name)
 
+        self.surface_outdated = True
         self.color = color
         self.image_id = None
         self.source_image_id = source_image_id
@@ -516,6 +850,7 @@ class Box(GameObject):
         self.text_centering = text_centering
 
         self.text_surface_id = None
+        self.border = None
         if resize_to_fit_text and self.text != "":
             self.resize_to_fit_text()
 
@@ -523,6 +858,8 @@ class Box(GameObject):
             self.set_text(self.text)
 
         self.update_text_func = update_text_func
+        self.text_binding = None
+        self.text_binding_func = None
 
         if include_border:
             self.add_border()
@@ -533,28 +870,22 @@ class Box(GameObject):
         self.changed_recently = False
 
     def set_width(self, width):
-        """Sets the width of the Box and updates the Box's image and surface,
-        as well as its border if applicable.
+        """Sets the width of the Box and updates the Box's image and surface.
 
         Args:
             width (float): The new width of the Box.
         """
         super().set_width(width)
         self.changed_recently = True
-        if self.get_border() is not None:
-            self.get_border().set_width(width)
 
     def set_height(self, height):
-        """Sets the height of the Box and updates the Box's image and surface,
-        as well as its border if applicable..
+        """Sets the height of the Box and updates the Box's image and surface.
 
         Args:
             height (float): The new height of the Box.
         """
         super().set_height(height)
         self.changed_recently = True
-        if self.get_border() is not None:
-            self.get_border().set_height(height)
 
     def set_rotation(self, angle):
         """Sets the rotation angle of the Box and updates the Box's image and surface.
@@ -573,6 +904,7 @@ class Box(GameObject):
          """
         self.source_image_id = new_source_image_id
         self.update_image()
+        self.invalidate_surface()
 
     def set_text(self, new_text):
         """Sets the text of the Box and updates the font surface id.
@@ -580,8 +912,52 @@ class Box(GameObject):
         Args:
             new_text (str): The new text for the Box.
         """
+        old_text = self.text
         self.text = new_text
         self.update_text_surface()
+        if self.text != old_text:
+            self.invalidate_surface()
+
+    def process(self):
+        """Processes the Box, extending the base class method to poll its update_text_func, if it has one."""
+        super().process()
+        self.update_text()
+
+    def update_text(self):
+        """Updates the text of the Box using its update_text_func, if it has one."""
+        if self.update_text_func is not None:
+            self.set_text(self.update_text_func())
+
+    def bind_text(self, observable_value, text_func=str):
+        """Binds the text of the Box to an observable value, so that the text is only updated when the value changes.
+        Unlike an update_text_func, the bound value is not polled every tick.
+
+        Args:
+            observable_value (observables.ObservableValue): The value to bind the text to.
+            text_func (callable): The function converting the value into the box text. Should be a module level
+                function, so that the box can be saved.
+        """
+        self.unbind_text()
+        self.text_binding = observable_value
+        self.text_binding_func = text_func
+        observable_value.add_observer(self.on_bound_value_changed)
+        self.on_bound_value_changed(observable_value.get_value())
+
+    def unbind_text(self):
+        """Removes the binding between the text of the Box and an observable value, if there is one."""
+        if self.text_binding is None:
+            return
+        self.text_binding.remove_observer(self.on_bound_value_changed)
+        self.text_binding = None
+        self.text_binding_func = None
+
+    def on_bound_value_changed(self, value):
+        """Updates the text of the Box when the value its text is bound to changes.
+
+        Args:
+            value: The new value.
+        """
+        self.set_text(self.text_binding_func(value))
 
     def update_text_surface(self):
         """Updates the text surface of the box and truncates its text to fit the box."""
@@ -592,13 +968,8 @@ class Box(GameObject):
 
     def truncate_text(self):
         """Truncates the text of the box in order to fit the box."""
-        font = game_engine.get_surface_manager().get_font(self.font_size)
-        while len(self.text) > 0:
-            occupied_width = pygame.font.Font.size(font, self.text)[0]
-            allowed_width = self.width - 2 * self.text_offset
-            if occupied_width <= allowed_width:
-                break
-            self.text = self.text[:-1]
+        allowed_width = self.width - 2 * self.text_offset
+        self.text = game_engine.get_surface_manager().truncate_text(self.text, self.font_size, allowed_width)
 
     def set_color(self, color):
         """Sets the color of the Box.
@@ -607,6 +978,7 @@ class Box(GameObject):
             color (tuple): The new color for the Box.
         """
         self.color = color
+        self.invalidate_surface()
 
     def set_alpha(self, alpha):
         """Sets the alpha value of the Box, and sets the alpha of the Box's surface to the same value.
@@ -616,19 +988,45 @@ class Box(GameObject):
         """
         self.alpha = alpha
         game_engine.get_surface_manager().fetch_surface(self.surface_id).set_alpha(self.alpha)
+        self.mark_dirty()
+
+    def invalidate_surface(self):
+        """Marks the composed surface of the Box as outdated, so that it is rebuilt the next time it is displayed."""
+        self.surface_outdated = True
+        self.mark_dirty()
+
+    def destroy(self):
+        """Destroys the Box, extending the base class method to remove the binding of its text, if it has one."""
+        self.unbind_text()
+        super().destroy()
+
+    def release_resources(self):
+        """Releases the surfaces of the Box, extending the base class method."""
+        surface_manager = game_engine.get_surface_manager()
+        for surface_id in (self.surface_id, self.text_surface_id, self.image_id):
+            if surface_id in surface_manager.surface_objects:
+                surface_manager.remove_surface(surface_id)
+        super().release_resources()
 
     def get_border(self):
-        """Gets the border object associated with the button.
+        """Gets the border associated with the box.
 
         Returns:
-            Border: The border object of the button.
+            primitives.RectOutline or None: The border of the box, or None if it has no border.
         """
-        return utils.find_object_from_name(self.children, "button_border")
+        return self.border
 
-    def add_border(self):
-        border = Border(x=self.x, y=self.y, z=self.z, width=self.width, height=self.height, parent=self,
-                        name="button_border")
-        self.add_child(border)
+    def add_border(self, color=BLACK, thickness=2):
+        """Adds a border along the edges of the box, drawn as a primitive on top of the box.
+
+        Args:
+            color (tuple): The color of the border.
+            thickness (int): The thickness of the border.
+        """
+        if self.border is not None:
+            return
+        self.border = primitives.RectOutline(color=color, thickness=thickness)
+        self.add_primitive(self.border)
 
     def resize_to_fit_text(self, offset=None):
         """Adjusts the size of the Box to fit the text with an additional offset.
@@ -638,8 +1036,7 @@ class Box(GameObject):
         """
         if offset is None:
             offset = self.text_offset
-        font = game_engine.get_surface_manager().get_font(self.font_size)
-        required_width, required_height = pygame.font.Font.size(font, self.text)
+        required_width, required_height = game_engine.get_surface_manager().get_text_size(self.text, self.font_size)
         required_width += 2 * self.text_offset
         required_height += 2 * self.text_offset
         if required_width > self.width:
@@ -677,6 +1074,7 @@ class Box(GameObject):
         game_engine.get_surface_manager().transform_surface(self.surface_id, (self.width, self.height),
                                                             self.rotation_angle, self.surface_id)
         self.changed_recently = False
+        self.invalidate_surface()
 
     def update_image(self):
         """Updates the image for the box, first by rotating the source image, and then scaling it."""
@@ -684,8 +1082,20 @@ class Box(GameObject):
                                                                           (self.width, self.height),
                                                                           self.rotation_angle, self.image_id)
 
+    def get_image(self):
+        """Gets the rotated and scaled image of the box.
+
+        Returns:
+            tuple (pygame.Surface, pygame.Rect or None) or None: The surface containing the image and the area of
+                the surface occupied by the image (None if it is the whole surface), or None if the box has no image.
+        """
+        if self.image_id is None:
+            return None
+        return game_engine.get_surface_manager().fetch_image(self.image_id), None
+
     def get_display_surface(self):
-        """Return a tuple containing the surface to be displayed and the object's rect.
+        """Return a tuple containing the surface to be displayed and the object's rect. The surface is only composed
+        again if it has been invalidated since it was last displayed.
 
         Returns:
             tuple (pygame.Surface, pygame.Rect): The surface to be displayed and the object's rect.
@@ -693,16 +1103,21 @@ class Box(GameObject):
         if self.changed_recently:
             self.update_surfaces()
 
-        if self.image_id is not None:
+        if self.surface_outdated:
+            self.compose_surface()
+
+        return game_engine.get_surface_manager().fetch_surface(self.surface_id), self.get_rect()
+
+    def compose_surface(self):
+        """Composes the surface of the box, by drawing its image or color and then its text."""
+        image = self.get_image()
+        if image is not None:
             game_engine.get_surface_manager().reset_surface(self.surface_id)
-            image = game_engine.get_surface_manager().fetch_image(self.image_id)
-            game_engine.get_surface_manager().fetch_surface(self.surface_id).blit(image, (0, 0))
+            image_surface, area = image
+            game_engine.get_surface_manager().fetch_surface(self.surface_id).blit(image_surface, (0, 0), area)
         else:
             game_engine.get_surface_manager().fetch_surface(self.surface_id).fill(self.color)
 
-        if self.update_text_func is not None:
-            self.set_text(self.update_text_func())
-
         if self.text != "":
             font_surface = game_engine.get_surface_manager().fetch_font_surface(self.text_surface_id)
 
@@ -720,112 +1135,16 @@ class Box(GameObject):
 
             game_engine.get_surface_manager().fetch_surface(self.surface_id).blit(font_surface, surface_blit_point)
 
-        return game_engine.get_surface_manager().fetch_surface(self.surface_id), self.get_rect()
-
-
-class Border(GameObject):
-    """A class for displaying a rectangular border.
+        self.surface_outdated = False
 
-    Attributes:
-        thickness (int): The thickness of the border.
-    """
-
-    def __init__(self, x=0, y=0, z=1, width=100, height=100, color=BLACK, thickness=2, alpha=255, parent=None,
-                 name=None):
-        """Initialize a Border object.
-
-        Args:
-            x (float): The x-coordinate of the Border.
-            y (float): The y-coordinate of the Border.
-            z (float): The z-coordinate of the Border.
-            width (float): The width of the Border.
-            height (float): The height of the Border.
-            color (tuple): The color of the Border (default is BLACK).
-            thickness (int): The thickness of the Border.
-            alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
-            parent: The parent object to which this object is attached.
-            name (str): The name of the Border.
-        """
-        super().__init__(x=x, y=y, z=z, width=width, height=height, alpha=alpha, parent=parent, static=False,
-                         opaque=False, name=name)
-
-        self.color = color
-        self.thickness = thickness
-        top_box = Box(x=self.x, y=self.y, z=z, width=self.width, height=self.thickness, color=self.color,
-                      alpha=self.alpha,
-                      parent=self, static=False, opaque=False, include_border=False, name="border_top_box")
-
-        bottom_box = Box(x=self.x, y=self.y + self.height - self.thickness, z=z, width=self.width,
-                         height=self.thickness, color=self.color, alpha=self.alpha, parent=self, static=False,
-                         opaque=False, include_border=False, name="border_bottom_box")
-
-        left_box = Box(x=self.x, y=self.y + self.thickness, width=self.thickness, z=z,
-                       height=self.height - 2 * self.thickness, color=self.color, alpha=self.alpha, parent=self,
-                       static=False, opaque=False, include_border=False, name="border_left_box")
-
-        right_box = Box(x=self.x + self.width - self.thickness, y=self.y + self.thickness, z=z, width=self.thickness,
-                        height=self.height - 2 * self.thickness, color=self.color, alpha=self.alpha, parent=self,
-                        static=False, opaque=False, include_border=False, name="border_right_box")
-
-        side_boxes = [top_box, bottom_box, left_box, right_box]
-
-        for box in side_boxes:
-            self.add_child(box)
-
-    def set_width(self, width):
-        """Sets the width of the Border and updates the side boxes to match.
+    def __setstate__(self, state):
+        """Restores a pickled Box. Surfaces are not saved, so the composed surface has to be rebuilt.
 
         Args:
-            width (float): The new width of the Border.
+            state (dict): The pickled attributes of the Box.
         """
-        width_difference = width - self.width
-        side_boxes = self.get_side_boxes()
-        side_boxes[3].shift_x(width_difference)
-        side_boxes[0].adjust_width(width_difference)
-        side_boxes[1].adjust_width(width_difference)
-
-        super().set_width(width)
-
-    def set_height(self, height):
-        """Sets the height of the Border and updates the side boxes to match.
-
-        Args:
-            height (float): The new height of the Border.
-        """
-        height_difference = height - self.height
-        side_boxes = self.get_side_boxes()
-        side_boxes[1].shift_y(height_difference)
-        side_boxes[2].adjust_height(height_difference)
-        side_boxes[3].adjust_height(height_difference)
-
-        super().set_height(height)
-
-    def set_color(self, color):
-        """Sets the color of the Border.
-
-        Args:
-            color (tuple): The new color for the Border.
-        """
-        self.color = color
-
-    def set_alpha(self, alpha):
-        """Sets the alpha value of the Border.
-
-        Args:
-            alpha (int): The new alpha value.
-        """
-        self.alpha = alpha
-        for box in self.get_side_boxes():
-            box.set_alpha(self.alpha)
-
-    def get_side_boxes(self):
-        """Gets a list of side boxes that make up the Border.
-
-        Returns:
-            list: List of side boxes.
-        """
-        side_boxes = [x for x in self.children if isinstance(x, Box)]
-        return side_boxes
+        super().__setstate__(state)
+        self.surface_outdated = True
 
 
 class ButtonState:
@@ -844,7 +1163,13 @@ class ClickDetector:
         right_clicked (bool):
         right_clicked_long (bool):
         require_continuous_hovering (bool):
+        left_click_positions (list): The positions of the left clicks inside the rect this tick, in screen-space
+            coordinates and in the order they happened.
+        right_click_positions (list): The positions of the right clicks inside the rect this tick, in screen-space
+            coordinates and in the order they happened.
     """
+    __slots__ = ("rect", "left_clicked", "left_clicked_long", "right_clicked", "right_clicked_long",
+                 "require_continuous_hovering", "left_click_positions", "right_click_positions")
 
     def __init__(self, rect):
         """Initialize the ClickDetector with the specified rectangle.
@@ -862,27 +1187,32 @@ class ClickDetector:
 
         self.require_continuous_hovering = True
 
-    def _left_clicked(self):
-        """Detects new left clicks.
+        self.left_click_positions = []
+        self.right_click_positions = []
+
+    def _find_clicks(self, button):
+        """Finds the presses of a mouse button inside the rect during the current tick, using the positions the presses
+        happened at, so that presses that were released again before the tick are not lost.
+
+        Args:
+            button (int): The mouse button.
 
         Returns:
-            bool: True if the related rectangle is left-clicked, False otherwise.
+            list: The positions of the presses inside the rect, in screen-space coordinates.
         """
-        left_mouse_down = environment.get_left_mouse_click_this_tick()
-        mouse_over_rect = self.rect.collidepoint(environment.get_mouse_position())
-        if left_mouse_down and mouse_over_rect and not environment.get_left_mouse_click_last_tick():
-            return True
-
-        return False
+        return [event.position for event in environment.input_bus.get_presses(button)
+                if self.rect.collidepoint(event.position)]
 
-    def _left_clicked_long(self):
+    def _left_clicked_long(self, mouse_over_rect):
         """Detects long left clicks, that is if the mouse button continually being pressed.
 
+        Args:
+            mouse_over_rect (bool): Whether the mouse is over the related rectangle.
+
         Returns:
             bool: True if the related rectangle is long left-clicked, False otherwise.
         """
         left_mouse_down = environment.get_left_mouse_click_this_tick()
-        mouse_over_rect = self.rect.collidepoint(environment.get_mouse_position())
         excuse_non_hovering = not self.require_continuous_hovering and (self.left_clicked or self.left_clicked_long)
 
         if left_mouse_down and (mouse_over_rect or excuse_non_hovering):
@@ -890,27 +1220,16 @@ class ClickDetector:
 
         return False
 
-    def _right_clicked(self):
-        """Detects new right clicks.
-
-        Returns:
-            bool: True if the related rectangle is right-clicked, False otherwise.
-        """
-        right_mouse_down = environment.get_right_mouse_click_this_tick()
-        mouse_over_rect = self.rect.collidepoint(environment.get_mouse_position())
-        if right_mouse_down and mouse_over_rect and not environment.get_right_mouse_click_last_tick():
-            return True
-
-        return False
-
-    def _right_clicked_long(self):
+    def _right_clicked_long(self, mouse_over_rect):
         """Detects long right clicks, that is if the mouse button continually being pressed.
 
+        Args:
+            mouse_over_rect (bool): Whether the mouse is over the related rectangle.
+
         Returns:
             bool: True if the related rectangle is long right-clicked, False otherwise.
         """
         right_mouse_down = environment.get_right_mouse_click_this_tick()
-        mouse_over_rect = self.rect.collidepoint(environment.get_mouse_position())
         excuse_non_hovering = not self.require_continuous_hovering and (self.right_clicked or self.right_clicked_long)
 
         if right_mouse_down and (mouse_over_rect or excuse_non_hovering):
@@ -918,13 +1237,83 @@ class ClickDetector:
 
         return False
 
-    def update(self):
-        """Updates the click detector's attributes based on the current mouse click events."""
-        self.left_clicked = self._left_clicked()
-        self.left_clicked_long = self._left_clicked_long()
+    def update(self, mouse_position=None):
+        """Updates the click detector's attributes based on the mouse events of the current tick.
 
-        self.right_clicked_long = self._right_clicked_long()
-        self.right_clicked = self._right_clicked()
+        Args:
+            mouse_position (tuple): The mouse position in screen-space coordinates. Read from the environment if not
+                given.
+        """
+        if mouse_position is None:
+            mouse_position = environment.get_mouse_position()
+        mouse_over_rect = self.rect.collidepoint(mouse_position)
+
+        if environment.input_bus.presses:
+            self.left_click_positions = self._find_clicks(input_events.MouseButtons.LEFT)
+            self.right_click_positions = self._find_clicks(input_events.MouseButtons.RIGHT)
+        elif self.left_click_positions or self.right_click_positions:
+            self.left_click_positions = []
+            self.right_click_positions = []
+
+        self.left_clicked = bool(self.left_click_positions)
+        self.left_clicked_long = self._left_clicked_long(mouse_over_rect)
+
+        self.right_clicked_long = self._right_clicked_long(mouse_over_rect)
+        self.right_clicked = bool(self.right_click_positions)
+
+
+class ClickCallbacks:
+    """The functions called when a button is clicked, held or has one of its keys pressed, kept apart from the button
+    until one of them is set.
+
+    Attributes:
+        left_click_function (callable): The function to be called when the button is left-clicked.
+        left_click_args (iterable): The arguments to be passed to the left click function.
+        left_hold_function (callable): The function to be called when the button is left-held.
+        left_hold_args (iterable): The arguments to be passed to the left hold function.
+        right_click_function (callable): The function to be called when the button is right-clicked.
+        right_click_args (iterable): The arguments to be passed to the right click function.
+        right_hold_function (callable): The function to be called when the button is right-held.
+        right_hold_args (iterable): The arguments to be passed to the right hold function.
+        left_trigger_keys (list): List of keys triggering left-click events.
+        right_trigger_keys (list): List of keys triggering right-click events.
+        key_functions (dict): Dictionary mapping keys to functions and their arguments.
+    """
+    __slots__ = ("left_click_function", "left_click_args", "left_hold_function", "left_hold_args",
+                 "right_click_function", "right_click_args", "right_hold_function", "right_hold_args",
+                 "left_trigger_keys", "right_trigger_keys", "key_functions")
+
+    def __init__(self):
+        """Initializes a ClickCallbacks without any functions."""
+        self.left_click_function = None
+        self.left_click_args = {}
+        self.left_hold_function = None
+        self.left_hold_args = {}
+        self.right_click_function = None
+        self.right_click_args = {}
+        self.right_hold_function = None
+        self.right_hold_args = {}
+        self.left_trigger_keys = []
+        self.right_trigger_keys = []
+        self.key_functions = {}
+
+
+NO_CLICK_CALLBACKS = ClickCallbacks()
+
+
+class ProcessHook:
+    """An external function called every time an object is processed, kept apart from the object until it is set.
+
+    Attributes:
+        external_process_function (callable): External function to be called during the processing of the object.
+        external_process_arguments: Arguments for the external process function.
+    """
+    __slots__ = ("external_process_function", "external_process_arguments")
+
+    def __init__(self):
+        """Initializes a ProcessHook without a function."""
+        self.external_process_function = None
+        self.external_process_arguments = []
 
 
 class Button(Box):
@@ -947,7 +1336,27 @@ class Button(Box):
         external_process_function (callable): External function to be called during the button's processing
             (default is None).
         external_process_arguments: Arguments for the external process function (default is None).
+        callbacks (ClickCallbacks): The side structure holding the click, hold and key functions of the button, or
+            None if none of them have been set.
+        process_hook (ProcessHook): The side structure holding the external process function of the button, or None
+            if it has not been set.
     """
+    __slots__ = ("callbacks", "process_hook", "status", "click_detector", "indicator_color", "indicate_hover",
+                 "indicate_clicks", "indicator_alpha")
+
+    left_click_function = SideAttribute("callbacks", ClickCallbacks)
+    left_click_args = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    left_hold_function = SideAttribute("callbacks", ClickCallbacks)
+    left_hold_args = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    right_click_function = SideAttribute("callbacks", ClickCallbacks)
+    right_click_args = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    right_hold_function = SideAttribute("callbacks", ClickCallbacks)
+    right_hold_args = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    left_trigger_keys = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    right_trigger_keys = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    key_functions = SideAttribute("callbacks", ClickCallbacks, mutable_default=True)
+    external_process_function = SideAttribute("process_hook", ProcessHook)
+    external_process_arguments = SideAttribute("process_hook", ProcessHook, mutable_default=True)
 
     # TODO: Change left_click_args etc. to args and kwargs.
     def __init__(self, x=0, y=0, z=1, width=200, height=120, color=GREY, indicator_color=WHITE, indicate_hover=True,
@@ -1001,45 +1410,31 @@ class Button(Box):
                 (default is None).
             external_process_arguments: Arguments for the external process function (default is None).
         """
+        self.callbacks = None
+        self.process_hook = None
 
-        if external_process_arguments is None:
-            self.external_process_arguments = []
-        else:
+        if external_process_arguments is not None:
             self.external_process_arguments = external_process_arguments
 
-        if left_trigger_keys is None:
-            self.left_trigger_keys = []
-        else:
+        if left_trigger_keys is not None:
             self.left_trigger_keys = left_trigger_keys
 
-        if right_trigger_keys is None:
-            self.right_trigger_keys = []
-        else:
+        if right_trigger_keys is not None:
             self.right_trigger_keys = right_trigger_keys
 
-        if left_click_args is None:
-            self.left_click_args = {}
-        else:
+        if left_click_args is not None:
             self.left_click_args = left_click_args
 
-        if left_hold_args is None:
-            self.left_hold_args = {}
-        else:
+        if left_hold_args is not None:
             self.left_hold_args = left_hold_args
 
-        if right_click_args is None:
-            self.right_click_args = {}
-        else:
+        if right_click_args is not None:
             self.right_click_args = right_click_args
 
-        if right_hold_args is None:
-            self.right_hold_args = {}
-        else:
+        if right_hold_args is not None:
             self.right_hold_args = right_hold_args
 
-        if key_functions is None:
-            self.key_functions = {}
-        else:
+        if key_functions is not None:
             self.key_functions = key_functions
         super().__init__(x=x, y=y, z=z, width=width, height=height, color=color, alpha=alpha,
                          source_image_id=source_image_id, text=text, text_offset=text_offset, font_size=font_size,
@@ -1169,66 +1564,77 @@ class Button(Box):
 
     def check_button_presses(self):
         """Check for button presses/key presses and executes corresponding functions. Can execute any combination of
-        different click events in the same tick."""
-        mouse_position = environment.get_mouse_position()
-        mouse_over_rect = self.get_rect().collidepoint(mouse_position)
-
-        if not self.click_blocked(mouse_position):
-            left_click_keys = utils.common_elements(environment.get_new_key_presses(), self.left_trigger_keys)
-            button_left_clicked = self.click_detector.left_clicked or left_click_keys
+        different click events in the same tick, and executes the click functions once for every click during the
+        tick. Which objects block the mouse is resolved by the pointer dispatcher of the current scene, at the
+        position each click happened at. Buttons without any callbacks read the shared defaults, instead of
+        allocating their own."""
+        callbacks = self.callbacks if self.callbacks is not None else NO_CLICK_CALLBACKS
+        pointer_dispatcher = game_engine.get_pointer_dispatcher()
+        mouse_over_rect = self.get_rect().collidepoint(pointer_dispatcher.get_mouse_position())
+
+        left_clicks, right_clicks = 0, 0
+        if self.click_detector.left_clicked:
+            left_clicks = self.count_unblocked_clicks(self.click_detector.left_click_positions)
+        if self.click_detector.right_clicked:
+            right_clicks = self.count_unblocked_clicks(self.click_detector.right_click_positions)
+
+        if not pointer_dispatcher.is_blocked(self):
+            if utils.common_elements(environment.get_new_key_presses(), callbacks.left_trigger_keys):
+                left_clicks += 1
             button_left_held = self.click_detector.left_clicked_long
 
-            right_click_keys = utils.common_elements(environment.get_new_key_presses(), self.right_trigger_keys)
-            button_right_clicked = self.click_detector.right_clicked or right_click_keys
+            if utils.common_elements(environment.get_new_key_presses(), callbacks.right_trigger_keys):
+                right_clicks += 1
             button_right_held = self.click_detector.right_clicked_long
 
             hovering = mouse_over_rect
 
         else:
-            button_left_clicked = False
             button_left_held = False
-            button_right_clicked = False
             button_right_held = False
             hovering = False
 
         self.status = ButtonState.HOVER
 
         key_functions, key_args = [], []
-        for key in self.key_functions:
+        for key in callbacks.key_functions:
             if key in environment.get_new_key_presses():
-                function = self.key_functions[key][0]
-                args = self.key_functions[key][1]
+                function = callbacks.key_functions[key][0]
+                args = callbacks.key_functions[key][1]
                 key_functions.append(function)
                 key_args.append(args)
 
-        if button_left_clicked and self.left_click_function is not None:
+        for _ in range(left_clicks):
+            if callbacks.left_click_function is None:
+                break
             self.status = ButtonState.PRESSED
-            if isinstance(self.left_click_args, dict):
-                self.left_click_function(**self.left_click_args)
+            if isinstance(callbacks.left_click_args, dict):
+                callbacks.left_click_function(**callbacks.left_click_args)
             else:
-                self.left_click_function(*self.left_click_args)
+                callbacks.left_click_function(*callbacks.left_click_args)
 
-        if button_left_held and self.left_hold_function is not None:
+        if button_left_held and callbacks.left_hold_function is not None:
             self.status = ButtonState.PRESSED
-            if isinstance(self.left_hold_args, dict):
-                self.left_hold_function(**self.left_hold_args)
+            if isinstance(callbacks.left_hold_args, dict):
+                callbacks.left_hold_function(**callbacks.left_hold_args)
             else:
-                self.left_hold_function(*self.left_hold_args)
+                callbacks.left_hold_function(*callbacks.left_hold_args)
 
-        if button_right_clicked and self.right_click_function is not None:
+        for _ in range(right_clicks):
+            if callbacks.right_click_function is None:
+                break
             self.status = ButtonState.PRESSED
-
-            if isinstance(self.right_click_args, dict):
-                self.right_click_function(**self.right_click_args)
+            if isinstance(callbacks.right_click_args, dict):
+                callbacks.right_click_function(**callbacks.right_click_args)
             else:
-                self.right_click_function(*self.right_click_args)
+                callbacks.right_click_function(*callbacks.right_click_args)
 
-        if button_right_held and self.right_hold_function is not None:
+        if button_right_held and callbacks.right_hold_function is not None:
             self.status = ButtonState.PRESSED
-            if isinstance(self.right_hold_args, dict):
-                self.right_hold_function(**self.right_hold_args)
+            if isinstance(callbacks.right_hold_args, dict):
+                callbacks.right_hold_function(**callbacks.right_hold_args)
             else:
-                self.right_hold_function(*self.right_hold_args)
+                callbacks.right_hold_function(*callbacks.right_hold_args)
 
         if len(key_functions) != 0:
             for function, args in zip(key_functions, key_args):
@@ -1240,6 +1646,18 @@ class Button(Box):
         if not hovering:
             self.status = ButtonState.NORMAL
 
+    def count_unblocked_clicks(self, click_positions):
+        """Counts the clicks on the button that were not blocked by other objects at the positions they happened at.
+
+        Args:
+            click_positions (list): The positions of the clicks inside the button, in screen-space coordinates.
+
+        Returns:
+            int: The number of unblocked clicks.
+        """
+        pointer_dispatcher = game_engine.get_pointer_dispatcher()
+        return sum(1 for position in click_positions if not pointer_dispatcher.is_blocked(self, position))
+
     def process(self):
         """Process the button, updating its click_detector checking for click-events and updating its color."""
         if self.external_process_function is not None:
@@ -1247,38 +1665,52 @@ class Button(Box):
 
         super().process()
 
-        self.click_detector.update()
+        self.click_detector.update(game_engine.get_pointer_dispatcher().get_mouse_position())
 
         self.check_button_presses()
 
+        self.update_indicator()
+
+    def get_indicator_alpha(self):
+        """Gets the alpha-value the indicator surface should have, based on the status of the button.
+
+        Returns:
+            int: The alpha-value of the indicator surface.
+        """
         if self.status == ButtonState.PRESSED and self.indicate_clicks:
-            self.indicator_alpha = 100
+            return 100
         elif self.status == ButtonState.PRESSED:
             if self.indicate_hover:
-                self.indicator_alpha = 80
+                return 80
+            return self.indicator_alpha
         elif self.status == ButtonState.HOVER and self.indicate_hover:
-            self.indicator_alpha = 80
+            return 80
+        return 0
 
-        else:
-            self.indicator_alpha = 0
-
-    def get_display_surface(self):
-        """Return a tuple containing the surface to be displayed and the object's rect.
+    def set_indicator_alpha(self, alpha):
+        """Sets the alpha-value of the indicator surface, marking the button as dirty if it changed.
 
-        Returns:
-            tuple (pygame.Surface, pygame.Rect): The surface to be displayed and the object's rect.
+        Args:
+            alpha (int): The new alpha-value of the indicator surface.
         """
-        surf, rect = super().get_display_surface()
+        if alpha == self.indicator_alpha:
+            return
+        self.indicator_alpha = alpha
+        self.invalidate_surface()
 
-        if self.indicator_alpha != 0:
-            temporary_surface_id = game_engine.get_surface_manager().create_temporary_surface(self.width,
-                                                                                              self.height,
-                                                                                              self.indicator_alpha)
-            indicator_surface = game_engine.get_surface_manager().fetch_surface(temporary_surface_id)
-            indicator_surface.fill(self.indicator_color)
-            surf.blit(indicator_surface, (0, 0))
+    def update_indicator(self):
+        """Updates the indicator surface alpha-value based on the status of the button."""
+        self.set_indicator_alpha(self.get_indicator_alpha())
 
-        return surf, rect
+    def compose_surface(self):
+        """Composes the surface of the button, adding the indicator surface on top of it if applicable."""
+        super().compose_surface()
+
+        if self.indicator_alpha != 0:
+            indicator_surface = game_engine.get_surface_manager().fetch_overlay_surface((self.width, self.height),
+                                                                                        self.indicator_color,
+                                                                                        self.indicator_alpha)
+            game_engine.get_surface_manager().fetch_surface(self.surface_id).blit(indicator_surface, (0, 0))
 
 
 class MobileButton(Button):
@@ -1289,6 +1721,7 @@ class MobileButton(Button):
         click_x (int): The x-coordinate of the mouse click in the button's coordinate system.
         click_y (int): The y-coordinate of the mouse click in the button's coordinate system.
     """
+    __slots__ = ("moving", "click_x", "click_y")
 
     def __init__(self, x=0, y=0, z=1, width=200, height=120, color=(100, 100, 100), indicator_color=WHITE,
                  indicate_hover=True,
@@ -1380,7 +1813,7 @@ class MobileButton(Button):
         """Updates the mobile buttons position."""
 
         if not self.click_detector.left_clicked_long:
-            self.moving = False
+            self.set_moving(False)
             self.click_x, self.click_y = None, None
         else:
             self.move()
@@ -1393,11 +1826,33 @@ class MobileButton(Button):
         mouse_position = environment.get_mouse_position()
         self.set_pos(mouse_position[0] - self.click_x, mouse_position[1] - self.click_y)
 
+    def is_active(self):
+        """Checks whether the mobile button is active, which it is while it is moving.
+
+        Returns:
+            bool: True if the mobile button is moving, False otherwise.
+        """
+        return self.moving
+
     def start_movement(self):
         """Starts the movement of the mobile button."""
-        self.moving = True
+        self.set_moving(True)
         self.update_click_position()
 
+    def set_moving(self, moving):
+        """Sets whether the mobile button is moving. Since the parent of a moving object may process and display it
+        differently, e.g. last, the processing order and the display list of the button and its ancestors are
+        invalidated when it starts or stops moving.
+
+        Args:
+            moving (bool): Indicates whether the button is moving.
+        """
+        if moving == self.moving:
+            return
+        self.moving = moving
+        self.invalidate_processing_order()
+        self.invalidate_display_list()
+
     def update_click_position(self):
         """Updates the click position of the MobileButton."""
         mouse_position = environment.get_mouse_position()
@@ -1421,7 +1876,11 @@ class InputField(Button):
         fixed_text (str): The part of the InputField text that cannot be changed by input.
         text_buffer (str): The part of the InputField text that can be changed by input.
         allowed_input_type (str): A string containing all allowed characters.
+        backspace_counter (int): Counts down how long backspace has to be held before it erases another character.
+        backspace_timer (float): The time when backspace was last handled.
     """
+    __slots__ = ("is_selected", "fixed_text", "text_buffer", "allowed_input_type", "backspace_counter",
+                 "backspace_timer")
 
     def __init__(self, x=0, y=0, z=1, width=200, height=120, color=GREY, indicate_hover=False, indicate_clicks=True,
                  alpha=255, text="", font_size=20, text_color=BLACK, initial_text_buffer="",
@@ -1473,11 +1932,11 @@ class InputField(Button):
         game_engine.start_text_input()
 
     def write(self):
-        """Writes text to the InputDetectors parents text_buffer."""
-        if environment.input_event is None:
+        """Writes the text typed since the last tick to the InputDetectors parents text_buffer."""
+        text = environment.input_bus.consume_text()
+        if not text:
             return
-        self.append_text(environment.input_event)
-        environment.input_event = None
+        self.append_text(text)
 
     def append_text(self, text):
         """Appends text to the text_buffer.
@@ -1509,20 +1968,22 @@ class InputField(Button):
         self.text_buffer = self.text_buffer[:allowed_text_buffer_length]
 
     def check_for_input(self):
+        """Writes the typed text, and erases text for every backspace press since the last tick, in the order the
+        key events happened. Backspace presses that were released again before the tick still erase a character."""
         self.write()
 
-        keys_pressed = environment.get_pressed_keys_this_tick()
-
         new_backspace_press = False
-        for event in game_engine.environment.events:
-            if event.type == pygame.KEYUP and pygame.key.name(event.key) == Keys.BACKSPACE:
+        for event in environment.input_bus.get_events():
+            if event.key != Keys.BACKSPACE:
+                continue
+            if event.event_type == input_events.InputEventTypes.KEY_UP:
                 self.backspace_counter = 0
-            if event.type == pygame.KEYDOWN and pygame.key.name(event.key) == Keys.BACKSPACE:
+            elif event.event_type == input_events.InputEventTypes.KEY_DOWN:
                 new_backspace_press = True
+                self.backspace(new_press=True)
 
-        if Keys.BACKSPACE in keys_pressed:
-            self.backspace(new_press=new_backspace_press)
-            return
+        if Keys.BACKSPACE in environment.get_pressed_keys_this_tick() and not new_backspace_press:
+            self.backspace()
 
     def backspace(self, new_press=False):
         """Handels the backspace key event."""
@@ -1551,15 +2012,17 @@ class InputField(Button):
         if self.is_selected:
             self.update_text_from_buffer()
 
-    def get_display_surface(self):
-        """Return a tuple containing the surface to be displayed and the object's rect.
+        self.update_indicator()
+
+    def get_indicator_alpha(self):
+        """Gets the alpha-value the indicator surface should have. A selected InputField is always indicated.
 
         Returns:
-            tuple: The surface to be displayed and the object's rect.
+            int: The alpha-value of the indicator surface.
         """
         if self.is_selected:
-            self.indicator_alpha = 10
-        return super().get_display_surface()
+            return 10
+        return super().get_indicator_alpha()
 
 
 class Keys:
@@ -1575,7 +2038,18 @@ class Overlay(GameObject):
 
     Attributes:
         Inherits all attributes from the GameObject class.
+        external_process_function (callable): External function to be called during the overlay's processing.
+        external_process_arguments: Arguments for the external process function.
+        process_hook (ProcessHook): The side structure holding the external process function of the overlay, or None
+            if it has not been set.
+        close_button_size (float): Size of the close button on the overlay, if it has one.
+        close_button_offset (float): Offset of the close button from the top-right corner of the overlay, if it has
+            one.
     """
+    __slots__ = ("process_hook", "close_button_size", "close_button_offset")
+
+    external_process_function = SideAttribute("process_hook", ProcessHook)
+    external_process_arguments = SideAttribute("process_hook", ProcessHook, mutable_default=True)
 
     def __init__(self, x=0, y=0, z=2, width=1540, height=760, alpha=255, static=True, name=None, background_color=WHITE,
                  close_button_size=30, close_button_offset=5, include_border=True, include_close_button=True,
@@ -1603,9 +2077,8 @@ class Overlay(GameObject):
 
         super().__init__(x=x, y=y, z=z, width=width, height=height, parent=parent, static=static,
                          alpha=alpha, opaque=False, name=name)
-        if external_process_arguments is None:
-            self.external_process_arguments = []
-        else:
+        self.process_hook = None
+        if external_process_arguments is not None:
             self.external_process_arguments = external_process_arguments
         self.external_process_function = external_process_function
 
@@ -1641,7 +2114,7 @@ class Overlay(GameObject):
         Returns:
             Box: The box object of the overlay.
         """
-        return utils.find_object_from_name(self.children, "overlay_box")
+        return self.get_child_by_name("overlay_box")
 
     def get_buttons(self):
         """Gets a list of button objects present in the overlay.
@@ -1649,7 +2122,7 @@ class Overlay(GameObject):
         Returns:
             list: List of Button objects in the overlay.
         """
-        return utils.find_objects_from_type(self.children, Button)
+        return self.get_children_by_type(Button)
 
     def set_background_color(self, color):
         """Sets the background color of the overlay.
@@ -1681,6 +2154,7 @@ class ConfirmationOverlay(Overlay):
     Attributes:
         Inherits all attributes from the Overlay class.
     """
+    __slots__ = ()
 
     def __init__(self, x=0, y=0, yes_button_function=None, args=None):
         """
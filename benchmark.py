@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Measures how many ticks per second the game engine manages with different numbers of displayable objects.
+
+Runs headless by default. Set PLAYTEST_HEADLESS=0 to use a real display instead.
+
+Usage:
+    python benchmark.py [--objects 10 100 1000] [--ticks 300] [--dirty]
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("PLAYTEST_HEADLESS", "1")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+import pygame
+import game_engine
+from game_engine import environment
+import assets
+from constants import *
+
+
+class BenchmarkScene(game_engine.Scene):
+    """A scene filled with boxes, used for benchmarking.
+
+    Attributes:
+        number_of_objects (int): The number of boxes in the scene.
+        moving_box (assets.Box): A box that is moved every tick, so that something changes on the screen.
+    """
+
+    def __init__(self, number_of_objects, dirty_rect_rendering=False):
+        """Initializes a BenchmarkScene.
+
+        Args:
+            number_of_objects (int): The number of boxes in the scene.
+            dirty_rect_rendering (bool): Whether only the changed areas of the screen are redrawn each tick.
+        """
+        super().__init__(name=f"benchmark_{number_of_objects}")
+        self.number_of_objects = number_of_objects
+        self.dirty_rect_rendering = dirty_rect_rendering
+        self.moving_box = None
+
+    def create_scene(self):
+        """Creates the boxes of the scene. Every tenth box has a border and every fifth box has text."""
+        random_generator = random.Random(0)
+        colors = [WHITE, LIGHT_GREY, DARK_GREY, SADDLE_BROWN, SIENNA]
+        for i in range(self.number_of_objects):
+            text = str(i) if i % 5 == 0 else ""
+            box = assets.Box(x=random_generator.randint(0, environment.get_width() - 100),
+                             y=random_generator.randint(0, environment.get_height() - 100),
+                             z=i, width=100, height=100, color=random_generator.choice(colors), text=text,
+                             font_size=20, include_border=i % 10 == 0, name=f"box_{i}")
+            self.add_object(box)
+        self.moving_box = self.get_objects()[-1]
+
+    def process(self):
+        """Moves the moving box and processes the scene."""
+        self.moving_box.set_pos((self.moving_box.x + 7) % (environment.get_width() - 100), self.moving_box.y)
+        super().process()
+
+
+def run_benchmark(number_of_objects, ticks, dirty_rect_rendering):
+    """Runs the game loop, without limiting the frame rate, for a scene with the given number of objects.
+
+    Args:
+        number_of_objects (int): The number of displayable objects in the scene.
+        ticks (int): The number of ticks to run.
+        dirty_rect_rendering (bool): Whether only the changed areas of the screen are redrawn each tick.
+
+    Returns:
+        float: The number of ticks per second.
+    """
+    game_engine.schedule_scene_change(BenchmarkScene(number_of_objects, dirty_rect_rendering))
+    game_engine.start_tick()
+    game_engine.end_tick()
+
+    start_time = time.perf_counter()
+    for _ in range(ticks):
+        environment.handle_events()
+        game_engine.start_tick()
+        game_engine.process_current_scene()
+        environment.draw_screen()
+        game_engine.end_tick()
+    return ticks / (time.perf_counter() - start_time)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measures ticks per second for scenes with many objects.")
+    parser.add_argument("--objects", type=int, nargs="+", default=[10, 100, 1000],
+                        help="The numbers of displayable objects to benchmark.")
+    parser.add_argument("--ticks", type=int, default=300, help="The number of ticks to run per benchmark.")
+    parser.add_argument("--dirty", action="store_true",
+                        help="Use dirty rect rendering instead of redrawing the whole screen every tick.")
+    arguments = parser.parse_args()
+
+    pygame.init()
+    for number in arguments.objects:
+        ticks_per_second = run_benchmark(number, arguments.ticks, arguments.dirty)
+        print(f"{number:>6} objects: {ticks_per_second:8.1f} ticks/s")
+    pygame.quit()
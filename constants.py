@@ -1,5 +1,12 @@
 import os
 FPS = 30
+IDLE_FPS = 2
+IDLE_AFTER_TICKS = FPS
+DIRTY_RECT_RENDERING = True
+DIRTY_RECT_MAX_SCREEN_FRACTION = 0.5
+SDL_SCALING = False
+HEADLESS = os.environ.get("PLAYTEST_HEADLESS", "0") == "1"
+HEADLESS_RESOLUTION = (1920, 1080)
 BLACK = (0, 0, 0)
 DARK_GREY = (50, 50, 50)
 GREY = (100, 100, 100)
@@ -18,3 +25,11 @@ large_card_height = round(large_card_width * card_aspect_ratio)
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 image_location = ROOT_DIR + "/Images/"
 allowed_image_types = [".png", ".jpg", ".jpeg"]
+overlay_surface_pool_size = 64
+text_cache_size = 512
+transform_cache_memory_budget = 128 * 1024 * 1024  # In bytes.
+image_pyramid_widths = [standard_card_width, 2 * standard_card_width, large_card_width]
+atlas_page_size = 1024
+atlas_max_pages = 16
+spatial_index_cell_size = 128
+task_time_budget = 4 / 1000  # In seconds.
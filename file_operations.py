@@ -56,10 +56,11 @@ def find_image_path_from_name(image_name):
 
 
 def load_all_images():
-    """Loads all images in the '/Images/' directory, to improve performance."""
+    """Loads all images in the '/Images/' directory, to improve performance. The image pyramids of the images are
+    built in the background."""
     image_paths = []
     for image_type in allowed_image_types:
         image_paths.extend(glob.glob(image_location + "*" + image_type))
 
-    for image_path in image_paths:
-        load_image(str(image_path))
\ No newline at end of file
+    image_ids = [load_image(str(image_path)) for image_path in image_paths]
+    game_engine.get_surface_manager().build_image_pyramids_in_background(image_ids)
\ No newline at end of file
@@ -3,6 +3,10 @@ import os
 import pickle
 import utility_functions as utils
 import surface_manager
+import spatial_index
+import object_registry
+import input_events
+import scheduler
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 import pygame
@@ -25,13 +29,39 @@ class Environment:
         standard_offset (int): A standard offset value used in various calculations.
         events_last_tick (dict): Dictionary storing mouse and key events from the last tick.
         events_this_tick (dict): Dictionary storing mouse and key events for the current tick.
+        update_rects (list or None): The areas of the screen that have changed since the last time the window was
+            drawn. None means that the whole screen should be drawn.
+        window_invalidated (bool): Indicates whether the window has lost its contents, e.g. after being resized,
+            and has to be drawn in full.
+        sdl_scaling (bool): Indicates whether SDL scales the screen to the window (pygame.SCALED), in which case
+            the window always has the same size as the screen.
+        headless (bool): Indicates whether the game runs without a display, using the SDL dummy video driver. The
+            screen is then only drawn offscreen, and is never presented.
+        presented_size (tuple): The size of the window the last time the screen was drawn to it.
+        scaled_screen (pygame.Surface or None): Preallocated surface the screen is scaled into when the window and
+            the screen differ in size.
+        quiet_ticks (int): The number of consecutive ticks without any input events, mouse buttons or keys held.
+        window_size (tuple): The size of the window, kept up to date using the resize events of the window.
+        mouse_position (tuple): The mouse position in screen-space coordinates, read once per tick.
+        new_key_presses (set): The keys that were pressed this tick but not the last tick, including keys that were
+            pressed and released again within the tick.
+        input_bus (input_events.InputEventBus): The pointer and key events since the end of the last tick.
     """
 
     def __init__(self):
         """Creates the Environment object."""
         # TODO: Improve event structure.
         self.scale_factor = 1
-        self.window = pygame.display.set_mode((0, 0), pygame.RESIZABLE)
+        self.sdl_scaling = SDL_SCALING
+        self.headless = HEADLESS
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            self.window = pygame.display.set_mode(HEADLESS_RESOLUTION)
+        elif self.sdl_scaling:
+            desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+            self.window = pygame.display.set_mode((desktop_width, desktop_height), pygame.SCALED | pygame.RESIZABLE)
+        else:
+            self.window = pygame.display.set_mode((0, 0), pygame.RESIZABLE)
         self.key_press = None
         self.width = pygame.display.Info().current_w
         self.height = pygame.display.Info().current_h
@@ -40,8 +70,16 @@ class Environment:
         self.standard_offset = 15
         self.events_last_tick = {"left_mouse_button": False, "right_mouse_button": False, "pressed_keys": []}
         self.events_this_tick = {"left_mouse_button": False, "right_mouse_button": False, "pressed_keys": []}
-        self.input_event = None
         self.events = []
+        self.input_bus = input_events.InputEventBus()
+        self.update_rects = None
+        self.window_invalidated = True
+        self.presented_size = self.window.get_size()
+        self.scaled_screen = None
+        self.quiet_ticks = 0
+        self.window_size = self.window.get_size()
+        self.mouse_position = self.read_mouse_position()
+        self.new_key_presses = set()
 
     def get_width(self):
         """Gets the width of the game window.
@@ -102,26 +140,52 @@ class Environment:
         return get_surface_manager().fetch_surface(self.screen_id)
 
     def get_mouse_position(self):
-        """Returns the current mouse position in screen-space coordinates, not window-space.
+        """Returns the mouse position in screen-space coordinates, not window-space, as read at the start of the
+        current tick.
 
         Returns:
-            tuple: A tuple of floats representing the mouse position.
+            tuple: A tuple of ints representing the mouse position.
         """
-        x, y = pygame.mouse.get_pos()
-        window_width = pygame.display.Info().current_w
-        window_height = pygame.display.Info().current_h
-        scale_x = self.get_screen().get_width() / window_width
-        scale_y = self.get_screen().get_height() / window_height
+        return self.mouse_position
+
+    def read_mouse_position(self):
+        """Reads the mouse position from pygame and converts it to screen-space coordinates. When SDL scales the
+        screen, pygame already reports the mouse position in screen-space.
+
+        Returns:
+            tuple: A tuple of ints representing the mouse position.
+        """
+        return self.to_screen_position(pygame.mouse.get_pos())
+
+    def to_screen_position(self, window_position):
+        """Converts a position in window-space coordinates, as reported by pygame, to screen-space coordinates. When SDL
+        scales the screen, pygame already reports positions in screen-space.
+
+        Args:
+            window_position (tuple): The position in window-space coordinates.
+
+        Returns:
+            tuple: A tuple of ints representing the position in screen-space coordinates.
+        """
+        x, y = window_position
+        if self.sdl_scaling:
+            return x, y
+        window_width, window_height = self.window_size
+        scale_x = self.get_width() / window_width
+        scale_y = self.get_height() / window_height
         return round(x * scale_x), round(y * scale_y)
 
     def set_events_this_tick(self, events):
-        """Sets the recorded events for the current tick.
+        """Sets the recorded events for the current tick. Keys that were pressed and released again within the tick
+        are taken from the input bus.
 
         Args:
             events (dict): A dictionary containing mouse and key events.
 
         """
         self.events_this_tick = events
+        self.new_key_presses = set(events["pressed_keys"]).difference(self.get_pressed_keys_last_tick())
+        self.new_key_presses.update(self.input_bus.get_key_presses())
 
     def set_events_last_tick(self, events):
         """Sets the recorded events for the last tick.
@@ -151,7 +215,7 @@ class Environment:
         return self.events_last_tick
 
     def get_left_mouse_click_this_tick(self):
-        """Returns whether the left mouse button was clicked during the current tick.
+        """Returns whether the left mouse button was held down at any point during the current tick.
 
         Returns:
             bool: True if the left mouse button was clicked, False otherwise.
@@ -160,7 +224,7 @@ class Environment:
         return self.events_this_tick["left_mouse_button"]
 
     def get_right_mouse_click_this_tick(self):
-        """Returns whether the right mouse button was clicked during the current tick.
+        """Returns whether the right mouse button was held down at any point during the current tick.
 
         Returns:
             bool: True if the right mouse button was clicked, False otherwise.
@@ -187,18 +251,12 @@ class Environment:
         return self.events_last_tick["right_mouse_button"]
 
     def get_new_key_presses(self):
-        """Returns whether the key that was pressed during the current tick, if any.
+        """Returns the keys that were pressed during the current tick, but not during the last tick.
 
         Returns:
-            str or None: The string representing the key that was pressed this tick, or None if no key was pressed.
+            set: The strings representing the keys that were newly pressed this tick.
         """
-        new_key_presses = []
-        keys_down = self.get_pressed_keys_this_tick()
-        old_keys_down = self.get_pressed_keys_last_tick()
-        for key in keys_down:
-            if key not in old_keys_down:
-                new_key_presses.append(key)
-        return new_key_presses
+        return self.new_key_presses
 
     def get_pressed_keys_this_tick(self):
         return self.events_this_tick["pressed_keys"]
@@ -208,7 +266,8 @@ class Environment:
 
     def handle_events(self):
         """Checks for detected pygame events, such as if the user tries to close the program window or if the
-        user clicks the mouse or presses any keys.
+        user clicks the mouse or presses any keys. Pointer and key events are published on the input bus, so that
+        presses and releases between two ticks are not lost.
 
         Returns:
             bool: True if the program should continue running, False if the user closed the window.
@@ -217,28 +276,151 @@ class Environment:
         self.key_press = None
         pressed_keys = self.get_pressed_keys_last_tick().copy()
         self.events = pygame.event.get()
+        timestamp = pygame.time.get_ticks()
         for event in self.events:
             if event.type == pygame.QUIT:
                 is_running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.input_bus.publish(input_events.InputEvent(input_events.InputEventTypes.POINTER_DOWN, timestamp,
+                                                               position=self.to_screen_position(event.pos),
+                                                               button=event.button))
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self.input_bus.publish(input_events.InputEvent(input_events.InputEventTypes.POINTER_UP, timestamp,
+                                                               position=self.to_screen_position(event.pos),
+                                                               button=event.button))
             elif event.type == pygame.KEYDOWN:
                 pressed_keys.append(pygame.key.name(event.key))
+                self.input_bus.publish(input_events.InputEvent(input_events.InputEventTypes.KEY_DOWN, timestamp,
+                                                               key=pygame.key.name(event.key)))
             elif event.type == pygame.KEYUP:
                 pressed_keys.remove(pygame.key.name(event.key))
+                self.input_bus.publish(input_events.InputEvent(input_events.InputEventTypes.KEY_UP, timestamp,
+                                                               key=pygame.key.name(event.key)))
             elif event.type == pygame.TEXTINPUT:
-                self.input_event = event.text
-
-        left_mouse_down = pygame.mouse.get_pressed(num_buttons=3)[0]
-        right_mouse_down = pygame.mouse.get_pressed(num_buttons=3)[2]
-        self.set_events_this_tick({"left_mouse_button": left_mouse_down, "right_mouse_button": right_mouse_down,
+                self.input_bus.publish(input_events.InputEvent(input_events.InputEventTypes.TEXT, timestamp,
+                                                               text=event.text))
+            elif event.type == pygame.VIDEORESIZE:
+                self.window_size = tuple(event.size)
+                if self.window_size != self.presented_size:
+                    self.window_invalidated = True
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.window_invalidated = True
+
+        left_mouse_down, _, right_mouse_down = pygame.mouse.get_pressed(num_buttons=3)
+        self.mouse_position = self.read_mouse_position()
+        self.input_bus.synchronize_buttons({input_events.MouseButtons.LEFT: left_mouse_down,
+                                            input_events.MouseButtons.RIGHT: right_mouse_down},
+                                           self.mouse_position, timestamp)
+        self.set_events_this_tick({"left_mouse_button": self.input_bus.was_down(input_events.MouseButtons.LEFT),
+                                   "right_mouse_button": self.input_bus.was_down(input_events.MouseButtons.RIGHT),
                                    "pressed_keys": pressed_keys})
+
+        if self.events or left_mouse_down or right_mouse_down or pressed_keys:
+            self.quiet_ticks = 0
+        else:
+            self.quiet_ticks += 1
         return is_running
 
+    def wait_for_events(self, timeout):
+        """Blocks until an event arrives or the timeout has passed. The event is put back in the event queue, so that
+        it is handled by handle_events during the next tick.
+
+        Args:
+            timeout (int): The maximum time to wait, in milliseconds.
+        """
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+    def set_update_rects(self, rects):
+        """Sets the areas of the screen that have changed since the window was last drawn.
+
+        Args:
+            rects (list or None): A list of pygame.Rect objects in screen-space coordinates, or None if the whole
+                screen has changed.
+        """
+        self.update_rects = rects
+
     def draw_screen(self):
-        """Draws the screen by scaling the surface and updating the window display."""
-        screen = get_surface_manager().fetch_surface(self.screen_id)
-        resized_screen = pygame.transform.scale(screen, self.window.get_rect().size)
-        self.window.blit(resized_screen, (0, 0))
+        """Draws the screen to the window and updates the window display. Only the areas set using set_update_rects
+        are drawn, unless the whole window needs to be redrawn. The screen is blitted directly if the window has the
+        same size as the screen, and is otherwise scaled into a preallocated surface first. Nothing is drawn when
+        running headless."""
+        update_rects = self.update_rects
+        self.update_rects = None
+        if self.headless:
+            return
+
+        window_size = self.window.get_size()
+        if window_size != self.presented_size:
+            self.presented_size = window_size
+            self.window_invalidated = True
+
+        if update_rects is None or self.window_invalidated:
+            self.draw_full_screen()
+            return
+
+        if len(update_rects) == 0:
+            return
+
+        screen = self.get_screen()
+        if window_size == screen.get_size():
+            for rect in update_rects:
+                self.window.blit(screen, rect, rect)
+            pygame.display.update(update_rects)
+            return
+
+        scaled_screen = self.get_scaled_screen()
+        scale_x = window_size[0] / screen.get_width()
+        scale_y = window_size[1] / screen.get_height()
+        window_rect = self.window.get_rect()
+        window_update_rects = []
+        for rect in update_rects:
+            window_update_rect = pygame.Rect(int(rect.x * scale_x), int(rect.y * scale_y),
+                                             int(rect.width * scale_x) + 2, int(rect.height * scale_y) + 2)
+            window_update_rect = window_update_rect.clip(window_rect)
+            if window_update_rect.width == 0 or window_update_rect.height == 0:
+                continue
+            pygame.transform.scale(screen.subsurface(rect), window_update_rect.size,
+                                   scaled_screen.subsurface(window_update_rect))
+            self.window.blit(scaled_screen, window_update_rect, window_update_rect)
+            window_update_rects.append(window_update_rect)
+        pygame.display.update(window_update_rects)
+
+    def draw_full_screen(self):
+        """Draws the whole screen to the window, scaling it if necessary, and updates the window display."""
+        screen = self.get_screen()
+        window_size = self.window.get_size()
+        if window_size == screen.get_size():
+            self.window.blit(screen, (0, 0))
+        else:
+            scaled_screen = self.get_scaled_screen()
+            pygame.transform.scale(screen, window_size, scaled_screen)
+            self.window.blit(scaled_screen, (0, 0))
         pygame.display.flip()
+        self.window_invalidated = False
+
+    def save_frame(self, file_path):
+        """Saves the current contents of the screen as an image, e.g. a PNG file.
+
+        Args:
+            file_path (str): The path of the image file.
+        """
+        pygame.image.save(self.get_screen(), file_path)
+
+    def get_scaled_screen(self):
+        """Gets the preallocated surface that the screen is scaled into, allocating a new one only if the size of the
+        window or the format of the screen has changed.
+
+        Returns:
+            pygame.Surface: A surface with the size of the window and the format of the screen.
+        """
+        screen = self.get_screen()
+        window_size = self.window.get_size()
+        reallocate = self.scaled_screen is None or self.scaled_screen.get_size() != window_size
+        if reallocate or self.scaled_screen.get_bitsize() != screen.get_bitsize():
+            self.scaled_screen = pygame.Surface(window_size, screen.get_flags() & pygame.SRCALPHA, screen)
+        return self.scaled_screen
 
 
 class GameState:
@@ -249,7 +431,8 @@ class GameState:
         surface_objects (dict): A dictionary relating surface ids and SurfaceHelper objects.
         current_max_id (int): The current maximum ID used for surface and image identification.
         scene_manager (SceneManager): Manager for scenes and scene transitions.
-        tick_manager (TickManager): TickManager object for storing start and end of tick functions.
+        scheduler (Scheduler): Scheduler for functions executed at the start and end of each tick, and for background
+            jobs.
     """
 
     def __init__(self):
@@ -261,7 +444,7 @@ class GameState:
 
         self.scene_manager = SceneManager()
 
-        self.tick_manager = TickManager()
+        self.scheduler = scheduler.Scheduler()
 
     def load_from_surface_manager(self):
         """Load surface-related attributes from the SurfaceManager."""
@@ -284,25 +467,6 @@ class GameState:
         return new_game_state
 
 
-class TickManager:
-    """This class serves as a data storage for functions and arguments to be executed
-    at the start and end of each game tick.
-
-    Attributes:
-        start_of_tick_functions (list): List to store functions to be executed at the start of a tick.
-        start_of_tick_arguments (list): List to store arguments for functions to be executed at the start of a tick.
-        end_of_tick_functions (list): List to store functions to be executed at the end of a tick.
-        end_of_tick_arguments (list): List to store arguments for functions to be executed at the end of a tick.
-    """
-
-    def __init__(self):
-        """Initialize the TickManager object."""
-        self.start_of_tick_functions = []
-        self.start_of_tick_arguments = []
-        self.end_of_tick_functions = []
-        self.end_of_tick_arguments = []
-
-
 class SceneManager:
     """A class for managing the scenes.
 
@@ -370,6 +534,8 @@ class SceneManager:
         self.clear_current_scene()
         self.set_current_scene(scene)
         self.scenes[scene.name] = scene
+        scene.invalidate_z_order()
+        scene.request_full_redraw()
         return scene
 
     def clear_current_scene(self):
@@ -384,7 +550,7 @@ class SceneManager:
             scene (Scene): The new scene.
         """
 
-        schedule_start_of_tick_function(self.create_scene, [scene])
+        schedule_task(self.create_scene, [scene], key="scene_change")
 
 
 class Scene:
@@ -399,6 +565,30 @@ class Scene:
         display_order (list): The order in which objects are displayed.
         background_color (tuple): The background color of the scene.
         persistent (bool): Whether the scene is persistent across scene changes.
+        dirty_rect_rendering (bool): Whether only the changed areas of the screen are redrawn each tick.
+        full_redraw_required (bool): Whether the whole screen has to be redrawn the next time the scene is displayed.
+        last_display_order (list): The display order the last time the scene was displayed.
+        last_display_rects (dict): The rects of the displayed objects the last time the scene was displayed.
+        processing_order_outdated (bool): Indicates whether a root object has been added or removed, or the
+            processing order of an object has been invalidated, since the processing order was last sorted.
+        processing_set (set): The objects in the processing order, used for fast membership checks.
+        display_order_outdated (bool): Indicates whether a root object has been added or removed, an object has been
+            moved in z, or the display list of an object has been invalidated, since the display order was last sorted.
+        spatial_index (spatial_index.SpatialGrid): A spatial index over the rects of the click-blocking objects in the
+            preliminary display order, used to find the objects that might block clicks.
+        indexed_display_order (list): The preliminary display order the spatial index was last synchronized with.
+        display_indices (dict): Maps each object in the indexed display order to its index in it.
+        pointer_dispatcher (PointerDispatcher): Resolves which objects in the scene the mouse pointer interacts with.
+        registry (object_registry.ObjectRegistry): An index of the root objects by name and type.
+        tombstones (list): The objects destroyed since the scene was last compacted.
+        displayable_roots (list): The root objects that can provide displayable objects, in the order of the root
+            objects.
+        processable_objects (list): The objects in the processing order that can be processed. Processable objects
+            are expected to have a destroyed attribute, like GameObject and GameScript.
+        activatable_objects (list): The objects in the processing order that can report whether they are active.
+        drawable_objects (list): The objects in the display order that provide a display surface.
+        click_blocking_objects (list): The objects in the display order that can block clicks, namely the opaque
+            ones. Only these objects are indexed in the spatial index.
     """
 
     def __init__(self, name):
@@ -414,6 +604,24 @@ class Scene:
         self.display_order = []
         self.background_color = WHITE
         self.persistent = False
+        self.dirty_rect_rendering = DIRTY_RECT_RENDERING
+        self.full_redraw_required = True
+        self.last_display_order = []
+        self.last_display_rects = {}
+        self.processing_order_outdated = True
+        self.processing_set = set()
+        self.display_order_outdated = True
+        self.spatial_index = spatial_index.SpatialGrid()
+        self.indexed_display_order = []
+        self.display_indices = {}
+        self.pointer_dispatcher = PointerDispatcher(self)
+        self.registry = object_registry.ObjectRegistry()
+        self.tombstones = []
+        self.displayable_roots = []
+        self.processable_objects = []
+        self.activatable_objects = []
+        self.drawable_objects = []
+        self.click_blocking_objects = []
 
     def get_objects(self):
         """Get the list of root objects in the scene.
@@ -424,12 +632,20 @@ class Scene:
         return self.objects
 
     def add_object(self, obj):
-        """Add a root object to the scene.
+        """Add a root object to the scene. The root objects are kept sorted by z, and the object is placed after any
+        objects with the same z.
 
         Args:
             obj: The object to add.
         """
-        self.objects.append(obj)
+        index = len(self.objects)
+        while index > 0 and self.objects[index - 1].z > obj.z:
+            index -= 1
+        self.objects.insert(index, obj)
+        self.registry.add(obj)
+        self.register_root_capabilities()
+        self.invalidate_processing_order()
+        self.invalidate_display_order()
 
     def remove_object(self, obj):
         """Remove a root object from the scene.
@@ -439,6 +655,10 @@ class Scene:
         """
         if obj in self.objects:
             self.objects.remove(obj)
+            self.registry.remove(obj)
+            self.register_root_capabilities()
+            self.invalidate_processing_order()
+            self.invalidate_display_order()
 
     def add_multiple_objects(self, object_list):
         """Add multiple root objects to the scene.
@@ -446,7 +666,69 @@ class Scene:
         Args:
             object_list (list): The list of root objects to add to the scene.
         """
-        self.objects.extend(object_list)
+        for obj in object_list:
+            self.add_object(obj)
+
+    def register_root_capabilities(self):
+        """Registers which root objects can provide displayable objects. Should be called whenever the root objects
+        are added, removed or reordered, so that the display order can be collected without checking every root
+        object each tick."""
+        self.displayable_roots = [obj for obj in self.objects if hasattr(obj, "get_displayable_objects")]
+
+    def register_processing_capabilities(self):
+        """Registers which objects in the processing order can be processed and which can report whether they are
+        active. Should be called whenever the processing order changes."""
+        self.processable_objects = [obj for obj in self.processing_order if hasattr(obj, "process")]
+        self.activatable_objects = [obj for obj in self.processing_order if hasattr(obj, "is_active")]
+
+    def register_display_capabilities(self):
+        """Registers which objects in the display order provide a display surface and which can block clicks. Should
+        be called whenever the display order changes."""
+        self.drawable_objects = [obj for obj in self.display_order
+                                 if hasattr(obj, "get_display_surface") and callable(obj.get_display_surface)]
+        self.click_blocking_objects = [obj for obj in self.display_order if obj.opaque]
+
+    def get_object_by_name(self, name):
+        """Gets the root object with a specific name. Destroyed objects are found until they have been removed from
+        the scene at the end of the tick.
+
+        Args:
+            name (str): The name of the object.
+
+        Returns:
+            The root object with the name that was added first, or None if there is no such object.
+        """
+        objects = self.registry.get_by_name(name)
+        if not objects:
+            return None
+        return objects[0]
+
+    def get_objects_by_type(self, match_type):
+        """Gets the root objects of a specific type, including objects of its subclasses.
+
+        Args:
+            match_type (type): The type of the objects.
+
+        Returns:
+            list: The root objects of the type, in the order they were added to the scene.
+        """
+        return self.registry.get_by_type(match_type)
+
+    def invalidate_processing_order(self):
+        """Marks the processing order as outdated, so that it is sorted again the next time objects are scheduled for
+        processing."""
+        self.processing_order_outdated = True
+
+    def invalidate_display_order(self):
+        """Marks the display order as outdated, so that the displayable objects are collected and sorted again the next
+        time the display order is requested."""
+        self.display_order_outdated = True
+
+    def invalidate_z_order(self):
+        """Marks both the processing order and the display order as outdated, e.g. after an object has been moved in
+        z."""
+        self.invalidate_processing_order()
+        self.invalidate_display_order()
 
     @staticmethod
     def get_default_position():
@@ -467,12 +749,14 @@ class Scene:
             list: The list of objects that could be blocking the given object.
         """
         blocking_object_list = []
-        if obj not in self.preliminary_display_order:
+        self.update_spatial_index()
+        object_index = self.display_indices.get(obj)
+        if object_index is None:
             return blocking_object_list
 
-        object_index = self.preliminary_display_order.index(obj)
-
-        for masking_object_index, masking_object in enumerate(self.preliminary_display_order):
+        candidates = self.spatial_index.query(obj.get_rect())
+        for masking_object in sorted(candidates, key=self.display_indices.__getitem__):
+            masking_object_index = self.display_indices[masking_object]
             if should_not_block_clicks(obj, object_index, masking_object, masking_object_index):
                 continue
             if obj.get_rect().colliderect(masking_object.get_rect()):
@@ -480,69 +764,269 @@ class Scene:
 
         return blocking_object_list
 
+    def update_spatial_index(self):
+        """Synchronizes the spatial index with the click-blocking objects of the preliminary display order, adding
+        objects that have started being displayed and removing objects that no longer are. Objects that move are kept
+        up to date by the spatial index itself."""
+        if self.indexed_display_order is self.preliminary_display_order:
+            return
+
+        click_blocking_objects = set(self.click_blocking_objects)
+        for obj in list(self.spatial_index.get_objects()):
+            if obj not in click_blocking_objects:
+                self.spatial_index.remove(obj)
+        for obj in self.click_blocking_objects:
+            self.spatial_index.insert(obj)
+
+        self.display_indices = {obj: i for i, obj in enumerate(self.preliminary_display_order)}
+        self.indexed_display_order = self.preliminary_display_order
+
     def clear(self):
         """Clear all objects from the scene."""
         self.objects = []
+        self.registry.clear()
+        self.tombstones = []
         self.processing_order = []
         self.display_order = []
+        self.last_display_order = []
+        self.last_display_rects = {}
+        self.processing_set = set()
+        self.display_order_outdated = True
+        self.preliminary_display_order = []
+        self.spatial_index.clear()
+        self.indexed_display_order = self.preliminary_display_order
+        self.display_indices = {}
+        self.displayable_roots = []
+        self.processable_objects = []
+        self.activatable_objects = []
+        self.drawable_objects = []
+        self.click_blocking_objects = []
+        self.invalidate_z_order()
+        self.request_full_redraw()
+
+    def request_full_redraw(self):
+        """Makes the scene redraw the whole screen the next time it is displayed."""
+        self.full_redraw_required = True
 
     def schedule_processing(self):
-        """Schedule the processing order of objects."""
-        self.processing_order = []
-
+        """Schedule the processing order of objects. The processing order is kept between ticks, and is only collected
+        and sorted by z again after it has been invalidated, e.g. by a root object being added or removed, or by an
+        object invalidating its own processing order. Otherwise, the root objects are only walked so that they can
+        update the positions of their descendants."""
+        if not self.processing_order_outdated:
+            for obj in self.objects:
+                obj.schedule_processing()
+            if not self.processing_order_outdated:
+                return
+
+        self.processing_order_outdated = False
         self.get_objects().sort(key=lambda x: x.z)
+        self.register_root_capabilities()
 
+        scheduled_objects = []
         for obj in self.objects:
-            items_to_be_processed = obj.schedule_processing()
-            self.processing_order.extend(items_to_be_processed)
-        self.processing_order.sort(key=lambda x: x.z)
+            scheduled_objects.extend(obj.schedule_processing())
 
-    def process_object(self, obj):
-        """Process a specific object.
+        self.processing_order = sorted(scheduled_objects, key=lambda x: x.z)
+        self.processing_set = set(self.processing_order)
+        self.register_processing_capabilities()
 
-        Args:
-            obj: The object to process.
+    def get_display_order(self):
+        """Gets the displayable objects of the scene, sorted by z. The display order is kept between ticks, and is only
+        collected and sorted again after it has been invalidated. The returned list should not be modified.
+
+        Returns:
+            list: The displayable objects of the scene, sorted by z.
         """
-        cant_be_processed = not hasattr(obj, "process") or obj not in self.processing_order
-        obj_destroyed = hasattr(obj, "destroyed") and obj.destroyed
-        if cant_be_processed or obj_destroyed:
-            return
+        if not self.display_order_outdated:
+            return self.display_order
 
-        obj.process()
+        self.display_order_outdated = False
+        unsorted_display_order = []
+        for obj in self.displayable_roots:
+            unsorted_display_order.extend(obj.get_displayable_objects())
+        self.display_order = sorted(unsorted_display_order, key=lambda x: x.z)
+        self.register_display_capabilities()
+        return self.display_order
 
     def process(self):
         """Process and display objects in the scene."""
-        environment.get_screen().fill(self.background_color)
-        self.preliminary_display_order = []
         self.schedule_processing()
 
         # Generate preliminary display_order
-        for obj in self.objects:
-            if hasattr(obj, "get_displayable_objects"):
-                self.preliminary_display_order.extend(obj.get_displayable_objects())
-        self.preliminary_display_order.sort(key=lambda x: x.z)
+        self.preliminary_display_order = self.get_display_order()
+        self.pointer_dispatcher.start_tick()
 
         # Process objects.
-        for obj in reversed(self.processing_order.copy()):
-            self.process_object(obj)
+        for obj in reversed(self.processable_objects):
+            if not obj.destroyed:
+                obj.process()
 
-        # Generate display order
-        self.display_order = []
-        for obj in self.objects:
-            if hasattr(obj, "get_displayable_objects"):
-                self.display_order.extend(obj.get_displayable_objects())
-        self.display_order.sort(key=lambda x: x.z)
+        # Generate display order, reusing the preliminary display order unless it was invalidated during processing.
+        self.display_order = self.get_display_order()
 
         # Display objects.
-        for obj in self.display_order:
-            if hasattr(obj, "get_display_surface") and callable(obj.get_display_surface):
-                surface, rect = obj.get_display_surface()
-                environment.get_screen().blit(surface, rect)
+        screen = environment.get_screen()
+        if self.dirty_rect_rendering and not self.full_redraw_required:
+            self.display_dirty_regions(screen)
+        else:
+            self.display_all_objects(screen)
+        self.store_display_state()
 
         # Remove destroyed objects
+        self.compact()
+
+    def add_tombstone(self, obj):
+        """Records that an object has been destroyed, so that it is removed from the scene and its resources are
+        released when the scene is compacted at the end of the tick.
+
+        Args:
+            obj: The destroyed object.
+        """
+        self.tombstones.append(obj)
+
+    def compact(self):
+        """Removes the destroyed root objects from the scene in a single pass, and releases the resources of all objects
+        destroyed since the scene was last compacted."""
+        if not self.tombstones:
+            return
+
+        remaining_objects = []
         for obj in self.objects:
             if hasattr(obj, "destroyed") and obj.destroyed:
-                self.objects.remove(obj)
+                self.registry.remove(obj)
+            else:
+                remaining_objects.append(obj)
+        if len(remaining_objects) != len(self.objects):
+            self.objects = remaining_objects
+            self.register_root_capabilities()
+            self.invalidate_processing_order()
+
+        tombstones = self.tombstones
+        self.tombstones = []
+        for obj in tombstones:
+            if hasattr(obj, "release_resources"):
+                obj.release_resources()
+
+    def display_all_objects(self, screen):
+        """Redraws the whole screen.
+
+        Args:
+            screen (pygame.Surface): The screen surface.
+        """
+        screen.fill(self.background_color)
+        display_surfaces = {obj: obj.get_display_surface() for obj in self.drawable_objects}
+        self.draw_objects(screen, display_surfaces)
+
+        environment.set_update_rects(None)
+        self.full_redraw_required = False
+
+    def display_dirty_regions(self, screen):
+        """Redraws only the areas of the screen that have changed since the scene was last displayed. Falls back to
+        redrawing the whole screen if the changed area is large.
+
+        Args:
+            screen (pygame.Surface): The screen surface.
+        """
+        screen_rect = screen.get_rect()
+        dirty_rects = [rect.clip(screen_rect) for rect in self.find_dirty_rects()]
+        dirty_rects = [rect for rect in dirty_rects if rect.width > 0 and rect.height > 0]
+
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if dirty_area > DIRTY_RECT_MAX_SCREEN_FRACTION * screen_rect.width * screen_rect.height:
+            self.display_all_objects(screen)
+            return
+
+        display_surfaces = {}
+        for dirty_rect in dirty_rects:
+            screen.set_clip(dirty_rect)
+            screen.fill(self.background_color)
+            region_display_surfaces = {}
+            for obj in self.drawable_objects:
+                if not obj.get_rect().colliderect(dirty_rect):
+                    continue
+                if obj not in display_surfaces:
+                    display_surfaces[obj] = obj.get_display_surface()
+                region_display_surfaces[obj] = display_surfaces[obj]
+            self.draw_objects(screen, region_display_surfaces)
+        screen.set_clip(None)
+
+        environment.set_update_rects(dirty_rects)
+
+    @staticmethod
+    def draw_objects(screen, display_surfaces):
+        """Draws objects on the screen, each followed by the drawing primitives in its draw list. The surfaces are
+        submitted in batches using Surface.blits, and a batch is only interrupted by objects that have primitives.
+
+        Args:
+            screen (pygame.Surface): The screen surface.
+            display_surfaces (dict): The objects to draw, in display order, mapped to the tuple (surface, rect)
+                returned by their get_display_surface method.
+        """
+        blit_sequence = []
+        for obj, display_surface in display_surfaces.items():
+            blit_sequence.append(display_surface)
+            draw_list = obj.get_draw_list()
+            if not draw_list:
+                continue
+
+            screen.blits(blit_sequence, doreturn=False)
+            blit_sequence = []
+            rect = display_surface[1]
+            for primitive in draw_list:
+                primitive.draw(screen, rect)
+
+        screen.blits(blit_sequence, doreturn=False)
+
+    def find_dirty_rects(self):
+        """Finds the areas of the screen that have changed since the scene was last displayed, namely the areas of
+        objects that have been added, removed, moved, reordered or marked as dirty.
+
+        Returns:
+            list: A list of non-overlapping pygame.Rect objects covering the changed areas.
+        """
+        dirty_rects = []
+        displayed_objects = set(self.display_order)
+        for obj in self.last_display_order:
+            if obj not in displayed_objects:
+                dirty_rects.append(self.last_display_rects[obj])
+
+        previously_displayed = [obj for obj in self.last_display_order if obj in displayed_objects]
+        still_displayed = [obj for obj in self.display_order if obj in self.last_display_rects]
+        for obj, previous_obj in zip(still_displayed, previously_displayed):
+            if obj is not previous_obj:
+                obj.mark_dirty()
+
+        for obj in self.display_order:
+            obj_dirty = obj.is_dirty()
+            last_rect = self.last_display_rects.get(obj)
+            if last_rect is None:
+                dirty_rects.append(obj.get_rect().copy())
+            elif last_rect != obj.get_rect():
+                dirty_rects.extend([last_rect, obj.get_rect().copy()])
+            elif obj_dirty:
+                dirty_rects.append(last_rect)
+
+        return utils.merge_overlapping_rects(dirty_rects)
+
+    def store_display_state(self):
+        """Stores the display order and the rects of the displayed objects, so that changes can be detected the
+        next time the scene is displayed."""
+        self.last_display_order = self.display_order.copy()
+        self.last_display_rects = {obj: obj.get_rect().copy() for obj in self.display_order}
+        for obj in self.display_order:
+            obj.clear_dirty()
+
+    def is_active(self):
+        """Checks whether any of the objects processed by the scene are active, e.g. moving or being animated.
+
+        Returns:
+            bool: True if any object is active, False otherwise.
+        """
+        for obj in self.activatable_objects:
+            if obj.is_active():
+                return True
+        return False
 
     def create_scene(self, *args, **kwargs):
         """Virtual method for creating a scene. Implemented by child scene classes."""
@@ -558,13 +1042,150 @@ class Scene:
         self.add_object(new_object)
 
 
-def get_tick_manager():
-    """Returns the current tick manager.
+class PointerDispatcher:
+    """Resolves which objects of a scene the mouse pointer interacts with. The mouse position is read once per tick,
+    and the objects under it are looked up in the spatial index of the scene, so that each button only has to check
+    whether it is hit instead of testing the mouse position and every potentially blocking object on its own.
+
+    Attributes:
+        scene (Scene): The scene whose objects the pointer interacts with.
+        mouse_position (tuple): The mouse position in screen-space coordinates, read at the start of the tick.
+        objects_at_pointer (list): The displayed click-blocking objects whose rects contain the mouse position, in
+            display order.
+        resolved_version (int): The version of the spatial index when the objects at the pointer were last resolved.
+        resolved_display_order (list): The display order the objects at the pointer were last resolved with.
+    """
+
+    def __init__(self, scene):
+        """Initializes a PointerDispatcher.
+
+        Args:
+            scene (Scene): The scene whose objects the pointer interacts with.
+        """
+        self.scene = scene
+        self.mouse_position = (0, 0)
+        self.objects_at_pointer = []
+        self.resolved_version = None
+        self.resolved_display_order = None
+
+    def start_tick(self):
+        """Reads the mouse position for the current tick, and synchronizes the spatial index of the scene with its
+        preliminary display order."""
+        self.mouse_position = environment.get_mouse_position()
+        self.scene.update_spatial_index()
+        self.resolved_version = None
+
+    def get_mouse_position(self):
+        """Gets the mouse position read at the start of the tick.
+
+        Returns:
+            tuple: The mouse position in screen-space coordinates.
+        """
+        return self.mouse_position
+
+    def get_objects_at_pointer(self):
+        """Gets the displayed click-blocking objects whose rects contain the mouse position. The objects are only
+        looked up again after an object has been added to, removed from or moved in the spatial index, or the display
+        order changed.
+
+        Returns:
+            list: The objects at the pointer, in display order.
+        """
+        spatial_index = self.scene.spatial_index
+        display_order = self.scene.indexed_display_order
+        if self.resolved_version == spatial_index.version and self.resolved_display_order is display_order:
+            return self.objects_at_pointer
+
+        display_indices = self.scene.display_indices
+        self.objects_at_pointer = sorted(spatial_index.query_point(self.mouse_position),
+                                         key=display_indices.__getitem__)
+        self.resolved_version = spatial_index.version
+        self.resolved_display_order = display_order
+        return self.objects_at_pointer
+
+    def get_objects_at(self, position):
+        """Gets the displayed click-blocking objects whose rects contain a position. Positions other than the mouse
+        position are not cached, since they are only looked up for clicks that happened before the pointer moved.
+
+        Args:
+            position (tuple): The position in screen-space coordinates.
+
+        Returns:
+            list: The objects at the position, in display order.
+        """
+        if position == self.mouse_position:
+            return self.get_objects_at_pointer()
+        return sorted(self.scene.spatial_index.query_point(position), key=self.scene.display_indices.__getitem__)
+
+    def is_blocked(self, obj, position=None):
+        """Checks whether the pointer is blocked from interacting with an object by another object at the pointer,
+        according to the rules in should_not_block_clicks.
+
+        Args:
+            obj: The object to check.
+            position (tuple): The position of the pointer in screen-space coordinates, e.g. where a click happened.
+                Defaults to the mouse position read at the start of the tick.
+
+        Returns:
+            bool: True if the pointer is blocked, False otherwise.
+        """
+        object_index = self.scene.display_indices.get(obj)
+        if object_index is None:
+            return False
+
+        if position is None:
+            position = self.mouse_position
+        display_indices = self.scene.display_indices
+        for masking_object in self.get_objects_at(position):
+            if should_not_block_clicks(obj, object_index, masking_object, display_indices[masking_object]):
+                continue
+            if obj.get_rect().colliderect(masking_object.get_rect()):
+                return True
+        return False
+
+    def is_hit(self, obj):
+        """Checks whether an object is hit by the pointer, meaning that the pointer is over it and not blocked by any
+        other object.
+
+        Args:
+            obj: The object to check.
+
+        Returns:
+            bool: True if the object is hit by the pointer, False otherwise.
+        """
+        return obj.get_rect().collidepoint(self.mouse_position) and not self.is_blocked(obj)
+
+    def get_target(self):
+        """Gets the top-most object hit by the pointer.
+
+        Returns:
+            The top-most object hit by the pointer, or None if no object is hit.
+        """
+        for obj in reversed(self.get_objects_at_pointer()):
+            if not self.is_blocked(obj):
+                return obj
+        return None
+
+
+def get_pointer_dispatcher():
+    """Returns the pointer dispatcher of the current scene.
+
+    Returns:
+        PointerDispatcher or None: The pointer dispatcher of the current scene, or None if there is no current scene.
+    """
+    current_scene = get_scene_manager().get_current_scene()
+    if current_scene is None:
+        return None
+    return current_scene.pointer_dispatcher
+
+
+def get_scheduler():
+    """Returns the current scheduler.
 
     Returns:
-        TickManager or None: The tick manager of the current game state.
+        Scheduler or None: The scheduler of the current game state.
     """
-    return game_state.tick_manager
+    return game_state.scheduler
 
 
 def find_all_ancestors(current_object):
@@ -595,22 +1216,18 @@ def calculate_hierarchy_depth_difference(obj1, obj2):
         otherwise, returns None. If the difference is positive, the first object is higher up in the hierarchy
         than the second object.
     """
-
-    ancestors_of_obj1 = find_all_ancestors(obj1)
-    ancestors_of_obj2 = find_all_ancestors(obj2)
-    for ancestor in ancestors_of_obj2:
-        if ancestor in ancestors_of_obj1:
-            return ancestors_of_obj1.index(ancestor) - ancestors_of_obj2.index(ancestor)
-
-    return None
+    if obj1.root is not obj2.root:
+        return None
+    return obj1.depth - obj2.depth
 
 
 def should_not_block_clicks(obj, object_index, masking_object, masking_object_index):
     """Determines whether an object should block the clicks of another object or not.
 
     Args:
-        obj: The object for which the click-blocking status is determined.
-        masking_object: The object that might block clicks.
+        obj (GameObject): The object for which the click-blocking status is determined.
+        masking_object (GameObject): The object that might block clicks, usually one of the click-blocking objects
+            registered by the scene.
         object_index (int): The index of obj in the processing order.
         masking_object_index (int): The index of masking_object in the processing order.
 
@@ -618,11 +1235,9 @@ def should_not_block_clicks(obj, object_index, masking_object, masking_object_in
         bool: True if the clicks of the first object should be blocked by the second object, False otherwise.
     """
     same_object = masking_object == obj
-    not_opaque = hasattr(masking_object, "opaque") and not masking_object.opaque
-    has_rect = hasattr(masking_object, "get_rect")
+    not_opaque = not masking_object.opaque
     is_below = masking_object.z < obj.z
-    is_destroyed = hasattr(masking_object, "destroyed") and masking_object.destroyed
-    if same_object or not_opaque or not has_rect or is_below or is_destroyed:
+    if same_object or not_opaque or is_below or masking_object.destroyed:
         return True
     same_z = masking_object.z == obj.z
 
@@ -644,6 +1259,71 @@ def should_not_block_clicks(obj, object_index, masking_object, masking_object_in
     return dont_block_clicks
 
 
+def is_idle():
+    """Checks whether the game is idle, meaning that there has been no input for a while, no scheduled tasks are due
+    and no objects in the current scene are active. While the game is idle, the game loop can wait for input instead
+    of running at full rate.
+
+    Returns:
+        bool: True if the game is idle, False otherwise.
+    """
+    if environment.quiet_ticks < IDLE_AFTER_TICKS:
+        return False
+    if get_scheduler().has_ready_tasks():
+        return False
+    current_scene = get_scene_manager().get_current_scene()
+    return current_scene is None or not current_scene.is_active()
+
+
+def get_idle_wait_time():
+    """Gets the time the game loop may wait for input while the game is idle, which is shortened so that the next
+    delayed task is executed on time.
+
+    Returns:
+        int: The time to wait, in milliseconds.
+    """
+    wait_time = 1000 // IDLE_FPS
+    time_until_next_task = get_scheduler().get_time_until_next_task()
+    if time_until_next_task is not None:
+        wait_time = min(wait_time, int(time_until_next_task * 1000))
+    return wait_time
+
+
+def add_tombstone(obj):
+    """Records a destroyed object in the current scene, which removes it at the end of the tick.
+
+    Args:
+        obj: The destroyed object.
+    """
+    current_scene = get_scene_manager().get_current_scene()
+    if current_scene is not None:
+        current_scene.add_tombstone(obj)
+
+
+def invalidate_processing_order():
+    """Marks the processing order of the current scene as outdated, e.g. after an object has been added to or removed
+    from the processing order of a root object."""
+    current_scene = get_scene_manager().get_current_scene()
+    if current_scene is not None:
+        current_scene.invalidate_processing_order()
+
+
+def invalidate_display_order():
+    """Marks the display order of the current scene as outdated, e.g. after an object has been added to or removed
+    from the displayable objects of a root object."""
+    current_scene = get_scene_manager().get_current_scene()
+    if current_scene is not None:
+        current_scene.invalidate_display_order()
+
+
+def invalidate_z_order():
+    """Marks the processing order and the display order of the current scene as outdated, e.g. after an object has
+    been moved in z."""
+    current_scene = get_scene_manager().get_current_scene()
+    if current_scene is not None:
+        current_scene.invalidate_z_order()
+
+
 def get_scene_manager():
     """Returns the surface manager associated with the current game state.
 
@@ -671,6 +1351,35 @@ def get_surface_manager():
     return game_state.surface_manager
 
 
+def schedule_task(function, arguments=None, phase=scheduler.TaskPhases.START_OF_TICK,
+                  priority=scheduler.TaskPriorities.NORMAL, delay=0, key=None):
+    """Schedules a function to be executed by the scheduler of the current game state.
+
+    Args:
+        function (callable): The function to be executed. If it returns a generator, the generator is advanced one
+            step each time the task is run, which spreads an expensive job across several ticks.
+        arguments: The arguments for the function, as a list of positional arguments or a dict of keyword arguments.
+        phase (str): The phase of the tick the function is executed in, one of scheduler.TaskPhases. Background tasks
+            are executed at the end of the tick, within the time budget given by task_time_budget.
+        priority (int): The priority of the task, one of scheduler.TaskPriorities.
+        delay (float): The time, in seconds, to wait before the function may be executed.
+        key (str or None): If given, a pending task scheduled with the same key is replaced by this one.
+
+    Returns:
+        scheduler.Task: The scheduled task.
+    """
+    return get_scheduler().schedule(function, arguments, phase=phase, priority=priority, delay=delay, key=key)
+
+
+def cancel_task(key):
+    """Cancels the pending task scheduled with a key, if there is one.
+
+    Args:
+        key (str): The key of the task.
+    """
+    get_scheduler().cancel(key)
+
+
 def schedule_start_of_tick_function(function, arguments):
     """Schedules a function to be executed at the start of the next game tick.
 
@@ -678,8 +1387,7 @@ def schedule_start_of_tick_function(function, arguments):
         function (callable): The function to be executed.
         arguments (list): The list of arguments to be passed to the function.
     """
-    game_state.tick_manager.start_of_tick_functions.append(function)
-    game_state.tick_manager.start_of_tick_arguments.append(arguments)
+    schedule_task(function, arguments, phase=scheduler.TaskPhases.START_OF_TICK)
 
 
 def schedule_end_of_tick_function(function, arguments):
@@ -689,26 +1397,22 @@ def schedule_end_of_tick_function(function, arguments):
         function (callable): The function to be executed.
         arguments (list): The list of arguments to be passed to the function.
     """
-    game_state.tick_manager.end_of_tick_functions.append(function)
-    game_state.tick_manager.end_of_tick_arguments.append(arguments)
+    schedule_task(function, arguments, phase=scheduler.TaskPhases.END_OF_TICK)
 
 
 def start_tick():
-    """Executes start-of-tick functions."""
-    utils.execute_multiple_functions(game_state.tick_manager.start_of_tick_functions,
-                                     game_state.tick_manager.start_of_tick_arguments)
-    game_state.tick_manager.start_of_tick_functions = []
-    game_state.tick_manager.start_of_tick_arguments = []
+    """Executes start-of-tick tasks."""
+    get_scheduler().run_phase(scheduler.TaskPhases.START_OF_TICK)
 
 
 def end_tick():
-    """Executes end-of-tick functions and resets environment events."""
-    utils.execute_multiple_functions(game_state.tick_manager.end_of_tick_functions,
-                                     game_state.tick_manager.end_of_tick_arguments)
-    game_state.tick_manager.end_of_tick_functions = []
-    game_state.tick_manager.end_of_tick_arguments = []
+    """Executes end-of-tick tasks and as many background tasks as the time budget allows, and resets environment
+    events."""
+    get_scheduler().run_phase(scheduler.TaskPhases.END_OF_TICK)
+    get_scheduler().run_background_tasks()
 
     environment.set_events_last_tick(environment.events_this_tick)
+    environment.input_bus.clear()
     environment.set_events_this_tick({"left_mouse_button": False, "right_mouse_button": False, "pressed_keys": []})
 
 
@@ -727,7 +1431,7 @@ def save_state(save_number=0):
     Args:
         save_number (int): The identifier for the save_state file. Defaults to 0.
     """
-    schedule_end_of_tick_function(_save_state, [save_number])
+    schedule_task(_save_state, [save_number], phase=scheduler.TaskPhases.END_OF_TICK, key=f"save_state_{save_number}")
 
 
 def _save_state(save_number):
@@ -747,7 +1451,7 @@ def load_state(save_number=0):
     Args:
         save_number (int): The identifier of the save_state file. Defaults to 0.
     """
-    schedule_end_of_tick_function(_load_state, [save_number])
+    schedule_task(_load_state, [save_number], phase=scheduler.TaskPhases.END_OF_TICK, key="load_state")
 
 
 def _load_state(save_number):
@@ -762,9 +1466,12 @@ def _load_state(save_number):
     """
     with open(f'save_state{save_number}.txt', 'rb') as save_file:
         loaded_game_state = pickle.load(save_file)
+        get_scene_manager().clear_current_scene()
         get_surface_manager().load_surfaces(loaded_game_state)
         set_scene_manager(loaded_game_state.scene_manager)
         game_state.load_from_surface_manager()
+        get_scene_manager().get_current_scene().invalidate_z_order()
+        get_scene_manager().get_current_scene().request_full_redraw()
 
 
 def process_current_scene():
@@ -0,0 +1,177 @@
+class InputEventTypes:
+    POINTER_DOWN = "pointer_down"
+    POINTER_UP = "pointer_up"
+    KEY_DOWN = "key_down"
+    KEY_UP = "key_up"
+    TEXT = "text"
+
+
+class MouseButtons:
+    LEFT = 1
+    MIDDLE = 2
+    RIGHT = 3
+
+
+class InputEvent:
+    """A pointer or key event, as taken from the pygame event queue.
+
+    Attributes:
+        event_type (str): The type of the event, one of InputEventTypes.
+        timestamp (int): The time the event was taken from the pygame event queue, in milliseconds since pygame was
+            initialized.
+        position (tuple): The mouse position of a pointer event in screen-space coordinates, or None for other events.
+        button (int): The mouse button of a pointer event, one of MouseButtons, or None for other events.
+        key (str): The name of the key of a key event, or None for other events.
+        text (str): The text of a text event, or None for other events.
+    """
+    __slots__ = ("event_type", "timestamp", "position", "button", "key", "text")
+
+    def __init__(self, event_type, timestamp, position=None, button=None, key=None, text=None):
+        """Initializes an InputEvent.
+
+        Args:
+            event_type (str): The type of the event, one of InputEventTypes.
+            timestamp (int): The time the event was taken from the pygame event queue, in milliseconds.
+            position (tuple): The mouse position of a pointer event in screen-space coordinates.
+            button (int): The mouse button of a pointer event.
+            key (str): The name of the key of a key event.
+            text (str): The text of a text event.
+        """
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.position = position
+        self.button = button
+        self.key = key
+        self.text = text
+
+
+class InputEventBus:
+    """Queues the pointer and key events that happened since the end of the last tick, so that objects can react to
+    every press and release, even when several of them happen between two ticks. Polling the state of the mouse
+    buttons once per tick would miss a click that starts and ends between two ticks, which happens more often the
+    lower the frame rate is.
+
+    Attributes:
+        events (list): The events since the end of the last tick, in the order they happened.
+        presses (dict): Maps each mouse button to its POINTER_DOWN events since the end of the last tick, since the
+            presses are looked up by every button, every tick.
+        pending_text (list): The text of the text events since the end of the last tick, that has not been consumed
+            by an input field yet.
+        buttons_down (set): The mouse buttons that are currently held down.
+        buttons_down_during_tick (set): The mouse buttons that have been held down at any point since the end of the
+            last tick.
+    """
+
+    def __init__(self):
+        """Initializes an InputEventBus."""
+        self.events = []
+        self.presses = {}
+        self.pending_text = []
+        self.buttons_down = set()
+        self.buttons_down_during_tick = set()
+
+    def publish(self, event):
+        """Adds an event to the queue, and updates the state of the mouse buttons.
+
+        Args:
+            event (InputEvent): The event.
+        """
+        self.events.append(event)
+        if event.event_type == InputEventTypes.POINTER_DOWN:
+            self.presses.setdefault(event.button, []).append(event)
+            self.buttons_down.add(event.button)
+            self.buttons_down_during_tick.add(event.button)
+        elif event.event_type == InputEventTypes.POINTER_UP:
+            self.buttons_down.discard(event.button)
+        elif event.event_type == InputEventTypes.TEXT:
+            self.pending_text.append(event.text)
+
+    def synchronize_buttons(self, buttons_down, position, timestamp):
+        """Makes the state of the mouse buttons agree with their polled state, publishing a press or release for every
+        button whose events were missed, e.g. because the button was pressed while the window was not focused.
+
+        Args:
+            buttons_down (dict): Maps mouse buttons to whether they are polled as being held down.
+            position (tuple): The current mouse position in screen-space coordinates.
+            timestamp (int): The current time, in milliseconds.
+        """
+        for button, is_down in buttons_down.items():
+            if is_down and button not in self.buttons_down:
+                self.publish(InputEvent(InputEventTypes.POINTER_DOWN, timestamp, position=position, button=button))
+            elif not is_down and button in self.buttons_down:
+                self.publish(InputEvent(InputEventTypes.POINTER_UP, timestamp, position=position, button=button))
+
+    def clear(self):
+        """Removes the events of the tick that just ended from the queue."""
+        self.events = []
+        self.presses = {}
+        self.pending_text = []
+        self.buttons_down_during_tick = set(self.buttons_down)
+
+    def get_events(self, event_type=None):
+        """Gets the events since the end of the last tick.
+
+        Args:
+            event_type (str): The type of the events to get, or None to get events of all types.
+
+        Returns:
+            list: The events, in the order they happened.
+        """
+        if event_type is None:
+            return self.events
+        return [event for event in self.events if event.event_type == event_type]
+
+    def get_presses(self, button):
+        """Gets the presses of a mouse button since the end of the last tick.
+
+        Args:
+            button (int): The mouse button.
+
+        Returns:
+            list: The POINTER_DOWN events of the button, in the order they happened. Should not be modified.
+        """
+        return self.presses.get(button, [])
+
+    def get_key_presses(self):
+        """Gets the keys that have been pressed since the end of the last tick, including keys that have already been
+        released again.
+
+        Returns:
+            set: The names of the pressed keys.
+        """
+        return {event.key for event in self.events if event.event_type == InputEventTypes.KEY_DOWN}
+
+    def is_down(self, button):
+        """Checks whether a mouse button is currently held down.
+
+        Args:
+            button (int): The mouse button.
+
+        Returns:
+            bool: True if the button is held down, False otherwise.
+        """
+        return button in self.buttons_down
+
+    def was_down(self, button):
+        """Checks whether a mouse button has been held down at any point since the end of the last tick, including
+        presses that have already been released again.
+
+        Args:
+            button (int): The mouse button.
+
+        Returns:
+            bool: True if the button has been held down, False otherwise.
+        """
+        return button in self.buttons_down_during_tick
+
+    def consume_text(self):
+        """Gets the text that has been typed since the end of the last tick, and marks it as consumed so that it is
+        only written to one input field.
+
+        Returns:
+            str: The typed text, or an empty string if there is none.
+        """
+        text = "".join(self.pending_text)
+        self.pending_text = []
+        return text
+
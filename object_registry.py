@@ -0,0 +1,94 @@
+import heapq
+
+
+class ObjectRegistry:
+    """An index of objects by name and by type, used to find objects without searching through lists.
+
+    Objects are kept in the order they were added, both for each name and for each type. Each object is given a
+    sequence number when it is added, so that objects of several types can be merged in the order they were added.
+
+    Attributes:
+        objects_by_name (dict): Maps each name to the list of objects with that name.
+        objects_by_type (dict): Maps each type to the list of objects of exactly that type.
+        sequence_numbers (dict): Maps each object to the order in which it was added.
+        next_sequence_number (int): The sequence number given to the next added object.
+    """
+    __slots__ = ("objects_by_name", "objects_by_type", "sequence_numbers", "next_sequence_number")
+
+    def __init__(self):
+        """Initializes an ObjectRegistry."""
+        self.objects_by_name = {}
+        self.objects_by_type = {}
+        self.sequence_numbers = {}
+        self.next_sequence_number = 0
+
+    def add(self, obj):
+        """Adds an object to the registry. Objects without a name are only indexed by type.
+
+        Args:
+            obj: The object to add.
+        """
+        if hasattr(obj, "name"):
+            self.objects_by_name.setdefault(obj.name, []).append(obj)
+        self.objects_by_type.setdefault(type(obj), []).append(obj)
+        self.sequence_numbers[obj] = self.next_sequence_number
+        self.next_sequence_number += 1
+
+    def remove(self, obj):
+        """Removes an object from the registry.
+
+        Args:
+            obj: The object to remove.
+        """
+        if hasattr(obj, "name"):
+            remove_from_index(self.objects_by_name, obj.name, obj)
+        remove_from_index(self.objects_by_type, type(obj), obj)
+        self.sequence_numbers.pop(obj, None)
+
+    def clear(self):
+        """Removes all objects from the registry."""
+        self.objects_by_name = {}
+        self.objects_by_type = {}
+        self.sequence_numbers = {}
+
+    def get_by_name(self, name):
+        """Gets the objects with a specific name.
+
+        Args:
+            name (str): The name of the objects.
+
+        Returns:
+            list: The objects with the name, in the order they were added. Should not be modified.
+        """
+        return self.objects_by_name.get(name, [])
+
+    def get_by_type(self, match_type):
+        """Gets the objects of a specific type, including objects of its subclasses.
+
+        Args:
+            match_type (type): The type of the objects.
+
+        Returns:
+            list: The objects of the type, in the order they were added.
+        """
+        matching_lists = [objects for object_type, objects in self.objects_by_type.items()
+                          if issubclass(object_type, match_type)]
+        if len(matching_lists) == 1:
+            return list(matching_lists[0])
+        return list(heapq.merge(*matching_lists, key=self.sequence_numbers.__getitem__))
+
+
+def remove_from_index(index, key, obj):
+    """Removes an object from the list stored under a key in an index, dropping the key if the list becomes empty.
+
+    Args:
+        index (dict): The index, mapping keys to lists of objects.
+        key: The key the object is stored under.
+        obj: The object to remove.
+    """
+    objects = index.get(key)
+    if objects is None or obj not in objects:
+        return
+    objects.remove(obj)
+    if not objects:
+        del index[key]
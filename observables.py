@@ -0,0 +1,57 @@
+class ObservableValue:
+    """A value that notifies its observers whenever it changes.
+
+    Observers are callables taking the new value as their only argument. Since observables may be part of a saved
+    game state, observers should be bound methods or module level functions, so that they can be pickled.
+
+    Attributes:
+        value: The current value.
+        observers (list): The callables that are notified when the value changes.
+    """
+
+    def __init__(self, value=None):
+        """Initializes an ObservableValue.
+
+        Args:
+            value: The initial value.
+        """
+        self.value = value
+        self.observers = []
+
+    def get_value(self):
+        """Gets the current value.
+
+        Returns:
+            The current value.
+        """
+        return self.value
+
+    def set_value(self, value):
+        """Sets the value, notifying the observers if it differs from the current value.
+
+        Args:
+            value: The new value.
+        """
+        if value == self.value:
+            return
+        self.value = value
+        for observer in self.observers.copy():
+            observer(value)
+
+    def add_observer(self, observer):
+        """Adds an observer that is notified whenever the value changes.
+
+        Args:
+            observer (callable): The observer, taking the new value as its only argument.
+        """
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Removes an observer.
+
+        Args:
+            observer (callable): The observer to remove.
+        """
+        if observer in self.observers:
+            self.observers.remove(observer)
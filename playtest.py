@@ -1,21 +1,75 @@
 #!/usr/bin/env python3
+import argparse
+import os
+import time
+
+
+def parse_arguments():
+    """Parses the command line arguments of the program.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="A tool for playtesting Yu-Gi-Oh!")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without a display and without limiting the frame rate. Can also be enabled by "
+                             "setting the environment variable PLAYTEST_HEADLESS=1.")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="Stop after the given number of ticks, and print the number of ticks per second.")
+    parser.add_argument("--dump-frames", metavar="DIRECTORY", default=None,
+                        help="Save every frame as a PNG file in the given directory.")
+    parser.add_argument("--deck", default=None,
+                        help="Start playtesting the deck with the given name directly, instead of showing the menu.")
+    return parser.parse_args()
+
+
+# The game engine creates the window when it is imported, so headless mode has to be selected before that.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    if arguments.headless:
+        os.environ["PLAYTEST_HEADLESS"] = "1"
+
 from Scenes import main_menu_scene
 import game_engine
 from game_engine import environment
 from constants import FPS
 import file_operations as file_op
-import os
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 import pygame
 
 
+def get_first_scene(deck_name=None):
+    """Gets the scene the program starts in.
+
+    Args:
+        deck_name (str or None): The name of a deck to start playtesting directly, or None to start in the main menu.
+
+    Returns:
+        game_engine.Scene: The first scene.
+    """
+    if deck_name is None:
+        return main_menu_scene.MainMenuScene()
+
+    from decks import DECKS
+    from Scenes import playtesting_scene
+    for deck in DECKS:
+        if deck.name == deck_name:
+            return playtesting_scene.PlaytestingScene(deck)
+    raise ValueError(f"There is no deck named {deck_name}.")
+
+
 if __name__ == "__main__":
     pygame.init()
     pygame.display.set_caption("A tool for playtesting Yu-Gi-Oh!")
     file_op.load_all_images()
-    game_engine.schedule_scene_change(main_menu_scene.MainMenuScene())
+    game_engine.schedule_scene_change(get_first_scene(arguments.deck))
+    if arguments.dump_frames is not None:
+        os.makedirs(arguments.dump_frames, exist_ok=True)
+
     running = True
+    tick = 0
+    start_time = time.perf_counter()
     while running:
         running = environment.handle_events()
         game_engine.start_tick()
@@ -25,5 +79,21 @@ if __name__ == "__main__":
 
         game_engine.end_tick()
 
+        if arguments.dump_frames is not None:
+            environment.save_frame(os.path.join(arguments.dump_frames, f"frame_{tick:05d}.png"))
+        tick += 1
+        if arguments.ticks is not None and tick >= arguments.ticks:
+            running = False
+
+        if environment.headless:
+            environment.clock.tick()
+            continue
+
+        if game_engine.is_idle():
+            environment.wait_for_events(game_engine.get_idle_wait_time())
         environment.clock.tick(FPS)
+
+    if arguments.ticks is not None:
+        print(f"{tick} ticks in {time.perf_counter() - start_time:.2f} s "
+              f"({tick / (time.perf_counter() - start_time):.1f} ticks/s)")
     pygame.quit()
@@ -0,0 +1,166 @@
+from constants import *
+import os
+import game_engine
+
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+import pygame
+
+
+class Primitive:
+    """A lightweight drawing primitive, such as a rect outline, a filled rect or a line.
+
+    Primitives are not GameObjects. Instead, they are emitted by displayable objects through their draw list, and are
+    drawn by the scene directly on top of the surface of the object that emitted them. The geometry of a primitive
+    is given relative to the rect of that object.
+
+    Attributes:
+        color (tuple): The color of the primitive.
+        alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
+    """
+
+    def __init__(self, color=BLACK, alpha=255):
+        """Initializes a Primitive.
+
+        Args:
+            color (tuple): The color of the primitive.
+            alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
+        """
+        self.color = color
+        self.alpha = alpha
+
+    def draw(self, surface, rect):
+        """Draws the primitive. Implemented by child classes.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The rect of the object that emitted the primitive.
+        """
+        pass
+
+
+class RectFill(Primitive):
+    """A filled rectangle.
+
+    Attributes:
+        area (pygame.Rect or None): The filled area relative to the rect of the emitting object. If None, the whole
+            rect is filled.
+    """
+
+    def __init__(self, color=BLACK, alpha=255, area=None):
+        """Initializes a RectFill.
+
+        Args:
+            color (tuple): The color of the rectangle.
+            alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
+            area (pygame.Rect or None): The filled area relative to the rect of the emitting object.
+        """
+        super().__init__(color=color, alpha=alpha)
+        self.area = area
+
+    def draw(self, surface, rect):
+        """Fills the area of the rectangle.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The rect of the object that emitted the primitive.
+        """
+        if self.area is None:
+            fill_rect(surface, rect, self.color, self.alpha)
+        else:
+            fill_rect(surface, self.area.move(rect.topleft), self.color, self.alpha)
+
+
+class RectOutline(Primitive):
+    """A rectangular outline along the inside edges of the rect of the emitting object, used for borders.
+
+    Attributes:
+        thickness (int): The thickness of the outline.
+    """
+
+    def __init__(self, color=BLACK, alpha=255, thickness=2):
+        """Initializes a RectOutline.
+
+        Args:
+            color (tuple): The color of the outline.
+            alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
+            thickness (int): The thickness of the outline.
+        """
+        super().__init__(color=color, alpha=alpha)
+        self.thickness = thickness
+
+    def get_side_rects(self, rect):
+        """Gets the four non-overlapping rects that make up the outline.
+
+        Args:
+            rect (pygame.Rect): The rect of the object that emitted the primitive.
+
+        Returns:
+            list: The top, bottom, left and right rects of the outline.
+        """
+        top_rect = pygame.Rect(rect.x, rect.y, rect.width, self.thickness)
+        bottom_rect = pygame.Rect(rect.x, rect.y + rect.height - self.thickness, rect.width, self.thickness)
+        left_rect = pygame.Rect(rect.x, rect.y + self.thickness, self.thickness, rect.height - 2 * self.thickness)
+        right_rect = pygame.Rect(rect.x + rect.width - self.thickness, rect.y + self.thickness, self.thickness,
+                                 rect.height - 2 * self.thickness)
+        return [top_rect, bottom_rect, left_rect, right_rect]
+
+    def draw(self, surface, rect):
+        """Draws the outline.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The rect of the object that emitted the primitive.
+        """
+        for side_rect in self.get_side_rects(rect):
+            if side_rect.width > 0 and side_rect.height > 0:
+                fill_rect(surface, side_rect, self.color, self.alpha)
+
+
+class Line(Primitive):
+    """A straight, opaque line.
+
+    Attributes:
+        start (tuple): The start point of the line relative to the rect of the emitting object.
+        end (tuple): The end point of the line relative to the rect of the emitting object.
+        width (int): The width of the line.
+    """
+
+    def __init__(self, start, end, color=BLACK, width=1):
+        """Initializes a Line.
+
+        Args:
+            start (tuple): The start point of the line relative to the rect of the emitting object.
+            end (tuple): The end point of the line relative to the rect of the emitting object.
+            color (tuple): The color of the line.
+            width (int): The width of the line.
+        """
+        super().__init__(color=color)
+        self.start = start
+        self.end = end
+        self.width = width
+
+    def draw(self, surface, rect):
+        """Draws the line.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The rect of the object that emitted the primitive.
+        """
+        start = rect.x + self.start[0], rect.y + self.start[1]
+        end = rect.x + self.end[0], rect.y + self.end[1]
+        pygame.draw.line(surface, self.color, start, end, self.width)
+
+
+def fill_rect(surface, rect, color, alpha):
+    """Fills a rect with a color, blending it with the surface if it is translucent.
+
+    Args:
+        surface (pygame.Surface): The surface to fill.
+        rect (pygame.Rect): The area to fill.
+        color (tuple): The color to fill the area with.
+        alpha (int): The alpha value, ranging from 0 (transparent) to 255 (opaque).
+    """
+    if alpha == 255:
+        surface.fill(color, rect)
+    else:
+        surface.blit(game_engine.get_surface_manager().fetch_overlay_surface(rect.size, color, alpha), rect)
@@ -0,0 +1,233 @@
+import heapq
+import time
+import types
+from constants import *
+
+
+class TaskPhases:
+    START_OF_TICK = "start_of_tick"
+    END_OF_TICK = "end_of_tick"
+    BACKGROUND = "background"
+
+
+class TaskPriorities:
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class Task:
+    """A function scheduled to be executed by a Scheduler.
+
+    A function that returns a generator is treated as a job that is spread across several runs: the generator is
+    advanced one step every time the task is run, until it is exhausted.
+
+    Attributes:
+        function (callable): The function to be executed.
+        arguments: The arguments for the function, as a list of positional arguments or a dict of keyword arguments.
+        phase (str): The phase of the tick the task is executed in, one of TaskPhases.
+        priority (int): The priority of the task, one of TaskPriorities. Tasks with lower values are executed first.
+        due_time (float): The time, as given by time.perf_counter, from which the task may be executed.
+        key (str or None): The key used to coalesce duplicate requests, or None if the task is never coalesced.
+        sequence_number (int): The order in which the task was scheduled, used to execute tasks with the same priority
+            in the order they were scheduled.
+        cancelled (bool): Indicates whether the task has been cancelled or replaced, and should not be executed.
+        job (generator or None): The generator of a task that is spread across several runs, once it has started.
+    """
+    __slots__ = ("function", "arguments", "phase", "priority", "due_time", "key", "sequence_number", "cancelled",
+                 "job")
+
+    def __init__(self, function, arguments, phase, priority, due_time, key, sequence_number):
+        """Initializes a Task.
+
+        Args:
+            function (callable): The function to be executed.
+            arguments: The arguments for the function, as a list or a dict.
+            phase (str): The phase of the tick the task is executed in.
+            priority (int): The priority of the task.
+            due_time (float): The time from which the task may be executed.
+            key (str or None): The key used to coalesce duplicate requests.
+            sequence_number (int): The order in which the task was scheduled.
+        """
+        self.function = function
+        self.arguments = arguments
+        self.phase = phase
+        self.priority = priority
+        self.due_time = due_time
+        self.key = key
+        self.sequence_number = sequence_number
+        self.cancelled = False
+        self.job = None
+
+    def __lt__(self, other):
+        return (self.priority, self.sequence_number) < (other.priority, other.sequence_number)
+
+    def run(self):
+        """Executes the function of the task, or advances its job by one step.
+
+        Returns:
+            bool: True if the task is finished, False if its job has steps left.
+        """
+        if self.job is None:
+            if isinstance(self.arguments, dict):
+                result = self.function(**self.arguments)
+            else:
+                result = self.function(*self.arguments)
+            if not isinstance(result, types.GeneratorType):
+                return True
+            self.job = result
+
+        try:
+            next(self.job)
+        except StopIteration:
+            return True
+        return False
+
+
+class Scheduler:
+    """Stores the functions to be executed at the start and end of each tick, and jobs to be executed in the time left
+    over at the end of each tick.
+
+    Tasks can be delayed, are executed in order of priority, and can be given a key so that scheduling a task with the
+    same key as a pending task replaces the pending task instead of executing both. Background tasks are executed
+    within a time budget per tick, so that expensive jobs can be spread across several ticks without causing a spike in
+    the duration of a single tick.
+
+    Attributes:
+        ready_tasks (dict): Maps each phase to a heap of the tasks that are due, ordered by priority.
+        delayed_tasks (list): A heap of (due_time, sequence_number, task) for the tasks that are not due yet.
+        keyed_tasks (dict): Maps each key to the pending task scheduled with it.
+        sequence_number (int): The sequence number given to the next scheduled task.
+        time_budget (float): The time, in seconds, that background tasks may use per tick.
+    """
+
+    def __init__(self, time_budget=task_time_budget):
+        """Initializes a Scheduler.
+
+        Args:
+            time_budget (float): The time, in seconds, that background tasks may use per tick.
+        """
+        self.ready_tasks = {phase: [] for phase in (TaskPhases.START_OF_TICK, TaskPhases.END_OF_TICK,
+                                                    TaskPhases.BACKGROUND)}
+        self.delayed_tasks = []
+        self.keyed_tasks = {}
+        self.sequence_number = 0
+        self.time_budget = time_budget
+
+    def schedule(self, function, arguments=None, phase=TaskPhases.START_OF_TICK, priority=TaskPriorities.NORMAL,
+                 delay=0, key=None):
+        """Schedules a function to be executed.
+
+        Args:
+            function (callable): The function to be executed. If it returns a generator, the generator is advanced one
+                step each time the task is run.
+            arguments: The arguments for the function, as a list of positional arguments or a dict of keyword
+                arguments.
+            phase (str): The phase of the tick the function is executed in, one of TaskPhases.
+            priority (int): The priority of the task, one of TaskPriorities.
+            delay (float): The time, in seconds, to wait before the function may be executed.
+            key (str or None): If given, a pending task scheduled with the same key is replaced by this one.
+
+        Returns:
+            Task: The scheduled task.
+        """
+        if arguments is None:
+            arguments = []
+        if key is not None:
+            self.cancel(key)
+
+        task = Task(function, arguments, phase, priority, time.perf_counter() + delay, key, self.sequence_number)
+        self.sequence_number += 1
+        if key is not None:
+            self.keyed_tasks[key] = task
+
+        if delay > 0:
+            heapq.heappush(self.delayed_tasks, (task.due_time, task.sequence_number, task))
+        else:
+            heapq.heappush(self.ready_tasks[phase], task)
+        return task
+
+    def cancel(self, key):
+        """Cancels the pending task scheduled with a key, if there is one.
+
+        Args:
+            key (str): The key of the task.
+        """
+        task = self.keyed_tasks.pop(key, None)
+        if task is not None:
+            task.cancelled = True
+
+    def release_due_tasks(self):
+        """Moves the delayed tasks that have become due to the tasks that are ready to be executed."""
+        now = time.perf_counter()
+        while self.delayed_tasks and self.delayed_tasks[0][0] <= now:
+            _, _, task = heapq.heappop(self.delayed_tasks)
+            if not task.cancelled:
+                heapq.heappush(self.ready_tasks[task.phase], task)
+
+    def run_phase(self, phase):
+        """Executes the due tasks of a phase, in order of priority. Tasks scheduled while the phase is executed are
+        executed the next time the phase is run. Jobs are advanced by one step.
+
+        Args:
+            phase (str): The phase to run, one of TaskPhases.
+        """
+        self.release_due_tasks()
+        tasks = self.ready_tasks[phase]
+        self.ready_tasks[phase] = []
+        while tasks:
+            task = heapq.heappop(tasks)
+            if task.cancelled:
+                continue
+            if task.run():
+                self.finish(task)
+            else:
+                heapq.heappush(self.ready_tasks[phase], task)
+
+    def run_background_tasks(self):
+        """Executes the due background tasks, in order of priority, until the time budget of the tick is spent. At
+        least one step is executed per tick, so that background tasks always make progress."""
+        self.release_due_tasks()
+        tasks = self.ready_tasks[TaskPhases.BACKGROUND]
+        start_time = time.perf_counter()
+        while tasks:
+            task = heapq.heappop(tasks)
+            if task.cancelled:
+                continue
+            if task.run():
+                self.finish(task)
+            else:
+                heapq.heappush(tasks, task)
+            if time.perf_counter() - start_time >= self.time_budget:
+                return
+
+    def finish(self, task):
+        """Forgets the key of a task that has been executed.
+
+        Args:
+            task (Task): The finished task.
+        """
+        if task.key is not None and self.keyed_tasks.get(task.key) is task:
+            del self.keyed_tasks[task.key]
+
+    def has_ready_tasks(self):
+        """Checks whether any task is due to be executed.
+
+        Returns:
+            bool: True if a task is due, False otherwise.
+        """
+        self.release_due_tasks()
+        return any(not task.cancelled for tasks in self.ready_tasks.values() for task in tasks)
+
+    def get_time_until_next_task(self):
+        """Gets the time until the next delayed task becomes due. Cancelled tasks at the top of the delayed tasks are
+        discarded.
+
+        Returns:
+            float or None: The time in seconds, or None if there are no delayed tasks.
+        """
+        while self.delayed_tasks and self.delayed_tasks[0][2].cancelled:
+            heapq.heappop(self.delayed_tasks)
+        if not self.delayed_tasks:
+            return None
+        return max(0.0, self.delayed_tasks[0][0] - time.perf_counter())
@@ -0,0 +1,172 @@
+from constants import *
+
+
+class SpatialGrid:
+    """A uniform grid over the rects of game objects, used to quickly find the objects that might overlap a given rect.
+
+    Objects in the grid keep a reference to it in their spatial_index attribute, and are expected to call update
+    whenever their rect changes, so that the grid never has to be rebuilt from scratch.
+
+    Attributes:
+        cell_size (int): The width and height of each cell, in pixels.
+        cells (dict): Maps the (column, row) of each non-empty cell to the set of objects overlapping it.
+        object_cells (dict): Maps each object in the grid to the range of cells it overlaps, as
+            (first_column, first_row, last_column, last_row).
+        object_rects (dict): Maps each object in the grid to its rect, as (x, y, width, height), when it was last
+            inserted or updated.
+        version (int): A counter that is increased whenever an object is added, removed or changes its rect, so that
+            results derived from the grid can tell when they are outdated.
+    """
+
+    def __init__(self, cell_size=spatial_index_cell_size):
+        """Initializes a SpatialGrid.
+
+        Args:
+            cell_size (int): The width and height of each cell, in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.object_cells = {}
+        self.object_rects = {}
+        self.version = 0
+
+    def get_cell_range(self, rect):
+        """Gets the range of cells overlapped by a rect. Empty rects are considered to overlap the cell containing their
+        top left corner.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            tuple: The range of cells, as (first_column, first_row, last_column, last_row).
+        """
+        first_column, first_row = rect.x // self.cell_size, rect.y // self.cell_size
+        last_column = max(rect.right - 1, rect.x) // self.cell_size
+        last_row = max(rect.bottom - 1, rect.y) // self.cell_size
+        return first_column, first_row, last_column, last_row
+
+    def insert(self, obj):
+        """Adds an object to the grid. Objects without a rect are ignored.
+
+        Args:
+            obj: The object to add.
+        """
+        if obj in self.object_cells or not hasattr(obj, "get_rect"):
+            return
+        cell_range = self.get_cell_range(obj.get_rect())
+        self.add_to_cells(obj, cell_range)
+        self.object_cells[obj] = cell_range
+        self.object_rects[obj] = tuple(obj.get_rect())
+        self.version += 1
+        obj.spatial_index = self
+
+    def remove(self, obj):
+        """Removes an object from the grid.
+
+        Args:
+            obj: The object to remove.
+        """
+        cell_range = self.object_cells.pop(obj, None)
+        if cell_range is None:
+            return
+        self.remove_from_cells(obj, cell_range)
+        del self.object_rects[obj]
+        self.version += 1
+        if getattr(obj, "spatial_index", None) is self:
+            obj.spatial_index = None
+
+    def update(self, obj):
+        """Moves an object to the cells overlapped by its current rect.
+
+        Args:
+            obj: The object whose rect has changed.
+        """
+        old_cell_range = self.object_cells.get(obj)
+        if old_cell_range is None:
+            return
+        rect = tuple(obj.get_rect())
+        if rect == self.object_rects[obj]:
+            return
+        self.object_rects[obj] = rect
+        self.version += 1
+
+        new_cell_range = self.get_cell_range(obj.get_rect())
+        if new_cell_range == old_cell_range:
+            return
+        self.remove_from_cells(obj, old_cell_range)
+        self.add_to_cells(obj, new_cell_range)
+        self.object_cells[obj] = new_cell_range
+
+    def query(self, rect):
+        """Gets the objects that might overlap a rect, namely the objects in the cells overlapped by the rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            set: The objects that might overlap the rect.
+        """
+        first_column, first_row, last_column, last_row = self.get_cell_range(rect)
+        candidates = set()
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    candidates.update(cell)
+        return candidates
+
+    def query_point(self, point):
+        """Gets the objects whose rects contain a point.
+
+        Args:
+            point (tuple): The point, as (x, y).
+
+        Returns:
+            list: The objects whose rects contain the point.
+        """
+        cell = self.cells.get((point[0] // self.cell_size, point[1] // self.cell_size))
+        if not cell:
+            return []
+        return [obj for obj in cell if obj.get_rect().collidepoint(point)]
+
+    def get_objects(self):
+        """Gets the objects in the grid.
+
+        Returns:
+            KeysView: The objects in the grid.
+        """
+        return self.object_cells.keys()
+
+    def clear(self):
+        """Removes all objects from the grid."""
+        for obj in list(self.object_cells):
+            self.remove(obj)
+
+    def add_to_cells(self, obj, cell_range):
+        """Adds an object to the cells in a range.
+
+        Args:
+            obj: The object to add.
+            cell_range (tuple): The range of cells, as (first_column, first_row, last_column, last_row).
+        """
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((column, row), set()).add(obj)
+
+    def remove_from_cells(self, obj, cell_range):
+        """Removes an object from the cells in a range, dropping cells that become empty.
+
+        Args:
+            obj: The object to remove.
+            cell_range (tuple): The range of cells, as (first_column, first_row, last_column, last_row).
+        """
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells.get((column, row))
+                if cell is None:
+                    continue
+                cell.discard(obj)
+                if not cell:
+                    del self.cells[(column, row)]
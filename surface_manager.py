@@ -1,3 +1,5 @@
+from collections import OrderedDict
+import threading
 from constants import *
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
@@ -25,7 +27,7 @@ class SurfaceHelper:
 
     def __init__(self, surface, surface_id, size=(0, 0), alpha=255, image_string="",
                  font_data=("", BLACK, 30),
-                 surface_type=SurfaceType.SURFACE):
+                 surface_type=SurfaceType.SURFACE, convert=True):
         """Initializes a SurfaceHelper instance.
 
         Args:
@@ -36,8 +38,10 @@ class SurfaceHelper:
             image_string (str): The string representation of the image (only for image surfaces).
             font_data (tuple): Tuple related to font surfaces (text, text_color, font_size).
             surface_type (str): The type of the surface (e.g., SurfaceType.IMAGE).
+            convert (bool): Whether to store a copy of the surface converted to the pixel format of the display. If
+                False, the surface is stored as it is, and should already be converted.
         """
-        self.surface = surface.convert_alpha()
+        self.surface = surface.convert_alpha() if convert else surface
         self.surface_id = surface_id
         self.size = size[0], size[1]
         self.alpha = alpha
@@ -135,6 +139,96 @@ class SurfaceHelper:
         return new_surface_helper
 
 
+class TextureAtlas:
+    """A collection of large surfaces (pages) that many small images are packed into, so that identical images can
+    share a single copy. Images are packed row by row, and are drawn by blitting the area of their region of a page.
+
+    Attributes:
+        page_size (int): The width and height of each page.
+        max_pages (int): The maximum number of pages. When all pages are full, the atlas is cleared.
+        pages (list): The pages, as pygame.Surface objects.
+        regions (dict): The packed images, keyed by an arbitrary key and given as tuples (page index, pygame.Rect).
+        cursor_x (int): The x-coordinate where the next image is packed on the current page.
+        cursor_y (int): The y-coordinate of the current row of the current page.
+        row_height (int): The height of the tallest image in the current row.
+    """
+
+    def __init__(self, page_size=atlas_page_size, max_pages=atlas_max_pages):
+        """Initializes a TextureAtlas instance.
+
+        Args:
+            page_size (int): The width and height of each page.
+            max_pages (int): The maximum number of pages.
+        """
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.pages = []
+        self.regions = {}
+        self.cursor_x = 0
+        self.cursor_y = 0
+        self.row_height = 0
+
+    def get_region(self, key):
+        """Gets the page and the area of a packed image.
+
+        Args:
+            key: The key of the image.
+
+        Returns:
+            tuple (pygame.Surface, pygame.Rect) or None: The page and the area of the image on the page, or None if
+                no image with that key has been packed.
+        """
+        if key not in self.regions:
+            return None
+        page_index, rect = self.regions[key]
+        return self.pages[page_index], rect
+
+    def add(self, key, image):
+        """Packs an image into the atlas, adding a new page if the current page is full.
+
+        Args:
+            key: The key of the image.
+            image (pygame.Surface): The image to be packed.
+
+        Returns:
+            tuple (pygame.Surface, pygame.Rect) or None: The page and the area of the image on the page, or None if
+                the image is too large to be packed.
+        """
+        width, height = image.get_size()
+        if width > self.page_size or height > self.page_size:
+            return None
+
+        if self.cursor_x + width > self.page_size:
+            self.cursor_x = 0
+            self.cursor_y += self.row_height
+            self.row_height = 0
+
+        if len(self.pages) == 0 or self.cursor_y + height > self.page_size:
+            if len(self.pages) >= self.max_pages:
+                self.clear()
+            self.pages.append(pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA))
+            self.cursor_x = 0
+            self.cursor_y = 0
+            self.row_height = 0
+
+        rect = pygame.Rect(self.cursor_x, self.cursor_y, width, height)
+        page = self.pages[-1]
+        page.fill((0, 0, 0, 0), rect)
+        page.blit(image.convert_alpha(), rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self.regions[key] = (len(self.pages) - 1, rect)
+        self.cursor_x += width
+        self.row_height = max(self.row_height, height)
+        return page, rect
+
+    def clear(self):
+        """Removes all pages and packed images."""
+        self.pages = []
+        self.regions = {}
+        self.cursor_x = 0
+        self.cursor_y = 0
+        self.row_height = 0
+
+
 class SurfaceManager:
     """A class used for handling surfaces.
 
@@ -143,6 +237,22 @@ class SurfaceManager:
         fonts (dict): Dictionary to store Pygame font objects.
         image_path_id_dict (dict): Dictionary mapping image paths to surface IDs.
         surface_objects (dict): Dictionary to store SurfaceHelper objects.
+        overlay_surfaces (dict): Pool of uniformly colored, translucent surfaces, keyed by (size, color, alpha).
+        transform_cache (OrderedDict): Least recently used cache of transformed images, keyed by
+            (source image id, size, rotation angle). The values are tuples (surface, image_string, memory_size).
+        transform_cache_keys (dict): Maps each source image id to the set of its keys in the transform cache, so that
+            the transformations of an image can be removed without searching the whole cache.
+        transform_cache_memory (int): The number of bytes currently used by the transform cache.
+        transform_cache_hits (int): The number of transformed images that have been fetched from the cache.
+        transform_cache_misses (int): The number of transformed images that have not been found in the cache.
+        text_surfaces (OrderedDict): Least recently used cache of rendered text, keyed by (text, color, font size).
+        truncated_texts (OrderedDict): Least recently used cache of truncated texts, keyed by
+            (text, font size, max width).
+        text_sizes (OrderedDict): Least recently used cache of text sizes, keyed by (text, font size).
+        atlas (TextureAtlas): Atlas of transformed images that are shared between many objects, such as card art.
+        atlas_image_ids (set): The identifiers of the source images that have transformations in the atlas.
+        image_pyramids (dict): Downscaled versions of source images, keyed by image id. Each pyramid is a list of
+            surfaces sorted by width, ending with the source image itself.
     """
 
     # TODO: Need some way to remove surfaces that are no longer used.
@@ -152,6 +262,18 @@ class SurfaceManager:
         self.fonts = {}
         self.image_path_id_dict = {}
         self.surface_objects = {}
+        self.overlay_surfaces = {}
+        self.transform_cache = OrderedDict()
+        self.transform_cache_keys = {}
+        self.transform_cache_memory = 0
+        self.transform_cache_hits = 0
+        self.transform_cache_misses = 0
+        self.text_surfaces = OrderedDict()
+        self.truncated_texts = OrderedDict()
+        self.text_sizes = OrderedDict()
+        self.atlas = TextureAtlas()
+        self.atlas_image_ids = set()
+        self.image_pyramids = {}
 
     def get_new_id(self):
         """Generates a new unique surface identifier.
@@ -165,7 +287,7 @@ class SurfaceManager:
 
     def add_surface(self, surface, surface_id=None, alpha=255, image_string="",
                     font_data=("", BLACK, 30),
-                    surface_type=SurfaceType.SURFACE):
+                    surface_type=SurfaceType.SURFACE, convert=True):
         """Adds a new surface to the manager and returns its identifier.
 
         Args:
@@ -175,6 +297,8 @@ class SurfaceManager:
             image_string (str): String representation of the surface's image data.
             font_data (tuple): Tuple containing font information (text, color, size).
             surface_type (str): The type of the surface (e.g., SurfaceType.SURFACE).
+            convert (bool): Whether to store a converted copy of the surface. If False, the surface is stored as it is,
+                and should already be converted to the pixel format of the display.
 
         Returns:
             int: The identifier of the added surface.
@@ -183,7 +307,7 @@ class SurfaceManager:
             surface_id = self.get_new_id()
         surface_object = SurfaceHelper(surface, surface_id, size=surface.get_size(), alpha=alpha,
                                        image_string=image_string,
-                                       font_data=font_data, surface_type=surface_type)
+                                       font_data=font_data, surface_type=surface_type, convert=convert)
         self.surface_objects[surface_object.get_surface_id()] = surface_object
         return surface_object.get_surface_id()
 
@@ -194,6 +318,7 @@ class SurfaceManager:
             surface_id (int): The id of the surface.
         """
         del self.surface_objects[surface_id]
+        self.clear_transform_cache(surface_id)
 
     def fetch_surface(self, surface_id):
         """Returns the Pygame surface object associated with the given surface identifier.
@@ -236,6 +361,30 @@ class SurfaceManager:
         """
         return self.create_surface(width, height, alpha, -1)
 
+    def fetch_overlay_surface(self, size, color, alpha):
+        """Returns a surface filled with a translucent color, to be blitted on top of other surfaces. The surfaces
+        are pooled, so that no new surface is allocated when the same overlay is requested again.
+
+        Args:
+            size (tuple): The size of the overlay surface as a tuple (width, height).
+            color (tuple): The color of the overlay surface as a tuple (R, G, B).
+            alpha (int): The alpha value of the overlay surface (transparency).
+
+        Returns:
+            pygame.Surface: The overlay surface.
+        """
+        key = (tuple(size), tuple(color[:3]), alpha)
+        if key in self.overlay_surfaces:
+            return self.overlay_surfaces[key]
+
+        if len(self.overlay_surfaces) >= overlay_surface_pool_size:
+            del self.overlay_surfaces[next(iter(self.overlay_surfaces))]
+
+        overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+        overlay_surface.fill((*color[:3], alpha))
+        self.overlay_surfaces[key] = overlay_surface
+        return overlay_surface
+
     def restore_surface(self, surface_id):
         """Restores the surface with the given surface id.
 
@@ -310,7 +459,8 @@ class SurfaceManager:
         return image_id
 
     def set_image(self, image, image_id=None):
-        """Sets an image as a surface and returns its identifier.
+        """Sets an image as a surface and returns its identifier. If an existing image is replaced, its cached
+        transformations are removed.
 
         Args:
             image (pygame.Surface): The surface representing the image.
@@ -319,6 +469,8 @@ class SurfaceManager:
         Returns:
             int: The identifier of the set image.
         """
+        if image_id is not None:
+            self.clear_transform_cache(image_id)
         image_string = pygame.image.tostring(image, 'RGBA')
         image_id = self.add_surface(image, alpha=image.get_alpha(), surface_id=image_id,
                                     image_string=image_string,
@@ -337,7 +489,10 @@ class SurfaceManager:
         return self.fetch_surface(image_id)
 
     def transform_image(self, image_id, size, rotation_angle, new_id=None):
-        """Transforms an image by scaling and rotating it.
+        """Transforms an image by scaling and rotating it. Transformed images are cached, so that transforming the
+        same image to the same size and rotation again does not require any scaling or rotating. The cached image is
+        stored converted, and is shared with the returned surface id instead of being copied, so it must not be
+        drawn on.
 
         Args:
             image_id (int): The unique identifier of the image to be transformed.
@@ -348,17 +503,191 @@ class SurfaceManager:
         Returns:
             int: The identifier of the transformed image.
         """
-        image = self.fetch_image(image_id)
-        scaled_and_rotated_image = self._transform_surface(image, size, rotation_angle)
-        new_id = self.set_image(scaled_and_rotated_image, image_id=new_id)
+        key = (image_id, tuple(size), rotation_angle)
+        if key in self.transform_cache:
+            self.transform_cache.move_to_end(key)
+            self.transform_cache_hits += 1
+            scaled_and_rotated_image, image_string, _ = self.transform_cache[key]
+        else:
+            self.transform_cache_misses += 1
+            image = self.get_pyramid_level(image_id, size, rotation_angle)
+            scaled_and_rotated_image = self._transform_surface(image, size, rotation_angle).convert_alpha()
+            image_string = pygame.image.tostring(scaled_and_rotated_image, 'RGBA')
+            self.add_to_transform_cache(key, scaled_and_rotated_image, image_string)
+
+        new_id = self.add_surface(scaled_and_rotated_image, alpha=scaled_and_rotated_image.get_alpha(),
+                                  surface_id=new_id, image_string=image_string, surface_type=SurfaceType.IMAGE,
+                                  convert=False)
         return new_id
 
+    def add_to_transform_cache(self, key, surface, image_string):
+        """Adds a transformed image to the transform cache, evicting the least recently used images until the cache
+        fits within the memory budget. Images that are larger than the budget on their own are not cached.
+
+        Args:
+            key (tuple): The cache key (source image id, size, rotation angle).
+            surface (pygame.Surface): The transformed image.
+            image_string (str): String representation of the transformed image's data.
+        """
+        memory_size = surface.get_width() * surface.get_height() * surface.get_bytesize() + len(image_string)
+        if memory_size > transform_cache_memory_budget:
+            return
+
+        while self.transform_cache_memory + memory_size > transform_cache_memory_budget:
+            evicted_key, (_, _, evicted_memory_size) = self.transform_cache.popitem(last=False)
+            self.transform_cache_memory -= evicted_memory_size
+            evicted_keys = self.transform_cache_keys[evicted_key[0]]
+            evicted_keys.discard(evicted_key)
+            if not evicted_keys:
+                del self.transform_cache_keys[evicted_key[0]]
+
+        self.transform_cache[key] = (surface, image_string, memory_size)
+        self.transform_cache_memory += memory_size
+        self.transform_cache_keys.setdefault(key[0], set()).add(key)
+
+    def clear_transform_cache(self, image_id=None):
+        """Removes cached transformations from the transform cache and the texture atlas. Since images cannot be
+        removed from the atlas one at a time, the whole atlas is cleared if it contains the image.
+
+        Args:
+            image_id (int or None): The source image whose transformations should be removed. If None, the whole
+                cache is cleared.
+        """
+        if image_id is None or image_id in self.atlas_image_ids:
+            self.atlas.clear()
+            self.atlas_image_ids = set()
+
+        if image_id is None:
+            self.transform_cache.clear()
+            self.transform_cache_keys = {}
+            self.transform_cache_memory = 0
+            return
+
+        for key in self.transform_cache_keys.pop(image_id, ()):
+            _, _, memory_size = self.transform_cache.pop(key)
+            self.transform_cache_memory -= memory_size
+
+    def get_transform_cache_stats(self):
+        """Gets statistics about the transform cache.
+
+        Returns:
+            dict: The number of cache hits and misses, the number of cached images and the memory they use in bytes.
+        """
+        return {"hits": self.transform_cache_hits, "misses": self.transform_cache_misses,
+                "entries": len(self.transform_cache), "memory": self.transform_cache_memory}
+
+    def build_image_pyramid(self, image_id, image=None):
+        """Builds the image pyramid of an image, i.e. downscaled versions of the image with the widths in
+        image_pyramid_widths, so that the image can later be scaled to any size from a level close to that size.
+
+        Args:
+            image_id (int): The unique identifier of the image.
+            image (pygame.Surface or None): The surface of the image. If None, the surface is fetched using the id.
+
+        Returns:
+            list: The levels of the pyramid, sorted by width and ending with the image itself.
+        """
+        if image is None:
+            image = self.fetch_image(image_id)
+        width, height = image.get_size()
+        pyramid = []
+        for level_width in sorted(image_pyramid_widths):
+            if level_width >= width:
+                break
+            level_height = max(1, round(height * level_width / width))
+            pyramid.append(pygame.transform.smoothscale(image, (level_width, level_height)))
+        pyramid.append(image)
+        self.image_pyramids[image_id] = pyramid
+        return pyramid
+
+    def build_image_pyramids_in_background(self, image_ids):
+        """Builds the image pyramids of several images in a background thread. Until the pyramid of an image has
+        been built, the image is scaled from its full resolution instead.
+
+        The surfaces of the images are collected before the thread is started, so that the thread does not read
+        surface_objects while the main thread may replace it, e.g. when loading a saved game state. Images without a
+        surface are skipped. A pyramid built from an image that has since been replaced is ignored by
+        get_pyramid_level.
+
+        Args:
+            image_ids (list): The unique identifiers of the images.
+
+        Returns:
+            threading.Thread: The thread building the pyramids.
+        """
+        images = []
+        for image_id in image_ids:
+            surface_object = self.surface_objects.get(image_id)
+            if surface_object is not None and surface_object.get_surface() is not None:
+                images.append((image_id, surface_object.get_surface()))
+
+        def build_pyramids():
+            for image_id, image in images:
+                if image_id not in self.image_pyramids:
+                    self.build_image_pyramid(image_id, image)
+
+        thread = threading.Thread(target=build_pyramids, daemon=True)
+        thread.start()
+        return thread
+
+    def get_pyramid_level(self, image_id, size, rotation_angle=0):
+        """Gets the smallest level of the image pyramid of an image that is at least as large as the given size, which
+        is the cheapest surface to scale the image from. If the pyramid has not been built, or was built from an
+        image that has since been replaced, the image itself is returned.
+
+        Args:
+            image_id (int): The unique identifier of the image.
+            size (tuple): The size the image will be scaled to, as a tuple (width, height), after being rotated.
+            rotation_angle (int): The angle the image will be rotated by, in degrees, before being scaled.
+
+        Returns:
+            pygame.Surface: The pyramid level, or the image itself if no smaller level is large enough.
+        """
+        image = self.fetch_image(image_id)
+        pyramid = self.image_pyramids.get(image_id)
+        if pyramid is None or pyramid[-1] is not image:
+            return image
+
+        if rotation_angle % 90 != 0:
+            return pyramid[-1]
+        required_width = size[1] if rotation_angle % 180 == 90 else size[0]
+        for level in pyramid:
+            if level.get_width() >= required_width:
+                return level
+        return pyramid[-1]
+
+    def fetch_atlas_image(self, image_id, size, rotation_angle):
+        """Gets an image transformed by scaling and rotating it, packed into the texture atlas. Every combination of
+        image, size and rotation is only transformed and stored once, no matter how many objects display it.
+
+        Args:
+            image_id (int): The unique identifier of the image to be transformed.
+            size (tuple): The new size of the image as a tuple (width, height).
+            rotation_angle (int): The rotation angle in degrees.
+
+        Returns:
+            tuple (pygame.Surface, pygame.Rect or None): The surface containing the transformed image, and the area of
+                the surface that the image occupies (None if the image occupies the whole surface).
+        """
+        key = (image_id, tuple(size), rotation_angle)
+        region = self.atlas.get_region(key)
+        if region is not None:
+            return region
+
+        image = self._transform_surface(self.get_pyramid_level(image_id, size, rotation_angle), size, rotation_angle)
+        region = self.atlas.add(key, image)
+        self.atlas_image_ids.add(image_id)
+        if region is None:
+            return image, None
+        return region
+
     def restore_image(self, image_id):
         """Restores the image with the specified image identifier.
 
         Args:
             image_id (int): The unique identifier of the image to be restored.
         """
+        self.clear_transform_cache(image_id)
         surface_object = self.surface_objects[image_id]
         image_string = surface_object.get_image_string()
         size = surface_object.get_size()
@@ -394,25 +723,118 @@ class SurfaceManager:
 
         return font
 
-    def create_font_surface(self, text, text_color, font_size, font_surface_id=None):
-        """Creates a font surface and returns its identifier.
+    def create_font_surface(self, text, text_color, font_size, font_surface_id=None, max_width=None):
+        """Creates a font surface and returns its identifier. Rendered text is cached, and if the font surface
+        identifier already refers to the same text, color and font size, nothing is rendered at all.
 
         Args:
             text (str): The text to be rendered.
             text_color (tuple): The color of the text as a tuple (R, G, B).
             font_size (int): The size of the font.
             font_surface_id (int or None): The unique identifier for the font surface.
+            max_width (int or None): The maximum width of the rendered text. If given, the text is truncated to fit.
 
         Returns:
             int: The identifier of the font surface.
         """
-        font = self.get_font(font_size)
-        font_surface = font.render(text, True, text_color)
+        if max_width is not None:
+            text = self.truncate_text(text, font_size, max_width)
+
         font_data = (text, text_color, font_size)
+        if font_surface_id in self.surface_objects:
+            surface_object = self.surface_objects[font_surface_id]
+            if surface_object.get_font_data() == font_data and surface_object.get_surface() is not None:
+                return font_surface_id
+
+        key = (text, tuple(text_color), font_size)
+        font_surface = self._get_from_text_cache(self.text_surfaces, key)
+        if font_surface is None:
+            font_surface = self.get_font(font_size).render(text, True, text_color)
+            self._add_to_text_cache(self.text_surfaces, key, font_surface)
+
         font_surface_id = self.add_surface(font_surface, surface_id=font_surface_id, alpha=255, font_data=font_data,
                                            surface_type=SurfaceType.FONT)
         return font_surface_id
 
+    def get_text_size(self, text, font_size):
+        """Gets the size of the given text when rendered with the given font size.
+
+        Args:
+            text (str): The text to be measured.
+            font_size (int): The size of the font.
+
+        Returns:
+            tuple: The size of the rendered text as a tuple (width, height).
+        """
+        key = (text, font_size)
+        text_size = self._get_from_text_cache(self.text_sizes, key)
+        if text_size is None:
+            text_size = self.get_font(font_size).size(text)
+            self._add_to_text_cache(self.text_sizes, key, text_size)
+        return text_size
+
+    def truncate_text(self, text, font_size, max_width):
+        """Truncates the given text by removing characters from its end until it fits within the given width. The
+        length of the truncated text is found by a binary search over the widths of the prefixes of the text.
+
+        Args:
+            text (str): The text to be truncated.
+            font_size (int): The size of the font.
+            max_width (float): The maximum width of the text.
+
+        Returns:
+            str: The longest prefix of the text that fits within the given width.
+        """
+        key = (text, font_size, max_width)
+        truncated_text = self._get_from_text_cache(self.truncated_texts, key)
+        if truncated_text is not None:
+            return truncated_text
+
+        font = self.get_font(font_size)
+        if font.size(text)[0] <= max_width:
+            truncated_text = text
+        else:
+            low, high = 0, len(text) - 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if font.size(text[:middle])[0] <= max_width:
+                    low = middle
+                else:
+                    high = middle - 1
+            truncated_text = text[:low]
+
+        self._add_to_text_cache(self.truncated_texts, key, truncated_text)
+        return truncated_text
+
+    @staticmethod
+    def _get_from_text_cache(cache, key):
+        """Gets a value from one of the text caches, marking it as the most recently used.
+
+        Args:
+            cache (OrderedDict): The cache.
+            key (tuple): The key of the value.
+
+        Returns:
+            The cached value, or None if the key is not in the cache.
+        """
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+    @staticmethod
+    def _add_to_text_cache(cache, key, value):
+        """Adds a value to one of the text caches, evicting the least recently used value if the cache is full.
+
+        Args:
+            cache (OrderedDict): The cache.
+            key (tuple): The key of the value.
+            value: The value to be cached.
+        """
+        if len(cache) >= text_cache_size:
+            cache.popitem(last=False)
+        cache[key] = value
+
     def fetch_font_surface(self, font_surface_id):
         """Returns the Pygame font surface associated with the given identifier.
 
@@ -444,6 +866,7 @@ class SurfaceManager:
         self.surface_objects = loaded_game_state.surface_objects
         self.image_path_id_dict = loaded_game_state.image_path_id_dict
         self.fonts = {}
+        self.clear_transform_cache()
         for surface_id, surface_object in self.surface_objects.items():
             surface_type = surface_object.get_surface_type()
             if surface_type == SurfaceType.SURFACE:
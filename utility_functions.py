@@ -1,4 +1,5 @@
 import game_engine
+import input_events
 import sys
 
 
@@ -89,7 +90,8 @@ def find_objects_from_type(obj_list, match_type):
 
 
 def detect_external_clicks(allowed_rect_list):
-    """Detects if the mouse button (right or left) has been clicked while not on top of the allowed rects.
+    """Detects if the mouse button (right or left) has been clicked while not on top of the allowed rects, using the
+    positions the clicks of the current tick happened at.
 
     Args:
         allowed_rect_list (list): The list containing the allowed rects.
@@ -97,19 +99,13 @@ def detect_external_clicks(allowed_rect_list):
     Returns:
         bool: True if an external click was detected, False otherwise.
     """
-    mouse_click_this_tick = game_engine.environment.get_left_mouse_click_this_tick() or game_engine.environment.\
-        get_right_mouse_click_this_tick()
-
-    mouse_click_last_tick = game_engine.environment.get_left_mouse_click_last_tick() or game_engine.environment.\
-        get_right_mouse_click_last_tick()
-    if not mouse_click_this_tick or (mouse_click_this_tick and mouse_click_last_tick):
-        return False
-
-    mouse_position = game_engine.environment.get_mouse_position()
-    for rect in allowed_rect_list:
-        if rect.collidepoint(mouse_position):
-            return False
-    return True
+    input_bus = game_engine.environment.input_bus
+    clicks = (input_bus.get_presses(input_events.MouseButtons.LEFT)
+              + input_bus.get_presses(input_events.MouseButtons.RIGHT))
+    for click in clicks:
+        if not any(rect.collidepoint(click.position) for rect in allowed_rect_list):
+            return True
+    return False
 
 
 def destroy_on_external_clicks(obj, allowed_rect_list):
@@ -150,3 +146,23 @@ def calculate_midpoint(low, high):
         The midpoint of low and high.
     """
     return (high - low) / 2
+
+
+def merge_overlapping_rects(rect_list):
+    """Merges overlapping rects into their unions, so that no two rects in the resulting list overlap.
+
+    Args:
+        rect_list (list): The list of pygame.Rect objects to be merged.
+
+    Returns:
+        list: A list of non-overlapping pygame.Rect objects covering the same area as the given rects.
+    """
+    merged_rects = []
+    for rect in rect_list:
+        rect = rect.copy()
+        overlapping_index = rect.collidelist(merged_rects)
+        while overlapping_index != -1:
+            rect.union_ip(merged_rects.pop(overlapping_index))
+            overlapping_index = rect.collidelist(merged_rects)
+        merged_rects.append(rect)
+    return merged_rects